@@ -30,13 +30,17 @@ description:
 version_added: 1.0.0
 """
 
+import os
 import re
 import json
+import tempfile
+import time
 
 from ansible.errors import AnsibleConnectionFailure
 from ansible.module_utils._text import to_text
 from ansible.module_utils.common._collections_compat import Mapping
 from ansible.module_utils.connection import ConnectionError
+from ansible.module_utils.parsing.convert_bool import boolean
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import (
     NetworkConfig,
     dumps,
@@ -47,11 +51,125 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr import (
     sanitize_config,
     mask_config_blocks_from_diff,
+    summarize_commit_diff,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.timing import (
+    NULL_TIMING,
+    Timing,
 )
 from ansible.plugins.cliconf import CliconfBase
 
 
+# Commands asking for their output as JSON, `show ... | json`
+JSON_OUTPUT_RE = re.compile(r"\|\s*json\b")
+
+# Upper bound of the commands timed between start_timing and get_timing
+TIMING_MAX_COMMANDS = 10000
+
+_clock = getattr(time, "perf_counter", time.time)
+
+# Set to a true value in the environment of the persistent connection to
+# stream the progress of every edit_config to a JSONL file by default
+EDIT_PROGRESS_ENV = "ANSIBLE_IOSXR_EDIT_PROGRESS"
+# Number of candidate lines sent between two progress records
+PROGRESS_CHUNK_LINES = 100
+
+
+class EditProgress(object):
+    """ Progress of an edit_config push streamed to a JSONL file
+
+    One record is written when the push starts, one for every
+    PROGRESS_CHUNK_LINES lines sent, one for a line the device rejects
+    and one when it is done. Only the counters of the summary are kept
+    in memory, whatever the size of the candidate.
+    """
+
+    def __init__(self, path, total):
+        self.path = path
+        self.total = total
+        self.sent = 0
+        self.received = 0
+        self.failed = None
+        self._start = _clock()
+        self._fd = open(path, "w")
+        try:
+            self._write("start", total=total)
+        except Exception:
+            self._fd.close()
+            raise
+
+    def _write(self, event, **record):
+        record["event"] = event
+        record["time"] = time.time()
+        self._fd.write(json.dumps(record) + "\n")
+        self._fd.flush()
+
+    def sent_line(self, response):
+        self.sent += 1
+        self.received += len(response) if response else 0
+        if self.sent % PROGRESS_CHUNK_LINES == 0:
+            self._write("chunk", **self.summary())
+
+    def error(self, command, exc):
+        self.failed = {
+            "line": self.sent + 1,
+            "command": to_text(command, errors="surrogate_or_strict"),
+            "error": to_text(exc, errors="surrogate_then_replace"),
+        }
+        self._write("error", **self.failed)
+
+    def close(self, event="done"):
+        try:
+            self._write(event, **self.summary())
+        finally:
+            self._fd.close()
+
+    def summary(self):
+        summary = {
+            "path": self.path,
+            "total": self.total,
+            "sent": self.sent,
+            "bytes": self.received,
+            "elapsed": round(_clock() - self._start, 6),
+        }
+        if self.failed:
+            summary["failed"] = self.failed
+        return summary
+
+
 class Cliconf(CliconfBase):
+    def __init__(self, *args, **kwargs):
+        super(Cliconf, self).__init__(*args, **kwargs)
+        self._timing = None
+        self._capabilities = None
+
+    def start_timing(self):
+        """ Start recording the time spent per edit_config phase and per
+        command sent to the device, until get_timing is called
+        """
+        self._timing = Timing(max_commands=TIMING_MAX_COMMANDS)
+
+    def get_timing(self):
+        """ Stop recording and return the timings recorded since
+        start_timing
+        """
+        timing, self._timing = self._timing, None
+        if timing is None:
+            return {}
+        return timing.to_dict()
+
+    def send_command(self, command=None, **kwargs):
+        if self._timing is None:
+            return super(Cliconf, self).send_command(command, **kwargs)
+        start = _clock()
+        resp = super(Cliconf, self).send_command(command, **kwargs)
+        self._timing.command(
+            to_text(command, errors="surrogate_or_strict"),
+            _clock() - start,
+            len(resp) if resp else 0,
+        )
+        return resp
+
     def get_device_info(self):
         device_info = {}
 
@@ -127,7 +245,22 @@ class Cliconf(CliconfBase):
         replace=None,
         comment=None,
         label=None,
+        progress=None,
+        diff=False,
     ):
+        """ Load `candidate` in a configuration session and commit it
+
+        The on-box `show commit changes diff` is only run when `diff` is
+        set. Its output is returned under `show_commit_config_diff`, or
+        only the counts of added, removed and modified lines under
+        `commit_diff_summary` when `diff` is "summary".
+
+        With `progress` set, or EDIT_PROGRESS_ENV set in the environment
+        of the persistent connection when it is None, the responses to
+        the candidate lines are not kept. The progress of the push is
+        streamed to the JSONL file named by `progress_path` instead and
+        its summary is returned under `progress`.
+        """
         operations = self.get_device_operations()
         self.check_edit_config_capability(
             operations, candidate, commit, replace, comment
@@ -136,35 +269,88 @@ class Cliconf(CliconfBase):
         resp = {}
         results = []
         requests = []
+        timing = self._timing or NULL_TIMING
 
-        self.configure(admin=admin, exclusive=exclusive)
+        with timing.phase("configure"):
+            self.configure(admin=admin, exclusive=exclusive)
 
         if replace:
             candidate = "load {0}".format(replace)
 
-        for line in to_list(candidate):
-            if not isinstance(line, Mapping):
-                line = {"command": line}
-            cmd = line["command"]
-            results.append(self.send_command(**line))
-            requests.append(cmd)
+        if progress is None:
+            progress = boolean(
+                os.environ.get(EDIT_PROGRESS_ENV, False), strict=False
+            )
+
+        with timing.phase("load"):
+            if progress:
+                resp["progress"] = self._load_streamed(to_list(candidate))
+            else:
+                for line in to_list(candidate):
+                    if not isinstance(line, Mapping):
+                        line = {"command": line}
+                    cmd = line["command"]
+                    results.append(self.send_command(**line))
+                    requests.append(cmd)
 
         # Before any commit happend, we can get a real configuration
         # diff from the device and make it available by the iosxr_config module.
         # This information can be usefull either in check mode or normal mode.
-        resp["show_commit_config_diff"] = self.get("show commit changes diff")
+        if diff:
+            with timing.phase("commit_diff"):
+                commit_diff = self.get("show commit changes diff")
+            if diff == "summary":
+                resp["commit_diff_summary"] = summarize_commit_diff(
+                    commit_diff
+                )
+            else:
+                resp["show_commit_config_diff"] = commit_diff
 
         if commit:
-            self.commit(comment=comment, label=label, replace=replace)
+            with timing.phase("commit"):
+                self.commit(comment=comment, label=label, replace=replace)
         else:
-            self.discard_changes()
+            with timing.phase("discard"):
+                self.discard_changes()
 
-        self.abort(admin=admin)
+        with timing.phase("abort"):
+            self.abort(admin=admin)
 
-        resp["request"] = requests
-        resp["response"] = results
+        if not progress:
+            resp["request"] = requests
+            resp["response"] = results
         return resp
 
+    def progress_path(self):
+        """ Path of the JSONL file edit_config streams its progress to,
+        next to the socket of the persistent connection
+        """
+        socket_path = getattr(self._connection, "socket_path", None)
+        if socket_path:
+            directory, name = os.path.split(socket_path)
+        else:
+            directory, name = tempfile.gettempdir(), str(os.getpid())
+        return os.path.join(directory, "iosxr_edit_config_%s.jsonl" % name)
+
+    def _load_streamed(self, lines):
+        progress = EditProgress(self.progress_path(), len(lines))
+        event = "failed"
+        try:
+            for line in lines:
+                if not isinstance(line, Mapping):
+                    line = {"command": line}
+                try:
+                    progress.sent_line(self.send_command(**line))
+                except AnsibleConnectionFailure as exc:
+                    progress.error(line["command"], exc)
+                    raise
+            event = "done"
+        finally:
+            # always leave a last record and never leak the file in the
+            # persistent connection, whatever went wrong
+            progress.close(event)
+        return progress.summary()
+
     def get_diff(
         self,
         candidate=None,
@@ -273,6 +459,8 @@ class Cliconf(CliconfBase):
             cmd_obj["prompt"] = "(C|c)onfirm"
             cmd_obj["answer"] = "y"
 
+        # the device info, such as the hostname, may change
+        self._capabilities = None
         self.send_command(**cmd_obj)
 
     def run_commands(self, commands=None, check_rc=True):
@@ -306,10 +494,15 @@ class Cliconf(CliconfBase):
                         % (cmd, to_text(out))
                     )
 
-                try:
-                    out = json.loads(out)
-                except ValueError:
-                    pass
+                # only JSON documents are decoded, `| xml` output is
+                # returned as text and parsed on the module side
+                if out[:1] in ("{", "[") or JSON_OUTPUT_RE.search(
+                    to_text(cmd["command"])
+                ):
+                    try:
+                        out = json.loads(out)
+                    except ValueError:
+                        pass
 
                 responses.append(out)
         return responses
@@ -332,6 +525,7 @@ class Cliconf(CliconfBase):
             "supports_replace": True,
             "supports_admin": True,
             "supports_commit_label": True,
+            "supports_commit_diff": True,
         }
 
     def get_option_values(self):
@@ -342,7 +536,20 @@ class Cliconf(CliconfBase):
             "output": [],
         }
 
+    def _session(self):
+        """ The SSH shell of the connection, to tell a new session apart
+        """
+        return getattr(self._connection, "_ssh_shell", None)
+
     def get_capabilities(self):
+        """ The capabilities are computed on the first call of a session
+        and kept in the persistent connection until the next commit
+        """
+        if self._capabilities is not None:
+            session, capabilities = self._capabilities
+            if session is not None and session is self._session():
+                return capabilities
+
         result = super(Cliconf, self).get_capabilities()
         result["rpc"] += [
             "commit",
@@ -350,10 +557,15 @@ class Cliconf(CliconfBase):
             "get_diff",
             "configure",
             "exit",
+            "start_timing",
+            "get_timing",
+            "progress_path",
         ]
         result["device_operations"] = self.get_device_operations()
         result.update(self.get_option_values())
-        return json.dumps(result)
+        capabilities = json.dumps(result)
+        self._capabilities = (self._session(), capabilities)
+        return capabilities
 
     def set_cli_prompt_context(self):
         """
@@ -27,13 +27,9 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.ut
     get_interface_type,
     dict_to_set,
 )
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
-    remove_command_from_config_list,
-    add_command_to_config_list,
-)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
     filter_dict_having_none_value,
-    remove_duplicate_interface,
+    CommandBuilder,
 )
 
 
@@ -163,7 +159,7 @@ class Interfaces(ConfigBase):
         :returns: the commands necessary to migrate the current configuration
                   to the desired configuration
         """
-        commands = []
+        commands = CommandBuilder()
 
         for interface in want:
             for each in have:
@@ -176,12 +172,10 @@ class Interfaces(ConfigBase):
                 continue
             have_dict = filter_dict_having_none_value(interface, each)
             want = dict()
-            commands.extend(self._clear_config(want, have_dict))
-            commands.extend(self._set_config(interface, each))
-        # Remove the duplicate interface call
-        commands = remove_duplicate_interface(commands)
+            self._clear_config(want, have_dict, commands)
+            self._set_config(interface, each, commands)
 
-        return commands
+        return commands.to_list()
 
     def _state_overridden(self, want, have):
         """ The command generator when state is overridden
@@ -189,7 +183,7 @@ class Interfaces(ConfigBase):
         :returns: the commands necessary to migrate the current configuration
                   to the desired configuration
         """
-        commands = []
+        commands = CommandBuilder()
 
         for each in have:
             for interface in want:
@@ -202,16 +196,14 @@ class Interfaces(ConfigBase):
                 # We didn't find a matching desired state, which means we can
                 # pretend we received an empty desired state.
                 interface = dict(name=each["name"])
-                commands.extend(self._clear_config(interface, each))
+                self._clear_config(interface, each, commands)
                 continue
             have_dict = filter_dict_having_none_value(interface, each)
             want = dict()
-            commands.extend(self._clear_config(want, have_dict))
-            commands.extend(self._set_config(interface, each))
-        # Remove the duplicate interface call
-        commands = remove_duplicate_interface(commands)
+            self._clear_config(want, have_dict, commands)
+            self._set_config(interface, each, commands)
 
-        return commands
+        return commands.to_list()
 
     def _state_merged(self, want, have):
         """ The command generator when state is merged
@@ -219,11 +211,11 @@ class Interfaces(ConfigBase):
         :returns: the commands necessary to merge the provided into
                   the current configuration
         """
-        commands = []
+        commands = CommandBuilder()
 
         for interface in want:
             if self.state == "rendered":
-                commands.extend(self._set_config(interface, dict()))
+                self._set_config(interface, dict(), commands)
             else:
                 for each in have:
                     if (
@@ -233,9 +225,9 @@ class Interfaces(ConfigBase):
                         break
                 else:
                     continue
-                commands.extend(self._set_config(interface, each))
+                self._set_config(interface, each, commands)
 
-        return commands
+        return commands.to_list()
 
     def _state_deleted(self, want, have):
         """ The command generator when state is deleted
@@ -243,7 +235,7 @@ class Interfaces(ConfigBase):
         :returns: the commands necessary to remove the current configuration
                   of the provided objects
         """
-        commands = []
+        commands = CommandBuilder()
 
         if want:
             for interface in want:
@@ -256,17 +248,16 @@ class Interfaces(ConfigBase):
                 else:
                     continue
                 interface = dict(name=interface["name"])
-                commands.extend(self._clear_config(interface, each))
+                self._clear_config(interface, each, commands)
         else:
             for each in have:
                 want = dict()
-                commands.extend(self._clear_config(want, each))
+                self._clear_config(want, each, commands)
 
-        return commands
+        return commands.to_list()
 
-    def _set_config(self, want, have):
+    def _set_config(self, want, have, commands):
         # Set the interface config based on the want and have config
-        commands = []
         interface = "interface " + want["name"]
 
         # Get the diff b/w want and have
@@ -279,18 +270,14 @@ class Interfaces(ConfigBase):
             for item in self.params:
                 if diff.get(item):
                     cmd = item + " " + str(want.get(item))
-                    add_command_to_config_list(interface, cmd, commands)
+                    commands.add(interface, cmd)
             if diff.get("enabled"):
-                add_command_to_config_list(interface, "no shutdown", commands)
+                commands.add(interface, "no shutdown")
             elif diff.get("enabled") is False:
-                add_command_to_config_list(interface, "shutdown", commands)
-
-        return commands
+                commands.add(interface, "shutdown")
 
-    def _clear_config(self, want, have):
+    def _clear_config(self, want, have, commands):
         # Delete the interface config based on the want and have config
-        commands = []
-
         if want.get("name"):
             interface_type = get_interface_type(want["name"])
             interface = "interface " + want["name"]
@@ -301,12 +288,12 @@ class Interfaces(ConfigBase):
         if have.get("description") and want.get("description") != have.get(
             "description"
         ):
-            remove_command_from_config_list(interface, "description", commands)
+            commands.remove(interface, "description")
         if not have.get("enabled") and want.get("enabled") != have.get(
             "enabled"
         ):
             # if enable is False set enable as True which is the default behavior
-            remove_command_from_config_list(interface, "shutdown", commands)
+            commands.remove(interface, "shutdown")
 
         if interface_type.lower() == "gigabitethernet":
             if (
@@ -314,14 +301,12 @@ class Interfaces(ConfigBase):
                 and have.get("speed") != "auto"
                 and want.get("speed") != have.get("speed")
             ):
-                remove_command_from_config_list(interface, "speed", commands)
+                commands.remove(interface, "speed")
             if (
                 have.get("duplex")
                 and have.get("duplex") != "auto"
                 and want.get("duplex") != have.get("duplex")
             ):
-                remove_command_from_config_list(interface, "duplex", commands)
+                commands.remove(interface, "duplex")
             if have.get("mtu") and want.get("mtu") != have.get("mtu"):
-                remove_command_from_config_list(interface, "mtu", commands)
-
-        return commands
+                commands.remove(interface, "mtu")
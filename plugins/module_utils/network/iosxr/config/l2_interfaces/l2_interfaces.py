@@ -27,13 +27,9 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.ut
     normalize_interface,
     dict_to_set,
 )
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
-    remove_command_from_config_list,
-    add_command_to_config_list,
-)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
     filter_dict_having_none_value,
-    remove_duplicate_interface,
+    CommandBuilder,
 )
 
 
@@ -162,7 +158,7 @@ class L2_Interfaces(ConfigBase):
         :returns: the commands necessary to migrate the current configuration
                   to the desired configuration
         """
-        commands = []
+        commands = CommandBuilder()
         for interface in want:
             interface["name"] = normalize_interface(interface["name"])
             for each in have:
@@ -172,16 +168,14 @@ class L2_Interfaces(ConfigBase):
                 ):
                     break
             else:
-                commands.extend(self._set_config(interface, {}, module))
+                self._set_config(interface, {}, module, commands)
                 continue
             interface = remove_empties(interface)
             have_dict = filter_dict_having_none_value(interface, each)
-            commands.extend(self._clear_config(dict(), have_dict))
-            commands.extend(self._set_config(interface, each, module))
-        # Remove the duplicate interface call
-        commands = remove_duplicate_interface(commands)
+            self._clear_config(dict(), have_dict, commands)
+            self._set_config(interface, each, module, commands)
 
-        return commands
+        return commands.to_list()
 
     def _state_overridden(self, want, have, module):
         """ The command generator when state is overridden
@@ -189,7 +183,7 @@ class L2_Interfaces(ConfigBase):
         :returns: the commands necessary to migrate the current configuration
                   to the desired configuration
         """
-        commands = []
+        commands = CommandBuilder()
         not_in_have = set()
         in_have = set()
         for each in have:
@@ -204,23 +198,20 @@ class L2_Interfaces(ConfigBase):
                 # We didn't find a matching desired state, which means we can
                 # pretend we received an empty desired state.
                 interface = dict(name=each["name"])
-                commands.extend(self._clear_config(interface, each))
+                self._clear_config(interface, each, commands)
                 continue
             interface = remove_empties(interface)
             have_dict = filter_dict_having_none_value(interface, each)
-            commands.extend(self._clear_config(dict(), have_dict))
-            commands.extend(self._set_config(interface, each, module))
+            self._clear_config(dict(), have_dict, commands)
+            self._set_config(interface, each, module, commands)
         # Add the want interface that's not already configured in have interface
         for each in not_in_have - in_have:
             for every in want:
                 interface = "interface {0}".format(every["name"])
                 if each and interface not in commands:
-                    commands.extend(self._set_config(every, {}, module))
+                    self._set_config(every, {}, module, commands)
 
-        # Remove the duplicate interface call
-        commands = remove_duplicate_interface(commands)
-
-        return commands
+        return commands.to_list()
 
     def _state_merged(self, want, have, module):
         """ The command generator when state is merged
@@ -228,7 +219,7 @@ class L2_Interfaces(ConfigBase):
         :returns: the commands necessary to merge the provided into
                   the current configuration
         """
-        commands = []
+        commands = CommandBuilder()
 
         for interface in want:
             interface["name"] = normalize_interface(interface["name"])
@@ -240,11 +231,11 @@ class L2_Interfaces(ConfigBase):
                 ):
                     break
             else:
-                commands.extend(self._set_config(interface, {}, module))
+                self._set_config(interface, {}, module, commands)
                 continue
-            commands.extend(self._set_config(interface, each, module))
+            self._set_config(interface, each, module, commands)
 
-        return commands
+        return commands.to_list()
 
     def _state_deleted(self, want, have):
         """ The command generator when state is deleted
@@ -252,7 +243,7 @@ class L2_Interfaces(ConfigBase):
         :returns: the commands necessary to remove the current configuration
                   of the provided objects
         """
-        commands = []
+        commands = CommandBuilder()
 
         if want:
             for interface in want:
@@ -266,17 +257,16 @@ class L2_Interfaces(ConfigBase):
                 else:
                     continue
                 interface = dict(name=interface["name"])
-                commands.extend(self._clear_config(interface, each))
+                self._clear_config(interface, each, commands)
         else:
             for each in have:
                 want = dict()
-                commands.extend(self._clear_config(want, each))
+                self._clear_config(want, each, commands)
 
-        return commands
+        return commands.to_list()
 
-    def _set_config(self, want, have, module):
+    def _set_config(self, want, have, module, commands):
         # Set the interface config based on the want and have config
-        commands = []
         interface = "interface " + want["name"]
         l2_protocol_bool = False
         # Get the diff b/w want and have
@@ -309,7 +299,7 @@ class L2_Interfaces(ConfigBase):
 
             if wants_native:
                 cmd = "dot1q native vlan {0}".format(wants_native)
-                add_command_to_config_list(interface, cmd, commands)
+                commands.add(interface, cmd)
 
             if l2transport or l2protocol:
                 for each in l2protocol:
@@ -318,10 +308,10 @@ class L2_Interfaces(ConfigBase):
                         cmd = "l2transport l2protocol {0} {1}".format(
                             list(each.keys())[0], list(each.values())[0]
                         )
-                    add_command_to_config_list(interface, cmd, commands)
+                    commands.add(interface, cmd)
                 if propagate and not have.get("propagate"):
                     cmd = "l2transport propagate remote-status"
-                    add_command_to_config_list(interface, cmd, commands)
+                    commands.add(interface, cmd)
             elif want.get("l2transport") is False and (
                 want.get("l2protocol") or want.get("propagate")
             ):
@@ -334,40 +324,25 @@ class L2_Interfaces(ConfigBase):
                 q_vlans = " ".join(map(str, want.get("q_vlan")))
                 if q_vlans != have.get("q_vlan"):
                     cmd = "dot1q vlan {0}".format(q_vlans)
-                    add_command_to_config_list(interface, cmd, commands)
-
-        return commands
+                    commands.add(interface, cmd)
 
-    def _clear_config(self, want, have):
+    def _clear_config(self, want, have, commands):
         # Delete the interface config based on the want and have config
-        commands = []
-
         if want.get("name"):
             interface = "interface " + want["name"]
         else:
             interface = "interface " + have["name"]
         if have.get("native_vlan"):
-            remove_command_from_config_list(
-                interface, "dot1q native vlan", commands
-            )
+            commands.remove(interface, "dot1q native vlan")
 
         if have.get("q_vlan"):
-            remove_command_from_config_list(
-                interface, "encapsulation dot1q", commands
-            )
+            commands.remove(interface, "encapsulation dot1q")
 
         if have.get("l2protocol") and (
             want.get("l2protocol") is None or want.get("propagate") is None
         ):
-            if "no l2transport" not in commands:
-                remove_command_from_config_list(
-                    interface, "l2transport", commands
-                )
+            commands.remove(interface, "l2transport")
         elif have.get("l2transport") and have.get("l2transport") != want.get(
             "l2transport"
         ):
-            if "no l2transport" not in commands:
-                remove_command_from_config_list(
-                    interface, "l2transport", commands
-                )
-        return commands
+            commands.remove(interface, "l2transport")
@@ -27,13 +27,9 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.ut
     normalize_interface,
     dict_to_set,
 )
-from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
-    remove_command_from_config_list,
-    add_command_to_config_list,
-)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
     filter_dict_having_none_value,
-    remove_duplicate_interface,
+    CommandBuilder,
 )
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
     validate_n_expand_ipv4,
@@ -166,7 +162,7 @@ class L3_Interfaces(ConfigBase):
         :returns: the commands necessary to migrate the current configuration
                   to the desired configuration
         """
-        commands = []
+        commands = CommandBuilder()
 
         for interface in want:
             interface["name"] = normalize_interface(interface["name"])
@@ -174,15 +170,13 @@ class L3_Interfaces(ConfigBase):
                 if each["name"] == interface["name"]:
                     break
             else:
-                commands.extend(self._set_config(interface, dict(), module))
+                self._set_config(interface, dict(), module, commands)
                 continue
             have_dict = filter_dict_having_none_value(interface, each)
-            commands.extend(self._clear_config(dict(), have_dict))
-            commands.extend(self._set_config(interface, each, module))
-        # Remove the duplicate interface call
-        commands = remove_duplicate_interface(commands)
+            self._clear_config(dict(), have_dict, commands)
+            self._set_config(interface, each, module, commands)
 
-        return commands
+        return commands.to_list()
 
     def _state_overridden(self, want, have, module):
         """ The command generator when state is overridden
@@ -190,7 +184,7 @@ class L3_Interfaces(ConfigBase):
         :returns: the commands necessary to migrate the current configuration
                   to the desired configuration
         """
-        commands = []
+        commands = CommandBuilder()
         not_in_have = set()
         in_have = set()
 
@@ -206,22 +200,19 @@ class L3_Interfaces(ConfigBase):
                 # We didn't find a matching desired state, which means we can
                 # pretend we received an empty desired state.
                 interface = dict(name=each["name"])
-                kwargs = {"want": interface, "have": each}
-                commands.extend(self._clear_config(**kwargs))
+                self._clear_config(interface, each, commands)
                 continue
             have_dict = filter_dict_having_none_value(interface, each)
-            commands.extend(self._clear_config(dict(), have_dict))
-            commands.extend(self._set_config(interface, each, module))
+            self._clear_config(dict(), have_dict, commands)
+            self._set_config(interface, each, module, commands)
         # Add the want interface that's not already configured in have interface
         for each in not_in_have - in_have:
             for every in want:
                 interface = "interface {0}".format(every["name"])
                 if each and interface not in commands:
-                    commands.extend(self._set_config(every, {}, module))
-        # Remove the duplicate interface call
-        commands = remove_duplicate_interface(commands)
+                    self._set_config(every, {}, module, commands)
 
-        return commands
+        return commands.to_list()
 
     def _state_merged(self, want, have, module):
         """ The command generator when state is merged
@@ -229,24 +220,22 @@ class L3_Interfaces(ConfigBase):
         :returns: the commands necessary to merge the provided into
                   the current configuration
         """
-        commands = []
+        commands = CommandBuilder()
 
         for interface in want:
             interface["name"] = normalize_interface(interface["name"])
             if self.state == "rendered":
-                commands.extend(self._set_config(interface, dict(), module))
+                self._set_config(interface, dict(), module, commands)
             else:
                 for each in have:
                     if each["name"] == interface["name"]:
                         break
                 else:
-                    commands.extend(
-                        self._set_config(interface, dict(), module)
-                    )
+                    self._set_config(interface, dict(), module, commands)
                     continue
-                commands.extend(self._set_config(interface, each, module))
+                self._set_config(interface, each, module, commands)
 
-        return commands
+        return commands.to_list()
 
     def _state_deleted(self, want, have):
         """ The command generator when state is deleted
@@ -254,7 +243,7 @@ class L3_Interfaces(ConfigBase):
         :returns: the commands necessary to remove the current configuration
                   of the provided objects
         """
-        commands = []
+        commands = CommandBuilder()
 
         if want:
             for interface in want:
@@ -268,13 +257,13 @@ class L3_Interfaces(ConfigBase):
                 else:
                     continue
                 interface = dict(name=interface["name"])
-                commands.extend(self._clear_config(interface, each))
+                self._clear_config(interface, each, commands)
         else:
             for each in have:
                 want = dict()
-                commands.extend(self._clear_config(want, each))
+                self._clear_config(want, each, commands)
 
-        return commands
+        return commands.to_list()
 
     def verify_diff_again(self, want, have):
         """
@@ -312,9 +301,8 @@ class L3_Interfaces(ConfigBase):
 
         return diff
 
-    def _set_config(self, want, have, module):
+    def _set_config(self, want, have, module, commands):
         # Set the interface config based on the want and have config
-        commands = []
         interface = "interface " + want["name"]
 
         # To handle L3 IPV4 configuration
@@ -325,15 +313,15 @@ class L3_Interfaces(ConfigBase):
                     each["address"] = ip_addr_want
 
         # Get the diff b/w want and have
-        want_dict = dict_to_set(want)
-        have_dict = dict_to_set(have)
+        want_dict = dict(dict_to_set(want))
+        have_dict = dict(dict_to_set(have))
 
         # To handle L3 IPV4 configuration
-        want_ipv4 = dict(want_dict).get("ipv4")
-        have_ipv4 = dict(have_dict).get("ipv4")
+        want_ipv4 = want_dict.get("ipv4")
+        have_ipv4 = have_dict.get("ipv4")
         if want_ipv4:
             if have_ipv4:
-                diff_ipv4 = set(want_ipv4) - set(dict(have_dict).get("ipv4"))
+                diff_ipv4 = set(want_ipv4) - set(have_ipv4)
                 if diff_ipv4:
                     diff_ipv4 = (
                         diff_ipv4
@@ -348,11 +336,11 @@ class L3_Interfaces(ConfigBase):
                     cmd = "ipv4 address {0}".format(ipv4_dict["address"])
                     if ipv4_dict.get("secondary"):
                         cmd += " secondary"
-                add_command_to_config_list(interface, cmd, commands)
+                commands.add(interface, cmd)
 
         # To handle L3 IPV6 configuration
-        want_ipv6 = dict(want_dict).get("ipv6")
-        have_ipv6 = dict(have_dict).get("ipv6")
+        want_ipv6 = want_dict.get("ipv6")
+        have_ipv6 = have_dict.get("ipv6")
         if want_ipv6:
             if have_ipv6:
                 diff_ipv6 = set(want_ipv6) - set(have_ipv6)
@@ -362,14 +350,11 @@ class L3_Interfaces(ConfigBase):
                 ipv6_dict = dict(each)
                 validate_ipv6(ipv6_dict.get("address"), module)
                 cmd = "ipv6 address {0}".format(ipv6_dict.get("address"))
-                add_command_to_config_list(interface, cmd, commands)
+                commands.add(interface, cmd)
 
-        return commands
-
-    def _clear_config(self, want, have):
+    def _clear_config(self, want, have, commands):
         # Delete the interface config based on the want and have config
         count = 0
-        commands = []
         if want.get("name"):
             interface = "interface " + want["name"]
         else:
@@ -383,15 +368,9 @@ class L3_Interfaces(ConfigBase):
                     cmd = "ipv4 address {0} secondary".format(
                         each.get("address")
                     )
-                    remove_command_from_config_list(interface, cmd, commands)
+                    commands.remove(interface, cmd)
                 count += 1
         if have.get("ipv4") and not (want.get("ipv4")):
-            remove_command_from_config_list(
-                interface, "ipv4 address", commands
-            )
+            commands.remove(interface, "ipv4 address")
         if have.get("ipv6") and not (want.get("ipv6")):
-            remove_command_from_config_list(
-                interface, "ipv6 address", commands
-            )
-
-        return commands
+            commands.remove(interface, "ipv6 address")
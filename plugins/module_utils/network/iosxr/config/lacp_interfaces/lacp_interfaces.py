@@ -35,8 +35,8 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 )
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
     dict_delete,
-    pad_commands,
     flatten_dict,
+    CommandBuilder,
 )
 
 
@@ -142,7 +142,7 @@ class Lacp_interfaces(ConfigBase):
         :returns: the commands necessary to migrate the current configuration
                   to the desired configuration
         """
-        commands = []
+        commands = CommandBuilder()
         state = self._module.params["state"]
 
         if (
@@ -156,22 +156,18 @@ class Lacp_interfaces(ConfigBase):
             )
 
         if state == "overridden":
-            commands.extend(Lacp_interfaces._state_overridden(want, have))
+            Lacp_interfaces._state_overridden(want, have, commands)
 
         elif state == "deleted":
             if not want:
                 for intf in have:
-                    commands.extend(
-                        Lacp_interfaces._state_deleted(
-                            {"name": intf["name"]}, intf
-                        )
+                    Lacp_interfaces._state_deleted(
+                        {"name": intf["name"]}, intf, commands
                     )
             else:
                 for item in want:
                     obj_in_have = search_obj_in_list(item["name"], have)
-                    commands.extend(
-                        Lacp_interfaces._state_deleted(item, obj_in_have)
-                    )
+                    Lacp_interfaces._state_deleted(item, obj_in_have, commands)
 
         else:
             for item in want:
@@ -179,113 +175,83 @@ class Lacp_interfaces(ConfigBase):
                 obj_in_have = search_obj_in_list(name, have)
 
                 if state in ("merged", "rendered"):
-                    commands.extend(
-                        Lacp_interfaces._state_merged(item, obj_in_have)
-                    )
+                    Lacp_interfaces._state_merged(item, obj_in_have, commands)
 
                 elif state == "replaced":
-                    commands.extend(
-                        Lacp_interfaces._state_replaced(item, obj_in_have)
+                    Lacp_interfaces._state_replaced(
+                        item, obj_in_have, commands
                     )
 
-        return commands
+        return commands.to_list()
 
     @staticmethod
-    def _state_replaced(want, have):
+    def _state_replaced(want, have, commands):
         """ The command generator when state is replaced
 
-        :rtype: A list
-        :returns: the commands necessary to migrate the current configuration
-                  to the desired configuration
+        :param commands: the CommandBuilder that receives the commands
+                         necessary to migrate the current configuration to the
+                         desired configuration
         """
-        commands = []
-        replaced_commands = []
-        merged_commands = []
-
         if have:
-            replaced_commands = Lacp_interfaces._state_deleted(want, have)
+            Lacp_interfaces._state_deleted(want, have, commands)
 
-        merged_commands = Lacp_interfaces._state_merged(want, have)
-
-        if merged_commands and replaced_commands:
-            del merged_commands[0]
-
-        commands.extend(replaced_commands)
-        commands.extend(merged_commands)
-
-        return commands
+        Lacp_interfaces._state_merged(want, have, commands)
 
     @staticmethod
-    def _state_overridden(want, have):
+    def _state_overridden(want, have, commands):
         """ The command generator when state is overridden
 
-        :rtype: A list
-        :returns: the commands necessary to migrate the current configuration
-                  to the desired configuration
+        :param commands: the CommandBuilder that receives the commands
+                         necessary to migrate the current configuration to the
+                         desired configuration
         """
-        commands = []
         for intf in have:
             intf_in_want = search_obj_in_list(intf["name"], want)
             if not intf_in_want:
-                commands.extend(
-                    Lacp_interfaces._state_deleted(
-                        {"name": intf["name"]}, intf
-                    )
+                Lacp_interfaces._state_deleted(
+                    {"name": intf["name"]}, intf, commands
                 )
 
         for intf in want:
             intf_in_have = search_obj_in_list(intf["name"], have)
-            commands.extend(
-                Lacp_interfaces._state_replaced(intf, intf_in_have)
-            )
-
-        return commands
+            Lacp_interfaces._state_replaced(intf, intf_in_have, commands)
 
     @staticmethod
-    def _state_merged(want, have):
+    def _state_merged(want, have, commands):
         """ The command generator when state is merged
 
-        :rtype: A list
-        :returns: the commands necessary to merge the provided into
-                  the current configuration
+        :param commands: the CommandBuilder that receives the commands
+                         necessary to merge the provided into the current
+                         configuration
         """
-        commands = []
-
         if not have:
             have = {"name": want["name"]}
 
+        interface = "interface " + want["name"]
         for key, value in iteritems(
             flatten_dict(remove_empties(dict_diff(have, want)))
         ):
-            commands.append(Lacp_interfaces._compute_commands(key, value))
-
-        if commands:
-            pad_commands(commands, want["name"])
-
-        return commands
+            commands.add(
+                interface, Lacp_interfaces._compute_commands(key, value)
+            )
 
     @staticmethod
-    def _state_deleted(want, have):
+    def _state_deleted(want, have, commands):
         """ The command generator when state is deleted
 
-        :rtype: A list
-        :returns: the commands necessary to remove the current configuration
-                  of the provided objects
+        :param commands: the CommandBuilder that receives the commands
+                         necessary to remove the current configuration of the
+                         provided objects
         """
-        commands = []
-
+        interface = "interface " + have["name"]
         for key, value in iteritems(
             flatten_dict(dict_delete(have, remove_empties(want)))
         ):
-            commands.append(
-                Lacp_interfaces._compute_commands(key, value, remove=True)
+            commands.add(
+                interface,
+                Lacp_interfaces._compute_commands(key, value, remove=True),
             )
 
-        if commands:
-            pad_commands(commands, have["name"])
-
-        return commands
-
     @staticmethod
     def _compute_commands(key, value, remove=False):
         if key == "churn_logging":
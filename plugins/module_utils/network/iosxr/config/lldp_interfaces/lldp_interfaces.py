@@ -31,8 +31,8 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.fa
 from ansible.module_utils.six import iteritems
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
     dict_delete,
-    pad_commands,
     flatten_dict,
+    CommandBuilder,
 )
 
 
@@ -138,7 +138,7 @@ class Lldp_interfaces(ConfigBase):
                   to the desired configuration
         """
         state = self._module.params["state"]
-        commands = []
+        commands = CommandBuilder()
         if (
             state in ("overridden", "merged", "replaced", "rendered")
             and not want
@@ -150,18 +150,16 @@ class Lldp_interfaces(ConfigBase):
             )
 
         if state == "overridden":
-            commands.extend(self._state_overridden(want, have))
+            self._state_overridden(want, have, commands)
 
         elif state == "deleted":
             if not want:
                 for intf in have:
-                    commands.extend(
-                        self._state_deleted({"name": intf["name"]}, intf)
-                    )
+                    self._state_deleted({"name": intf["name"]}, intf, commands)
             else:
                 for item in want:
                     obj_in_have = search_obj_in_list(item["name"], have)
-                    commands.extend(self._state_deleted(item, obj_in_have))
+                    self._state_deleted(item, obj_in_have, commands)
 
         else:
             for item in want:
@@ -169,98 +167,71 @@ class Lldp_interfaces(ConfigBase):
                 obj_in_have = search_obj_in_list(name, have)
 
                 if state in ("merged", "rendered"):
-                    commands.extend(self._state_merged(item, obj_in_have))
+                    self._state_merged(item, obj_in_have, commands)
 
                 elif state == "replaced":
-                    commands.extend(self._state_replaced(item, obj_in_have))
+                    self._state_replaced(item, obj_in_have, commands)
 
-        return commands
+        return commands.to_list()
 
-    def _state_replaced(self, want, have):
+    def _state_replaced(self, want, have, commands):
         """ The command generator when state is replaced
 
-        :rtype: A list
-        :returns: the commands necessary to migrate the current configuration
-                  to the desired configuration
+        :param commands: the CommandBuilder that receives the commands
+                         necessary to migrate the current configuration to the
+                         desired configuration
         """
-        commands = []
-        replaced_commands = []
-        merged_commands = []
-
         if have:
-            replaced_commands = self._state_deleted(want, have)
-
-        merged_commands = self._state_merged(want, have)
-
-        if merged_commands and replaced_commands:
-            del merged_commands[0]
+            self._state_deleted(want, have, commands)
 
-        commands.extend(replaced_commands)
-        commands.extend(merged_commands)
+        self._state_merged(want, have, commands)
 
-        return commands
-
-    def _state_overridden(self, want, have):
+    def _state_overridden(self, want, have, commands):
         """ The command generator when state is overridden
 
-        :rtype: A list
-        :returns: the commands necessary to migrate the current configuration
-                  to the desired configuration
+        :param commands: the CommandBuilder that receives the commands
+                         necessary to migrate the current configuration to the
+                         desired configuration
         """
-        commands = []
-
         for intf in have:
             intf_in_want = search_obj_in_list(intf["name"], want)
             if not intf_in_want:
-                commands.extend(
-                    self._state_deleted({"name": intf["name"]}, intf)
-                )
+                self._state_deleted({"name": intf["name"]}, intf, commands)
 
         for intf in want:
             intf_in_have = search_obj_in_list(intf["name"], have)
-            commands.extend(self._state_replaced(intf, intf_in_have))
-
-        return commands
+            self._state_replaced(intf, intf_in_have, commands)
 
-    def _state_merged(self, want, have):
+    def _state_merged(self, want, have, commands):
         """ The command generator when state is merged
 
-        :rtype: A list
-        :returns: the commands necessary to merge the provided into
-                  the current configuration
+        :param commands: the CommandBuilder that receives the commands
+                         necessary to merge the provided into the current
+                         configuration
         """
-        commands = []
         if not have:
             have = {"name": want["name"]}
 
+        interface = "interface " + want["name"]
         for key, value in iteritems(
             flatten_dict(remove_empties(dict_diff(have, want)))
         ):
-            commands.append(self._compute_commands(key, value))
-
-        if commands:
-            pad_commands(commands, want["name"])
-
-        return commands
+            commands.add(interface, self._compute_commands(key, value))
 
-    def _state_deleted(self, want, have):
+    def _state_deleted(self, want, have, commands):
         """ The command generator when state is deleted
 
-        :rtype: A list
-        :returns: the commands necessary to remove the current configuration
-                  of the provided objects
+        :param commands: the CommandBuilder that receives the commands
+                         necessary to remove the current configuration of the
+                         provided objects
         """
-        commands = []
-
+        interface = "interface " + have["name"]
         for key, value in iteritems(
             flatten_dict(dict_delete(have, remove_empties(want)))
         ):
-            commands.append(self._compute_commands(key, value, remove=True))
-
-        if commands:
-            pad_commands(commands, have["name"])
-
-        return commands
+            commands.add(
+                interface, self._compute_commands(key, value, remove=True)
+            )
 
     def _compute_commands(self, key, value=None, remove=False):
         if key == "mac_address":
@@ -24,9 +24,10 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.facts import (
     Facts,
 )
+from collections import OrderedDict
+
 from ansible.module_utils.six import iteritems
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
-    search_obj_in_list,
     remove_empties,
     dict_diff,
     dict_merge,
@@ -149,8 +150,10 @@ class Static_routes(ConfigBase):
                 )
             )
 
+        have_index = self._index_routes(have)
+
         if state == "overridden":
-            commands.extend(self._state_overridden(want, have))
+            commands.extend(self._state_overridden(want, have, have_index))
 
         elif state == "deleted":
             if not want:
@@ -159,27 +162,25 @@ class Static_routes(ConfigBase):
 
             else:
                 for w_item in want:
-                    obj_in_have = self._find_vrf(w_item, have)
-                    if obj_in_have:
+                    have_afs = have_index.get(w_item.get("vrf") or None)
+                    if have_afs is not None:
                         commands.extend(
                             self._state_deleted(
-                                remove_empties(w_item), obj_in_have
+                                remove_empties(w_item), have_afs
                             )
                         )
 
         else:
             for w_item in want:
-                obj_in_have = self._find_vrf(w_item, have)
+                have_afs = have_index.get(w_item.get("vrf") or None, {})
                 if state == "merged" or self.state == "rendered":
                     commands.extend(
-                        self._state_merged(remove_empties(w_item), obj_in_have)
+                        self._state_merged(remove_empties(w_item), have_afs)
                     )
 
                 elif state == "replaced":
                     commands.extend(
-                        self._state_replaced(
-                            remove_empties(w_item), obj_in_have
-                        )
+                        self._state_replaced(remove_empties(w_item), have_afs)
                     )
 
         if commands:
@@ -187,9 +188,11 @@ class Static_routes(ConfigBase):
 
         return commands
 
-    def _state_replaced(self, want, have):
+    def _state_replaced(self, want, have_afs):
         """ The command generator when state is replaced
 
+        :param have_afs: the routes of the matching VRF (or global entry)
+                         in the index built by `_index_routes`
         :rtype: A list
         :returns: the commands necessary to migrate the current configuration
                   to the desired configuration
@@ -197,39 +200,25 @@ class Static_routes(ConfigBase):
         commands = []
 
         for want_afi in want.get("address_families", []):
-            have_afi = (
-                self.find_af_context(
-                    want_afi, have.get("address_families", [])
-                )
-                or {}
-            )
+            have_routes = have_afs.get((want_afi["afi"], want_afi["safi"]), {})
             update_commands = []
             for want_route in want_afi.get("routes", []):
-                have_route = (
-                    search_obj_in_list(
-                        want_route["dest"],
-                        have_afi.get("routes", []),
-                        key="dest",
-                    )
-                    or {}
-                )
-
-                rotated_have_next_hops = self.rotate_next_hops(
-                    have_route.get("next_hops", {})
+                rotated_have_next_hops = have_routes.get(
+                    want_route["dest"], {}
                 )
                 rotated_want_next_hops = self.rotate_next_hops(
                     want_route.get("next_hops", {})
                 )
 
-                for key in rotated_have_next_hops.keys():
+                for key in rotated_have_next_hops:
                     if key not in rotated_want_next_hops:
-                        cmd = "no {0}".format(want_route["dest"])
-                        for item in key:
-                            if "." in item or ":" in item or "/" in item:
-                                cmd += " {0}".format(item)
-                            else:
-                                cmd += " vrf {0}".format(item)
-                        update_commands.append(cmd)
+                        update_commands.append(
+                            "no {0}".format(
+                                self._compute_commands(
+                                    dest=want_route["dest"], next_hop=key
+                                )
+                            )
+                        )
 
                 for key, value in iteritems(rotated_want_next_hops):
                     if key in rotated_have_next_hops:
@@ -260,32 +249,35 @@ class Static_routes(ConfigBase):
                 )
                 commands.extend(update_commands)
 
-        if "vrf" in want and update_commands:
+        if "vrf" in want and commands:
             commands.insert(0, "vrf {0}".format(want["vrf"]))
 
         return commands
 
-    def _state_overridden(self, want, have):
+    def _state_overridden(self, want, have, have_index):
         """ The command generator when state is overridden
 
+        :param have_index: the index of `have` built by `_index_routes`
         :rtype: A list
         :returns: the commands necessary to migrate the current configuration
                   to the desired configuration
         """
         commands = []
+        want_index = self._index_routes(want)
 
         # Iterate through all the entries, i.e., VRFs and Global entry in have
         # and fully remove the ones that are not present in want and then call
         # replaced
 
         for h_item in have:
-            w_item = self._find_vrf(h_item, want)
+            vrf = h_item.get("vrf") or None
+            want_afs = want_index.get(vrf)
 
             # Delete all the top-level keys (VRFs/Global Route Entry) that are
             # not specified in want.
-            if not w_item:
-                if "vrf" in h_item:
-                    commands.append("no vrf {0}".format(h_item["vrf"]))
+            if want_afs is None:
+                if vrf:
+                    commands.append("no vrf {0}".format(vrf))
                 else:
                     for have_afi in h_item.get("address_families", []):
                         commands.append(
@@ -299,55 +291,40 @@ class Static_routes(ConfigBase):
             # limited to replacing a single `dest`.
             else:
                 del_cmds = []
-                for have_afi in h_item.get("address_families", []):
-                    want_afi = (
-                        self.find_af_context(
-                            have_afi, w_item.get("address_families", [])
-                        )
-                        or {}
-                    )
-                    update_commands = []
-                    for h_route in have_afi.get("routes", []):
-                        w_route = (
-                            search_obj_in_list(
-                                h_route["dest"],
-                                want_afi.get("routes", []),
-                                key="dest",
-                            )
-                            or {}
-                        )
-                        if not w_route:
-                            update_commands.append(
-                                "no {0}".format(h_route["dest"])
-                            )
+                for af, have_routes in iteritems(have_index[vrf]):
+                    want_routes = want_afs.get(af, {})
+                    update_commands = [
+                        "no {0}".format(dest)
+                        for dest in have_routes
+                        if dest not in want_routes
+                    ]
 
                     if update_commands:
                         update_commands.insert(
-                            0,
-                            "address-family {0} {1}".format(
-                                want_afi["afi"], want_afi["safi"]
-                            ),
+                            0, "address-family {0} {1}".format(*af)
                         )
                         del_cmds.extend(update_commands)
 
-                if "vrf" in want and update_commands:
-                    del_cmds.insert(0, "vrf {0}".format(want["vrf"]))
+                if vrf and del_cmds:
+                    del_cmds.insert(0, "vrf {0}".format(vrf))
 
                 commands.extend(del_cmds)
 
         # We finally call `_state_replaced` to replace exiting `dest` entries
         # or add new ones as specified in want.
         for w_item in want:
-            h_item = self._find_vrf(w_item, have)
+            have_afs = have_index.get(w_item.get("vrf") or None, {})
             commands.extend(
-                self._state_replaced(remove_empties(w_item), h_item)
+                self._state_replaced(remove_empties(w_item), have_afs)
             )
 
         return commands
 
-    def _state_merged(self, want, have):
+    def _state_merged(self, want, have_afs):
         """ The command generator when state is merged
 
+        :param have_afs: the routes of the matching VRF (or global entry)
+                         in the index built by `_index_routes`
         :rtype: A list
         :returns: the commands necessary to merge the provided into
                   the current configuration
@@ -355,32 +332,19 @@ class Static_routes(ConfigBase):
         commands = []
 
         for want_afi in want.get("address_families", []):
-            have_afi = (
-                self.find_af_context(
-                    want_afi, have.get("address_families", [])
-                )
-                or {}
-            )
+            have_routes = have_afs.get((want_afi["afi"], want_afi["safi"]), {})
 
             update_commands = []
             for want_route in want_afi.get("routes", []):
-                have_route = (
-                    search_obj_in_list(
-                        want_route["dest"],
-                        have_afi.get("routes", []),
-                        key="dest",
-                    )
-                    or {}
-                )
-
+                # the next hops of `have` are already rotated by `_index_routes`.
                 # convert the next_hops list of dictionaries to dictionary of
                 # dictionaries with (`dest_vrf`, `forward_router_address`, `interface`) tuple
                 # being the key for each dictionary.
                 # a combination of these 3 attributes uniquely identifies a route entry.
                 # in case `dest_vrf` is not specified, `forward_router_address` and `interface`
                 # become the unique identifier
-                rotated_have_next_hops = self.rotate_next_hops(
-                    have_route.get("next_hops", {})
+                rotated_have_next_hops = have_routes.get(
+                    want_route["dest"], {}
                 )
                 rotated_want_next_hops = self.rotate_next_hops(
                     want_route.get("next_hops", {})
@@ -425,14 +389,16 @@ class Static_routes(ConfigBase):
                 )
                 commands.extend(update_commands)
 
-        if "vrf" in want and update_commands:
+        if "vrf" in want and commands:
             commands.insert(0, "vrf {0}".format(want["vrf"]))
 
         return commands
 
-    def _state_deleted(self, want, have):
+    def _state_deleted(self, want, have_afs):
         """ The command generator when state is deleted
 
+        :param have_afs: the routes of the matching VRF (or global entry)
+                         in the index built by `_index_routes`
         :rtype: A list
         :returns: the commands necessary to remove the current configuration
                   of the provided objects
@@ -443,16 +409,10 @@ class Static_routes(ConfigBase):
 
         else:
             for want_afi in want.get("address_families", []):
-                have_afi = (
-                    self.find_af_context(
-                        want_afi, have.get("address_families", [])
-                    )
-                    or {}
-                )
-                if have_afi:
+                if (want_afi["afi"], want_afi["safi"]) in have_afs:
                     commands.append(
                         "no address-family {0} {1}".format(
-                            have_afi["afi"], have_afi["safi"]
+                            want_afi["afi"], want_afi["safi"]
                         )
                     )
             if "vrf" in want and commands:
@@ -460,40 +420,36 @@ class Static_routes(ConfigBase):
 
         return commands
 
-    def _find_vrf(self, item, entries):
-        """ This method iterates through the items
-            in `entries` and returns the object that
-            matches `item`.
+    def _index_routes(self, entries):
+        """ This method builds an index of the routes in `entries`,
+            keyed by VRF (None for the global entry), then by
+            (`afi`, `safi`) and then by `dest`, with the next hops
+            of every route rotated by `rotate_next_hops`.
+            Only the first occurrence of a VRF, address family or
+            destination is indexed.
 
         :rtype: A dict
-        :returns: the obj in `entries` that matches `item`
+        :returns: the routes index
         """
-        obj = {}
-        afi = item.get("vrf")
-
-        if afi:
-            obj = search_obj_in_list(afi, entries, key="vrf") or {}
-        else:
-            for x in entries:
-                if "vrf" not in remove_empties(x):
-                    obj = x
-                    break
-        return obj
-
-    def find_af_context(self, want_af_context, have_address_families):
-        """ This method iterates through the have AFs
-            and returns the one that matches the want AF
+        index = {}
+
+        for entry in entries:
+            vrf = entry.get("vrf") or None
+            if vrf in index:
+                continue
+            afs = index[vrf] = OrderedDict()
+            for af in entry.get("address_families") or []:
+                af_key = (af["afi"], af["safi"])
+                if af_key in afs:
+                    continue
+                routes = afs[af_key] = OrderedDict()
+                for route in af.get("routes") or []:
+                    if route["dest"] not in routes:
+                        routes[route["dest"]] = self.rotate_next_hops(
+                            route.get("next_hops") or []
+                        )
 
-        :rtype: A dict
-        :returns: the corresponding AF in have AFs
-                  that matches the want AF
-        """
-        for have_af in have_address_families:
-            if (
-                have_af["afi"] == want_af_context["afi"]
-                and have_af["safi"] == want_af_context["safi"]
-            ):
-                return have_af
+        return index
 
     def rotate_next_hops(self, next_hops):
         """ This method iterates through the list of
@@ -14,13 +14,16 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-from copy import deepcopy
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.acl_interfaces import (
     Acl_interfacesTemplate,
 )
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    validate_config,
+    facts_skeleton,
+)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.acl_interfaces.acl_interfaces import (
     Acl_interfacesArgs,
 )
@@ -33,16 +36,9 @@ class Acl_interfacesFacts(object):
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = Acl_interfacesArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = facts_skeleton(
+            self.argument_spec, subspec, options
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for acl_interfaces
@@ -70,7 +66,7 @@ class Acl_interfacesFacts(object):
 
         ansible_facts["ansible_network_resources"].pop("acl_interfaces", None)
         facts = {"acl_interfaces": []}
-        params = utils.validate_config(self.argument_spec, {"config": entry})
+        params = validate_config(self.argument_spec, {"config": entry})
         for cfg in params["config"]:
             facts["acl_interfaces"].append(utils.remove_empties(cfg))
 
@@ -14,8 +14,6 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-from copy import deepcopy
-
 from collections import deque
 from ansible.module_utils.six import iteritems
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
@@ -26,6 +24,9 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 )
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
     isipaddress,
+    validate_config,
+    facts_skeleton,
+    copy_skeleton,
 )
 
 PROTOCOL_OPTIONS = {
@@ -139,17 +140,9 @@ class AclsFacts(object):
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = AclsArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = facts_skeleton(
+            self.argument_spec, subspec, options
+        )
 
     def get_device_data(self, connection):
         return connection.get("show access-lists afi-all")
@@ -193,7 +186,7 @@ class AclsFacts(object):
 
             grouped_acls = {"ipv4": [], "ipv6": []}
             for acl in acls:
-                acl_copy = deepcopy(acl)
+                acl_copy = dict(acl)
                 del acl_copy["afi"]
                 grouped_acls[acl["afi"]].append(acl_copy)
 
@@ -209,7 +202,7 @@ class AclsFacts(object):
         facts = {}
 
         facts["acls"] = []
-        params = utils.validate_config(self.argument_spec, {"config": objs})
+        params = validate_config(self.argument_spec, {"config": objs})
         for cfg in params["config"]:
             facts["acls"].append(utils.remove_empties(cfg))
 
@@ -227,7 +220,7 @@ class AclsFacts(object):
         :rtype: dictionary
         :returns: The generated config
         """
-        config = deepcopy(spec)
+        config = copy_skeleton(spec)
         config["acls"] = []
 
         for item in conf:
@@ -338,12 +331,12 @@ class AclsFacts(object):
             :param ace_queue: The ACE queue
             """
             if len(ace_queue) > 0:
-                # We deepcopy the actual queue and iterate through the
+                # We copy the actual queue and iterate through the
                 # copied queue. However, we pop off the elements from
                 # the actual queue. Then, in every pass we update the copied
                 # queue with the current state of the original queue.
                 # This is done because a queue cannot be mutated during iteration.
-                copy_ace_queue = deepcopy(ace_queue)
+                copy_ace_queue = deque(ace_queue)
 
                 for element in copy_ace_queue:
                     if element == "precedence":
@@ -400,7 +393,7 @@ class AclsFacts(object):
                         rendered_ace[element.replace("-", "_")] = True
                         ace_queue.remove(element)
 
-                    copy_ace_queue = deepcopy(ace_queue)
+                    copy_ace_queue = deque(ace_queue)
 
         rendered_ace = {}
         split_ace = ace.split()
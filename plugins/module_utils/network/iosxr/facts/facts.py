@@ -65,6 +65,9 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.os
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.ospf_interfaces.ospf_interfaces import (
     Ospf_interfacesFacts,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.timing import (
+    get_timing,
+)
 
 
 FACT_LEGACY_SUBSETS = dict(
@@ -109,10 +112,12 @@ class Facts(FactsBase):
         :rtype: dict
         :return: the facts gathered
         """
+        timing = get_timing()
         if self.VALID_RESOURCE_SUBSETS:
-            self.get_network_resources_facts(
-                FACT_RESOURCE_SUBSETS, resource_facts_type, data
-            )
+            with timing.phase("post_facts" if timing.edited else "parse"):
+                self.get_network_resources_facts(
+                    FACT_RESOURCE_SUBSETS, resource_facts_type, data
+                )
 
         if self.VALID_LEGACY_GATHER_SUBSETS:
             self.get_network_legacy_facts(
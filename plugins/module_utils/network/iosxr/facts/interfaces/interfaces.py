@@ -13,13 +13,18 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-from copy import deepcopy
-import re
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
-    get_interface_type,
+    validate_config,
+    get_command_arg,
+    has_command,
+    facts_skeleton,
+    copy_skeleton,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.interface_config import (
+    get_interface_config,
 )
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.interfaces.interfaces import (
     InterfacesArgs,
@@ -33,16 +38,9 @@ class InterfacesFacts(object):
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = InterfacesArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = facts_skeleton(
+            self.argument_spec, subspec, options
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for interfaces
@@ -57,19 +55,15 @@ class InterfacesFacts(object):
             data = connection.get("show running-config interface")
 
         # operate on a collection of resource x
-        config = ("\n" + data).split("\ninterface ")
-        for conf in config:
-            if conf:
-                obj = self.render_config(self.generated_spec, conf)
-                if obj:
-                    objs.append(obj)
+        for conf in get_interface_config(data):
+            obj = self.render_config(self.generated_spec, conf)
+            if obj:
+                objs.append(obj)
 
         facts = {}
         if objs:
             facts["interfaces"] = []
-            params = utils.validate_config(
-                self.argument_spec, {"config": objs}
-            )
+            params = validate_config(self.argument_spec, {"config": objs})
             for cfg in params["config"]:
                 facts["interfaces"].append(utils.remove_empties(cfg))
 
@@ -80,31 +74,26 @@ class InterfacesFacts(object):
         """
         Render config as dictionary structure and delete keys from spec for null values
         :param spec: The facts tree, generated from the argspec
-        :param conf: The configuration
+        :param conf: The InterfaceConfig record of the interface
         :rtype: dictionary
         :returns: The generated config
         """
 
-        config = deepcopy(spec)
-        match = re.search(r"^(\S+)", conf)
-
-        intf = match.group(1)
-        if match.group(1).lower() == "preconfigure":
-            match = re.search(r"^(\S+) (.*)", conf)
-            if match:
-                intf = match.group(2)
-
-        if get_interface_type(intf) == "unknown":
+        config = copy_skeleton(spec)
+        intf = conf.name
+        if conf.type == "unknown":
             return {}
         # populate the facts from the configuration
         config["name"] = intf
-        config["description"] = utils.parse_conf_arg(conf, "description")
-        if utils.parse_conf_arg(conf, "speed"):
-            config["speed"] = int(utils.parse_conf_arg(conf, "speed"))
-        if utils.parse_conf_arg(conf, "mtu"):
-            config["mtu"] = int(utils.parse_conf_arg(conf, "mtu"))
-        config["duplex"] = utils.parse_conf_arg(conf, "duplex")
-        enabled = utils.parse_conf_cmd_arg(conf, "shutdown", False)
-        config["enabled"] = enabled if enabled is not None else True
+        commands = conf.commands
+        config["description"] = get_command_arg(commands, "description")
+        speed = get_command_arg(commands, "speed")
+        if speed:
+            config["speed"] = int(speed)
+        mtu = get_command_arg(commands, "mtu")
+        if mtu:
+            config["mtu"] = int(mtu)
+        config["duplex"] = get_command_arg(commands, "duplex")
+        config["enabled"] = not has_command(commands, "shutdown")
 
         return utils.remove_empties(config)
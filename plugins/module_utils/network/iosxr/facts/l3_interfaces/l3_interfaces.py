@@ -15,13 +15,17 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 
-from copy import deepcopy
-import re
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
-    get_interface_type,
+    validate_config,
+    get_command_args,
+    facts_skeleton,
+    copy_skeleton,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.interface_config import (
+    get_interface_config,
 )
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.l3_interfaces.l3_interfaces import (
     L3_InterfacesArgs,
@@ -35,16 +39,9 @@ class L3_InterfacesFacts(object):
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = L3_InterfacesArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = facts_skeleton(
+            self.argument_spec, subspec, options
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for interfaces
@@ -59,19 +56,15 @@ class L3_InterfacesFacts(object):
         if not data:
             data = connection.get("show running-config interface")
         # operate on a collection of resource x
-        config = ("\n" + data).split("\ninterface ")
-        for conf in config:
-            if conf:
-                obj = self.render_config(self.generated_spec, conf)
-                if obj:
-                    objs.append(obj)
+        for conf in get_interface_config(data):
+            obj = self.render_config(self.generated_spec, conf)
+            if obj:
+                objs.append(obj)
         facts = {}
 
         if objs:
             facts["l3_interfaces"] = []
-            params = utils.validate_config(
-                self.argument_spec, {"config": objs}
-            )
+            params = validate_config(self.argument_spec, {"config": objs})
             for cfg in params["config"]:
                 facts["l3_interfaces"].append(utils.remove_empties(cfg))
         ansible_facts["ansible_network_resources"].update(facts)
@@ -82,28 +75,23 @@ class L3_InterfacesFacts(object):
         """
         Render config as dictionary structure and delete keys from spec for null values
         :param spec: The facts tree, generated from the argspec
-        :param conf: The configuration
+        :param conf: The InterfaceConfig record of the interface
         :rtype: dictionary
         :returns: The generated config
         """
-        config = deepcopy(spec)
-        match = re.search(r"^(\S+)", conf)
-
-        intf = match.group(1)
-        if match.group(1).lower() == "preconfigure":
-            match = re.search(r"^(\S+) (.*)", conf)
-            if match:
-                intf = match.group(2)
-
-        if get_interface_type(intf) == "unknown":
+        config = copy_skeleton(spec)
+        intf = conf.name
+        if conf.type == "unknown":
             return {}
 
         # populate the facts from the configuration
         config["name"] = intf
 
+        commands = conf.commands
+
         # Get the configured IPV4 details
         ipv4 = []
-        ipv4_all = re.findall(r"ipv4 address (\S+.*)", conf)
+        ipv4_all = get_command_args(commands, "ipv4 address")
         for each in ipv4_all:
             each_ipv4 = dict()
             if "secondary" in each:
@@ -116,10 +104,10 @@ class L3_InterfacesFacts(object):
 
         # Get the configured IPV6 details
         ipv6 = []
-        ipv6_all = re.findall(r"ipv6 address (\S+)", conf)
+        ipv6_all = get_command_args(commands, "ipv6 address")
         for each in ipv6_all:
             each_ipv6 = dict()
-            each_ipv6["address"] = each
+            each_ipv6["address"] = each.split(" ")[0]
             ipv6.append(each_ipv6)
             config["ipv6"] = ipv6
 
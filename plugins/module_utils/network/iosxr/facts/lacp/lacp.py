@@ -15,10 +15,14 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 
-from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    validate_config,
+    facts_skeleton,
+    copy_skeleton,
+)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.lacp.lacp import (
     LacpArgs,
 )
@@ -31,16 +35,9 @@ class LacpFacts(object):
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = LacpArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = facts_skeleton(
+            self.argument_spec, subspec, options
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for lacp
@@ -62,7 +59,7 @@ class LacpFacts(object):
         ansible_facts["ansible_network_resources"].pop("lacp", None)
         facts = {}
 
-        params = utils.validate_config(self.argument_spec, {"config": obj})
+        params = validate_config(self.argument_spec, {"config": obj})
         facts["lacp"] = utils.remove_empties(params["config"])
 
         ansible_facts["ansible_network_resources"].update(facts)
@@ -78,7 +75,7 @@ class LacpFacts(object):
         :rtype: dictionary
         :returns: The generated config
         """
-        config = deepcopy(spec)
+        config = copy_skeleton(spec)
 
         system_priority = utils.parse_conf_arg(conf, "priority")
         config["system"]["priority"] = (
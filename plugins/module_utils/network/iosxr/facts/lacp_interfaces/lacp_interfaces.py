@@ -15,17 +15,31 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 
-import re
-from copy import deepcopy
-
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    validate_config,
+    get_command_arg,
+    facts_skeleton,
+    copy_skeleton,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.interface_config import (
+    get_interface_config,
+)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.lacp_interfaces.lacp_interfaces import (
     Lacp_interfacesArgs,
 )
 from ansible.module_utils.six import iteritems
 
+INTERFACE_TYPES = (
+    "GigabitEthernet",
+    "Bundle-Ether",
+    "TenGigE",
+    "FortyGigE",
+    "HundredGigE",
+)
+
 
 class Lacp_interfacesFacts(object):
     """ The iosxr lacp_interfaces fact class
@@ -34,16 +48,9 @@ class Lacp_interfacesFacts(object):
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = Lacp_interfacesArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = facts_skeleton(
+            self.argument_spec, subspec, options
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for lacp_interfaces
@@ -56,10 +63,9 @@ class Lacp_interfacesFacts(object):
 
         if not data:
             data = connection.get_config(flags="interface")
-        interfaces = ("\n" + data).split("\ninterface ")
 
         objs = []
-        for interface in interfaces:
+        for interface in get_interface_config(data):
             obj = self.render_config(self.generated_spec, interface)
             if obj:
                 objs.append(obj)
@@ -68,9 +74,7 @@ class Lacp_interfacesFacts(object):
         facts = {}
         if objs:
             facts["lacp_interfaces"] = []
-            params = utils.validate_config(
-                self.argument_spec, {"config": objs}
-            )
+            params = validate_config(self.argument_spec, {"config": objs})
             for cfg in params["config"]:
                 facts["lacp_interfaces"].append(utils.remove_empties(cfg))
 
@@ -83,19 +87,15 @@ class Lacp_interfacesFacts(object):
           from spec for null values
 
         :param spec: The facts tree, generated from the argspec
-        :param conf: The configuration
+        :param conf: The InterfaceConfig record of the interface
         :rtype: dictionary
         :returns: The generated config
         """
-        config = deepcopy(spec)
+        config = copy_skeleton(spec)
 
-        match = re.search(
-            r"(GigabitEthernet|Bundle-Ether|TenGigE|FortyGigE|HundredGigE)(\S+)",
-            conf,
-            re.M,
-        )
-        if match:
-            config["name"] = match.group(1) + match.group(2)
+        if conf.name.startswith(INTERFACE_TYPES):
+            config["name"] = conf.name
+            commands = conf.commands
 
             temp = {
                 "churn_logging": "lacp churn logging",
@@ -105,11 +105,11 @@ class Lacp_interfacesFacts(object):
             }
 
             for key, value in iteritems(temp):
-                config[key] = utils.parse_conf_arg(conf, value)
+                config[key] = get_command_arg(commands, value)
 
             for key in config["system"].keys():
-                config["system"][key] = utils.parse_conf_arg(
-                    conf, "lacp system {0}".format(key)
+                config["system"][key] = get_command_arg(
+                    commands, "lacp system {0}".format(key)
                 )
 
         return utils.remove_empties(config)
@@ -16,15 +16,26 @@ __metaclass__ = type
 
 
 import re
-from copy import deepcopy
 
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    validate_config,
+    get_command_arg,
+    facts_skeleton,
+    copy_skeleton,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.interface_config import (
+    get_interface_config,
+)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.lag_interfaces.lag_interfaces import (
     Lag_interfacesArgs,
 )
 
+_BUNDLE_NAME_RE = re.compile(r"Bundle-Ether(\d+)")
+_BUNDLE_MEMBER_RE = re.compile(r"(\d+) mode (\S+)")
+
 
 class Lag_interfacesFacts(object):
     """ The iosxr lag_interfaces fact class
@@ -33,16 +44,9 @@ class Lag_interfacesFacts(object):
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = Lag_interfacesArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = facts_skeleton(
+            self.argument_spec, subspec, options
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for lag_interfaces
@@ -55,87 +59,75 @@ class Lag_interfacesFacts(object):
 
         if not data:
             data = connection.get_config(flags="interface")
-        interfaces = ("\n" + data).split("\ninterface ")
+        bundles = []
+        members = {}
+        for interface in get_interface_config(data):
+            if interface.type == "Bundle-Ether":
+                if not interface.preconfigure:
+                    bundles.append(interface)
+            elif interface.type != "Bundle-POS":
+                self.parse_members(interface, members)
 
         objs = []
-
-        for interface in interfaces:
-            if interface.startswith("Bundle-Ether"):
-                obj = self.render_config(
-                    self.generated_spec, interface, interfaces
-                )
-                if obj:
-                    objs.append(obj)
+        for bundle in bundles:
+            obj = self.render_config(self.generated_spec, bundle, members)
+            if obj:
+                objs.append(obj)
 
         ansible_facts["ansible_network_resources"].pop("lag_interfaces", None)
         facts = {}
 
         facts["lag_interfaces"] = []
-        params = utils.validate_config(self.argument_spec, {"config": objs})
+        params = validate_config(self.argument_spec, {"config": objs})
         for cfg in params["config"]:
             facts["lag_interfaces"].append(utils.remove_empties(cfg))
 
         ansible_facts["ansible_network_resources"].update(facts)
         return ansible_facts
 
-    def render_config(self, spec, conf, data):
+    def render_config(self, spec, conf, members):
         """
         Render config as dictionary structure and delete keys
         from spec for null values
 
         :param spec: The facts tree, generated from the argspec
-        :param conf: The configuration
+        :param conf: The InterfaceConfig record of the bundle
+        :param members: The bundle membership index built by `parse_members`
         :rtype: dictionary
         :returns: The generated config
         """
-        config = deepcopy(spec)
-        match = re.search(r"(Bundle-Ether)(\d+)", conf, re.M)
+        config = copy_skeleton(spec)
+        match = _BUNDLE_NAME_RE.match(conf.name)
         if match:
-            config["name"] = match.group(1) + match.group(2)
-            config["load_balancing_hash"] = utils.parse_conf_arg(
-                conf, "bundle load-balancing hash"
+            commands = conf.commands
+            config["name"] = match.group(0)
+            config["load_balancing_hash"] = get_command_arg(
+                commands, "bundle load-balancing hash"
             )
-            config["mode"] = utils.parse_conf_arg(conf, "lacp mode")
-            config["links"]["max_active"] = utils.parse_conf_arg(
-                conf, "bundle maximum-active links"
+            config["mode"] = get_command_arg(commands, "lacp mode")
+            config["links"]["max_active"] = get_command_arg(
+                commands, "bundle maximum-active links"
             )
-            config["links"]["min_active"] = utils.parse_conf_arg(
-                conf, "bundle minimum-active links"
+            config["links"]["min_active"] = get_command_arg(
+                commands, "bundle minimum-active links"
             )
-            config["members"] = self.parse_members(match.group(2), data)
+            config["members"] = members.get(match.group(1))
 
         return utils.remove_empties(config)
 
-    def parse_members(self, bundle_id, interfaces):
+    def parse_members(self, interface, members):
         """
-        Renders a list of member interfaces for every bundle
-        present in running-config.
+        Adds the interface to the member list of the bundle it
+        is configured for, so that all the bundles present in
+        running-config are resolved with a single pass over it.
 
-        :param bundle_id: The Bundle-Ether ID fetched from running-config
-        :param interfaces: Data of all interfaces present in running-config
-        :rtype: list
-        :returns: A list of member interfaces
+        :param interface: The InterfaceConfig record of an interface
+        :param members: The index of member interfaces keyed by bundle ID
         """
-
-        def _parse_interface(name):
-            if name.startswith("preconfigure"):
-                return name.split()[1]
-            else:
-                return name.split()[0]
-
-        members = []
-        for interface in interfaces:
-            if not interface.startswith("Bu"):
-                match = re.search(
-                    r"bundle id (\d+) mode (\S+)", interface, re.M
+        bundle = get_command_arg(interface.commands, "bundle id")
+        if bundle:
+            match = _BUNDLE_MEMBER_RE.match(bundle)
+            if match:
+                members.setdefault(match.group(1), []).append(
+                    {"member": interface.name, "mode": match.group(2)}
                 )
-                if match:
-                    if bundle_id == match.group(1):
-                        members.append(
-                            {
-                                "member": _parse_interface(interface),
-                                "mode": match.group(2),
-                            }
-                        )
-
-        return members
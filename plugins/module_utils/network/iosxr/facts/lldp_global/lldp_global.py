@@ -15,11 +15,14 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 
-from copy import deepcopy
-
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    validate_config,
+    facts_skeleton,
+    copy_skeleton,
+)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.lldp_global.lldp_global import (
     Lldp_globalArgs,
 )
@@ -32,16 +35,9 @@ class Lldp_globalFacts(object):
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = Lldp_globalArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = facts_skeleton(
+            self.argument_spec, subspec, options
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for lldp
@@ -63,7 +59,7 @@ class Lldp_globalFacts(object):
         ansible_facts["ansible_network_resources"].pop("lldp_global", None)
         facts = {}
 
-        params = utils.validate_config(self.argument_spec, {"config": obj})
+        params = validate_config(self.argument_spec, {"config": obj})
         facts["lldp_global"] = utils.remove_empties(params["config"])
 
         ansible_facts["ansible_network_resources"].update(facts)
@@ -79,7 +75,7 @@ class Lldp_globalFacts(object):
         :rtype: dictionary
         :returns: The generated config
         """
-        config = deepcopy(spec)
+        config = copy_skeleton(spec)
 
         for key in spec.keys():
             if key == "subinterfaces":
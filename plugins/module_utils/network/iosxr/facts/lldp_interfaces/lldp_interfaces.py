@@ -15,16 +15,30 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 
-import re
-from copy import deepcopy
-
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    validate_config,
+    has_command,
+    facts_skeleton,
+    copy_skeleton,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.interface_config import (
+    get_interface_config,
+)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.lldp_interfaces.lldp_interfaces import (
     Lldp_interfacesArgs,
 )
 
+INTERFACE_TYPES = (
+    "GigabitEthernet",
+    "Bundle-Ether",
+    "TenGigE",
+    "FortyGigE",
+    "HundredGigE",
+)
+
 
 class Lldp_interfacesFacts(object):
     """ The iosxr lldp_interfaces fact class
@@ -33,16 +47,9 @@ class Lldp_interfacesFacts(object):
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = Lldp_interfacesArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = facts_skeleton(
+            self.argument_spec, subspec, options
+        )
 
     def populate_facts(self, connection, ansible_facts, data=None):
         """ Populate the facts for lldp_interfaces
@@ -55,10 +62,9 @@ class Lldp_interfacesFacts(object):
 
         if not data:
             data = connection.get_config(flags="interface")
-        interfaces = ("\n" + data).split("\ninterface ")
 
         objs = []
-        for interface in interfaces:
+        for interface in get_interface_config(data):
             obj = self.render_config(self.generated_spec, interface)
             if obj:
                 objs.append(obj)
@@ -68,9 +74,7 @@ class Lldp_interfacesFacts(object):
 
         if objs:
             facts["lldp_interfaces"] = []
-            params = utils.validate_config(
-                self.argument_spec, {"config": objs}
-            )
+            params = validate_config(self.argument_spec, {"config": objs})
             for cfg in params["config"]:
                 facts["lldp_interfaces"].append(utils.remove_empties(cfg))
 
@@ -83,27 +87,25 @@ class Lldp_interfacesFacts(object):
           from spec for null values
 
         :param spec: The facts tree, generated from the argspec
-        :param conf: The configuration
+        :param conf: The InterfaceConfig record of the interface
         :rtype: dictionary
         :returns: The generated config
         """
-        config = deepcopy(spec)
+        config = copy_skeleton(spec)
 
-        match = re.search(
-            r"(GigabitEthernet|Bundle-Ether|TenGigE|FortyGigE|HundredGigE)(\S+)",
-            conf,
-            re.M,
-        )
-        if match:
-            config["name"] = match.group(1) + match.group(2)
+        if conf.name.startswith(INTERFACE_TYPES):
+            config["name"] = conf.name
+            commands = conf.commands
 
             for key in ["receive", "transmit"]:
                 config[key] = (
-                    False if ("{0} disable".format(key)) in conf else None
+                    False
+                    if has_command(commands, "{0} disable".format(key))
+                    else None
                 )
 
             for x in ["ieee-nearest-bridge", "ieee-nearest-non-tmpr-bridge"]:
-                if x in conf:
+                if has_command(commands, x):
                     config["destination"]["mac_address"] = x
 
         return utils.remove_empties(config)
@@ -13,7 +13,6 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-from copy import deepcopy
 import re
 
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templates.ospfv2 import (
@@ -22,6 +21,10 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.rm_templ
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    validate_config,
+    facts_skeleton,
+)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.ospfv2.ospfv2 import (
     Ospfv2Args,
 )
@@ -38,16 +41,9 @@ class Ospfv2Facts(object):
         self._module = module
         self.argument_spec = Ospfv2Args.argument_spec
 
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = facts_skeleton(
+            self.argument_spec, subspec, options
+        )
 
     def get_ospfv2_data(self, connection):
         return connection.get("show running-config router ospf")
@@ -146,9 +142,7 @@ class Ospfv2Facts(object):
         ansible_facts["ansible_network_resources"].pop("ospfv2", None)
         facts = {}
         if current:
-            params = utils.validate_config(
-                self.argument_spec, {"config": ipv4}
-            )
+            params = validate_config(self.argument_spec, {"config": ipv4})
             params = utils.remove_empties(params)
 
             facts["ospfv2"] = params["config"]
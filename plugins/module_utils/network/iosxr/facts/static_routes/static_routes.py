@@ -16,10 +16,14 @@ __metaclass__ = type
 
 
 import re
-from copy import deepcopy
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
     utils,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    validate_config,
+    facts_skeleton,
+    copy_skeleton,
+)
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.static_routes.static_routes import (
     Static_routesArgs,
 )
@@ -32,16 +36,9 @@ class Static_routesFacts(object):
     def __init__(self, module, subspec="config", options="options"):
         self._module = module
         self.argument_spec = Static_routesArgs.argument_spec
-        spec = deepcopy(self.argument_spec)
-        if subspec:
-            if options:
-                facts_argument_spec = spec[subspec][options]
-            else:
-                facts_argument_spec = spec[subspec]
-        else:
-            facts_argument_spec = spec
-
-        self.generated_spec = utils.generate_dict(facts_argument_spec)
+        self.generated_spec = facts_skeleton(
+            self.argument_spec, subspec, options
+        )
 
     def get_device_data(self, connection):
         return connection.get_config(flags="router static")
@@ -69,7 +66,7 @@ class Static_routesFacts(object):
         facts = {}
 
         facts["static_routes"] = []
-        params = utils.validate_config(self.argument_spec, {"config": objs})
+        params = validate_config(self.argument_spec, {"config": objs})
         for cfg in params["config"]:
             facts["static_routes"].append(utils.remove_empties(cfg))
 
@@ -86,7 +83,7 @@ class Static_routesFacts(object):
         :rtype: dictionary
         :returns: The generated config
         """
-        config = deepcopy(spec)
+        config = copy_skeleton(spec)
         entry_list = conf.split(" address-family")
         config["address_families"] = []
 
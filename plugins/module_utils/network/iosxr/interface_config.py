@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+# Copyright 2019 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+The interface section of the running-config, parsed once and
+shared by all the interface resource facts classes.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from collections import OrderedDict
+
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    get_interface_type,
+    parse_interface_commands,
+)
+
+_DOCUMENT_CACHE_SIZE = 4
+_documents = OrderedDict()
+
+
+class InterfaceConfig(object):
+    """ A single `interface` block of the running-config
+
+    `name` is the interface name without the `preconfigure` keyword,
+    `type` its type as returned by `get_interface_type` and `lines`
+    the stripped command lines of the block.
+    """
+
+    __slots__ = ("name", "type", "preconfigure", "lines", "_commands")
+
+    def __init__(self, header, lines):
+        words = header.split()
+        self.preconfigure = words[0].lower() == "preconfigure"
+        if self.preconfigure and len(words) > 1:
+            self.name = words[1]
+        else:
+            self.name = words[0]
+        self.type = get_interface_type(self.name)
+        self.lines = lines
+        self._commands = None
+
+    @property
+    def commands(self):
+        """ The lines of the block tokenized by `parse_interface_commands`
+        """
+        if self._commands is None:
+            self._commands = parse_interface_commands(self.lines)
+        return self._commands
+
+
+class InterfaceConfigDocument(object):
+    """ The `interface` blocks of a running-config
+
+    The configuration is only split into `InterfaceConfig` records
+    the first time the document is iterated.
+    """
+
+    __slots__ = ("_data", "_interfaces")
+
+    def __init__(self, data):
+        self._data = data
+        self._interfaces = None
+
+    @property
+    def interfaces(self):
+        if self._interfaces is None:
+            self._interfaces = self._parse(self._data)
+            self._data = None
+        return self._interfaces
+
+    @staticmethod
+    def _parse(data):
+        interfaces = []
+        header = None
+        lines = []
+        for line in data.splitlines():
+            if line.startswith("interface "):
+                if header:
+                    interfaces.append(InterfaceConfig(header, lines))
+                header = line[10:].strip()
+                lines = []
+            elif header is not None:
+                line = line.strip()
+                if line and line != "!":
+                    lines.append(line)
+        if header:
+            interfaces.append(InterfaceConfig(header, lines))
+        return interfaces
+
+    def __iter__(self):
+        return iter(self.interfaces)
+
+    def __len__(self):
+        return len(self.interfaces)
+
+
+def get_interface_config(data):
+    """ Return the `InterfaceConfigDocument` for `data`
+
+    The documents of the last few configurations are kept, so the
+    facts classes gathered in the same run parse the interface
+    section only once.
+
+    :param data: The running-config text
+    :rtype: InterfaceConfigDocument
+    """
+    document = _documents.get(data)
+    if document is None:
+        if len(_documents) >= _DOCUMENT_CACHE_SIZE:
+            _documents.popitem(last=False)
+        document = _documents[data] = InterfaceConfigDocument(data)
+    return document
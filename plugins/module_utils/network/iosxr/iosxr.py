@@ -35,6 +35,7 @@ from difflib import Differ
 
 from ansible.module_utils._text import to_text, to_bytes
 from ansible.module_utils.basic import env_fallback
+from ansible.module_utils.six import iteritems, string_types
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     to_list,
 )
@@ -59,6 +60,11 @@ except ImportError:
 
 _EDIT_OPS = frozenset(["merge", "create", "replace", "delete"])
 
+# Commands asking for their output as XML, `show ... | xml`
+XML_OUTPUT_RE = re.compile(r"\|\s*xml\b")
+# Characters of an XML output handed to the parser at a time
+XML_FEED_SIZE = 65536
+
 BASE_1_0 = "{urn:ietf:params:xml:ns:netconf:base:1.0}"
 
 NS_DICT = {
@@ -341,20 +347,145 @@ def build_xml(container, xmap=None, params=None, opcode=None):
     return etree.tostring(root, encoding="unicode")
 
 
-def etree_find(root, node):
+# Key leaves of the YANG list entries built by build_xml, the entries of
+# other lists are keyed by their `name` or `*-name` leaves
+XML_LIST_KEYS = {
+    "interface-configuration": ("active", "interface-name"),
+    "mtu": ("owner",),
+    "vrf": ("vrf-name",),
+    "ipv4": ("address",),
+    "list": ("order", "list-name"),
+    "server": ("order", "server-address"),
+}
+
+
+def _localname(element):
+    return etree.QName(element).localname
+
+
+def _leaves(element):
+    return dict(
+        (_localname(child), (child.text or "").strip())
+        for child in element
+        if len(child) == 0
+    )
+
+
+def _list_keys(element):
+    """ The values of the key leaves of `element` when it is a list
+    entry, an empty dict for a container
+    """
+    leaves = _leaves(element)
+    names = XML_LIST_KEYS.get(_localname(element))
+    if names is None:
+        names = [
+            name for name in leaves if name == "name" or name.endswith("-name")
+        ]
+    missing = [name for name in names if name not in leaves]
+    if missing:
+        raise ValueError(
+            "%s without its %s key" % (_localname(element), ", ".join(missing))
+        )
+    return dict((name, leaves[name]) for name in names)
+
+
+def _merge_xml_element(parent, element):
+    """ Merge `element` into the children of `parent`
+
+    A leaf or a container is the child of `parent` with the same tag, a
+    list entry the one with the same tag and key leaves. Otherwise
+    `element` is a new sibling. Raises ValueError when a leaf is set to
+    two different values or a node is edited with two operations.
+    """
+    keys = None
+    text = (element.text or "").strip()
+    if len(element):
+        keys = _list_keys(element)
+
+    for child in parent.iterchildren(element.tag):
+        if keys is None:
+            if len(child) or (child.text or "").strip() != text:
+                raise ValueError(
+                    "conflicting values of %s" % _localname(element)
+                )
+        elif _list_keys(child) != keys:
+            continue
+
+        if dict(child.attrib) != dict(element.attrib):
+            raise ValueError(
+                "conflicting edits of %s %s"
+                % (_localname(element), keys or text)
+            )
+        for item in element:
+            _merge_xml_element(child, item)
+        return
+
+    nsmap = dict(
+        (prefix, ns)
+        for prefix, ns in iteritems(element.nsmap)
+        if parent.nsmap.get(prefix) != ns
+    )
+    child = etree.SubElement(
+        parent, element.tag, attrib=dict(element.attrib), nsmap=nsmap or None
+    )
+    child.text = element.text
+    for item in element:
+        _merge_xml_element(child, item)
+
+
+def merge_xml_configs(configs):
+    """
+    Merges the <config> documents of `configs`, as built by build_xml,
+    into a single <config> document to send them in one edit-config
+
+    Raises ValueError when the documents set a leaf of the same node to
+    different values or edit the same node with different operations.
+
+    :returns: the merged document as a string
+    """
+    root = etree.Element("config", nsmap=NS_DICT["BASE_NSMAP"])
+    for config in configs:
+        for container in etree.fromstring(to_bytes(config)):
+            _merge_xml_element(root, container)
+
+    return etree.tostring(root, encoding="unicode")
+
+
+def build_xml_filter(containers):
+    """
+    Builds a single subtree filter selecting each of the YANG `containers`,
+    each in its own namespace, to retrieve all of them with one get-config
+
+    :returns: the filter as a string
+    """
+    root = etree.Element("filter", type="subtree")
+    for container in containers:
+        etree.SubElement(
+            root, container, nsmap=NS_DICT[container.upper() + "_NSMAP"]
+        )
+
+    return etree.tostring(root, encoding="unicode")
+
+
+def etree_parse(root):
+    """ `root` parsed into an element, when it is not one already
+    """
+    if etree.iselement(root):
+        return root
     try:
-        root = etree.fromstring(to_bytes(root))
+        return etree.fromstring(to_bytes(root))
     except (ValueError, etree.XMLSyntaxError):
-        pass
+        return root
+
+
+def etree_find(root, node):
+    root = etree_parse(root)
 
     return root.find(".//%s" % node.strip())
 
 
 def etree_findall(root, node):
-    try:
-        root = etree.fromstring(to_bytes(root))
-    except (ValueError, etree.XMLSyntaxError):
-        pass
+    root = etree_parse(root)
 
     return root.findall(".//%s" % node.strip())
 
@@ -507,6 +638,22 @@ def check_existing_commit_labels(conn, label):
         return False
 
 
+def summarize_commit_diff(commit_diff):
+    """ Count the lines added, removed and modified in the output of
+    `show commit changes diff`
+    """
+    summary = {"added": 0, "removed": 0, "modified": 0}
+    for line in to_text(commit_diff, errors="surrogate_or_strict").split("\n"):
+        marker = line[:1]
+        if marker == "+":
+            summary["added"] += 1
+        elif marker == "-":
+            summary["removed"] += 1
+        elif marker == "#":
+            summary["modified"] += 1
+    return summary
+
+
 def load_config(
     module,
     command_filter,
@@ -518,18 +665,33 @@ def load_config(
     running=None,
     nc_get_filter=None,
     label=None,
+    diff_summary=False,
 ):
+    """ Load `command_filter` on the device and return the diff
+
+    With `diff_summary`, a (diff, summary) tuple is returned, the summary
+    counts the lines added, removed and modified by the on-box commit
+    diff. It is None when the connection does not support it.
+    """
 
     conn = get_connection(module)
 
-    diff = None
+    diff = summary = None
     if is_netconf(module):
         # FIXME: check for platform behaviour and restore this
         # conn.lock(target = 'candidate')
         # conn.discard_changes()
 
+        filters = to_list(command_filter)
+        if len(filters) > 1:
+            try:
+                filters = [merge_xml_configs(filters)]
+            except ValueError:
+                # keep the order of conflicting edits
+                pass
+
         try:
-            for filter in to_list(command_filter):
+            for filter in filters:
                 conn.edit_config(config=filter, remove_ns=True)
 
             candidate = get_config(
@@ -558,6 +720,15 @@ def load_config(
                         " and rerun task" % label
                     )
 
+            kwargs = {}
+            operations = get_capabilities(module).get("device_operations", {})
+            if operations.get("supports_commit_diff"):
+                # The IOS XR commit diff is only fetched in diff mode.
+                # See plugins/cliconf/iosxr.py for this key set: show_commit_config_diff
+                kwargs["diff"] = bool(module._diff)
+                if diff_summary and not module._diff:
+                    kwargs["diff"] = "summary"
+
             response = conn.edit_config(
                 candidate=command_filter,
                 commit=commit,
@@ -566,27 +737,70 @@ def load_config(
                 replace=replace,
                 comment=comment,
                 label=label,
+                **kwargs
             )
-            if module._diff:
-                diff = response.get("diff")
-
-            # Overwrite the default diff by the IOS XR commit diff.
-            # See plugins/cliconf/iosxr.py for this key set: show_commit_config_diff
             diff = response.get("show_commit_config_diff")
+            summary = response.get("commit_diff_summary")
+            if summary is None and diff is not None:
+                summary = summarize_commit_diff(diff)
 
         except ConnectionError as exc:
             module.fail_json(msg=to_text(exc, errors="surrogate_then_replace"))
 
+    if diff_summary:
+        return diff, summary
     return diff
 
 
-def run_commands(module, commands, check_rc=True):
+def parse_xml_output(output):
+    """ The output of a `| xml` command parsed into an lxml element
+
+    The output is fed to the parser in pieces of XML_FEED_SIZE
+    characters, the tree is built as they come in.
+    """
+    parser = etree.XMLParser(remove_blank_text=True)
+    start = 0
+    while start < len(output):
+        end = start + XML_FEED_SIZE
+        parser.feed(output[start:end])
+        start = end
+    return parser.close()
+
+
+def run_commands(module, commands, check_rc=True, structured=False):
+    """ Run `commands` on the device and return their outputs
+
+    With `structured`, the outputs of the `| xml` commands are returned
+    as lxml elements instead of text, JSON outputs are always decoded.
+    """
     connection = get_connection(module)
     try:
-        return connection.run_commands(commands=commands, check_rc=check_rc)
+        responses = connection.run_commands(
+            commands=commands, check_rc=check_rc
+        )
     except ConnectionError as exc:
         module.fail_json(msg=to_text(exc))
 
+    if not structured:
+        return responses
+    if not HAS_XML:
+        module.fail_json(msg="lxml is not installed")
+
+    structured_responses = []
+    for cmd, response in zip(to_list(commands), responses):
+        if isinstance(cmd, dict):
+            cmd = cmd["command"]
+        if isinstance(response, string_types) and XML_OUTPUT_RE.search(cmd):
+            try:
+                response = parse_xml_output(response)
+            except etree.XMLSyntaxError as exc:
+                module.fail_json(
+                    msg="Failed to parse the output of %s as XML: %s"
+                    % (cmd, to_text(exc))
+                )
+        structured_responses.append(response)
+    return structured_responses
+
 
 def copy_file(module, src, dst, proto="scp"):
     conn = get_connection(module)
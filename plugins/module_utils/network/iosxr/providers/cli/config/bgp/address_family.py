@@ -15,6 +15,8 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.provider
     CliProvider,
 )
 
+_REDISTRIBUTE_RE = re.compile(r"redistribute (\S+)(?:\s*)(\d*)")
+
 
 class AddressFamily(CliProvider):
     def render(self, config=None):
@@ -23,16 +25,14 @@ class AddressFamily(CliProvider):
 
         router_context = "router bgp %s" % self.get_value("config.bgp_as")
         context_config = None
+        contexts = self.get_config_contexts(config, router_context, indent=1)
 
         for item in self.get_value("config.address_family"):
             context = "address-family %s %s" % (item["afi"], item["safi"])
             context_commands = list()
 
             if config:
-                context_path = [router_context, context]
-                context_config = self.get_config_context(
-                    config, context_path, indent=1
-                )
+                context_config = contexts.get(context)
 
             for key, value in iteritems(item):
                 if value is not None:
@@ -50,16 +50,17 @@ class AddressFamily(CliProvider):
             safe_list.append(context)
 
         if config:
-            resp = self._negate_config(config, safe_list)
+            resp = self._negate_config(contexts, safe_list)
             commands.extend(resp)
 
         return commands
 
-    def _negate_config(self, config, safe_list=None):
+    def _negate_config(self, contexts, safe_list=None):
         commands = list()
-        matches = re.findall(r"(address-family .+)$", config, re.M)
-        for item in set(matches).difference(safe_list):
-            commands.append("no %s" % item)
+        safe_list = set(safe_list or ())
+        for item in contexts:
+            if item.startswith("address-family ") and item not in safe_list:
+                commands.append("no %s" % item)
         return commands
 
     def _render_networks(self, item, config=None):
@@ -81,9 +82,13 @@ class AddressFamily(CliProvider):
                 commands.append(cmd)
 
         if config and self.params["operation"] == "replace":
-            matches = re.findall(r"network (\S+)", config, re.M)
-            for entry in set(matches).difference(safe_list):
-                commands.append("no network %s" % entry)
+            safe_list = set(safe_list)
+            for line in sorted(config):
+                words = line.split()
+                if words[0] == "network" and len(words) > 1:
+                    if words[1] not in safe_list:
+                        safe_list.add(words[1])
+                        commands.append("no network %s" % words[1])
 
         return commands
 
@@ -118,12 +123,13 @@ class AddressFamily(CliProvider):
 
         if self.params["operation"] == "replace":
             if config:
-                matches = re.findall(
-                    r"redistribute (\S+)(?:\s*)(\d*)", config, re.M
-                )
-                for i in range(0, len(matches)):
-                    matches[i] = " ".join(matches[i]).strip()
-                for entry in set(matches).difference(safe_list):
-                    commands.append("no redistribute %s" % entry)
+                safe_list = set(safe_list)
+                for line in sorted(config):
+                    match = _REDISTRIBUTE_RE.match(line)
+                    if match:
+                        entry = " ".join(match.groups()).strip()
+                        if entry not in safe_list:
+                            safe_list.add(entry)
+                            commands.append("no redistribute %s" % entry)
 
         return commands
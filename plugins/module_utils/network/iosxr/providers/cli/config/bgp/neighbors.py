@@ -5,7 +5,6 @@
 from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
-import re
 import socket
 
 from ansible.module_utils.six import iteritems
@@ -24,6 +23,7 @@ class Neighbors(CliProvider):
 
         router_context = "router bgp %s" % self.get_value("config.bgp_as")
         context_config = None
+        contexts = self.get_config_contexts(config, router_context, indent=1)
 
         for item in self.get_value("config.neighbors"):
             context_commands = list()
@@ -37,10 +37,7 @@ class Neighbors(CliProvider):
                 context = "neighbor-group %s" % neighbor
 
             if config:
-                context_path = [router_context, context]
-                context_config = self.get_config_context(
-                    config, context_path, indent=1
-                )
+                context_config = contexts.get(context)
 
             for key, value in iteritems(item):
                 if value is not None:
@@ -58,15 +55,16 @@ class Neighbors(CliProvider):
             safe_list.append(context)
 
         if config and safe_list:
-            commands.extend(self._negate_config(config, safe_list))
+            commands.extend(self._negate_config(contexts, safe_list))
 
         return commands
 
-    def _negate_config(self, config, safe_list=None):
+    def _negate_config(self, contexts, safe_list=None):
         commands = list()
-        matches = re.findall(r"(neighbor \S+)", config, re.M)
-        for item in set(matches).difference(safe_list):
-            commands.append("no %s" % item)
+        safe_list = set(safe_list or ())
+        for item in contexts:
+            if item.startswith("neighbor ") and item not in safe_list:
+                commands.append("no %s" % item)
         return commands
 
     def _render_remote_as(self, item, config=None):
@@ -84,12 +84,15 @@ class Provider(CliProvider):
                 config = None
 
             context_commands = list()
+            context_config = None
+            if config and context:
+                context_config = self.get_config_lines(config, context)
 
             for key, value in iteritems(self.get_value("config")):
                 if value is not None:
                     meth = getattr(self, "_render_%s" % key, None)
                     if meth:
-                        resp = meth(config)
+                        resp = meth(config, context_config)
                         if resp:
                             context_commands.extend(to_list(resp))
 
@@ -100,27 +103,28 @@ class Provider(CliProvider):
 
         return commands
 
-    def _render_router_id(self, config=None):
+    def _render_router_id(self, config=None, context_config=None):
         cmd = "bgp router-id %s" % self.get_value("config.router_id")
-        if not config or cmd not in config:
+        if not context_config or cmd not in context_config:
             return cmd
 
-    def _render_log_neighbor_changes(self, config=None):
+    def _render_log_neighbor_changes(self, config=None, context_config=None):
         cmd = "bgp log neighbor changes"
         log_neighbor_changes = self.get_value("config.log_neighbor_changes")
+        detail = "%s detail" % cmd
         if log_neighbor_changes is True:
-            if not config or cmd not in config:
-                return "%s detail" % cmd
+            if not context_config or detail not in context_config:
+                return detail
         elif log_neighbor_changes is False:
-            if config and cmd in config:
+            if context_config and detail in context_config:
                 return "%s disable" % cmd
 
-    def _render_neighbors(self, config):
+    def _render_neighbors(self, config, context_config=None):
         """ generate bgp neighbor configuration
         """
         return Neighbors(self.params).render(config)
 
-    def _render_address_family(self, config):
+    def _render_address_family(self, config, context_config=None):
         """ generate address-family configuration
         """
         return AddressFamily(self.params).render(config)
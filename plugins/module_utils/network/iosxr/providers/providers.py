@@ -7,6 +7,7 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 import json
 
+from collections import OrderedDict
 from threading import RLock
 
 from ansible.module_utils.six import itervalues
@@ -18,6 +19,13 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.c
 )
 
 
+def _child_lines(obj):
+    """ The set of the direct child lines of `obj`, with their
+    whitespace normalized
+    """
+    return set(" ".join(child.text.split()) for child in obj._children)
+
+
 _registered_providers = {}
 _provider_lock = RLock()
 
@@ -101,6 +109,34 @@ class CliProvider(ProviderBase):
                 config = None
             return config
 
+    def get_config_lines(self, config, path, indent=1):
+        """ The set of the lines directly under `path` in `config`, for
+        exact membership tests of the commands to render
+        """
+        if config is not None:
+            netcfg = NetworkConfig(indent=indent, contents=config)
+            obj = netcfg.get_object(to_list(path))
+            if obj is not None:
+                return _child_lines(obj)
+        return set()
+
+    def get_config_contexts(self, config, path, indent=1):
+        """ The lines of every child context of `path` in `config`
+
+        `config` is parsed once and the returned dict maps the text of
+        each direct child of `path` to the set of the lines directly
+        under it.
+        """
+        contexts = OrderedDict()
+        if config is not None:
+            netcfg = NetworkConfig(indent=indent, contents=config)
+            parent = netcfg.get_object(to_list(path))
+            if parent is not None:
+                for child in parent._children:
+                    if child.text not in contexts:
+                        contexts[child.text] = _child_lines(child)
+        return contexts
+
     def render(self, config=None):
         raise NotImplementedError(self.__class__.__name__)
 
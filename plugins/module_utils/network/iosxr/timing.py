@@ -0,0 +1,302 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Opt-in wall clock timings of a module run, returned under the
+`timing` key of the module result.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import time
+
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from ansible.module_utils.connection import ConnectionError
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible.module_utils.six import iteritems, string_types
+from ansible.module_utils.common._collections_compat import Mapping
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.network import (
+    get_resource_connection,
+)
+
+# Set to a true value to return the timings of a resource module run
+# under the `timing` key of its result.
+TIMING_ENV = "ANSIBLE_IOSXR_TIMING"
+
+_clock = getattr(time, "perf_counter", time.time)
+
+# Bucket charged with the module time not spent in a nested phase
+_STATE_PHASES = {
+    "merged": "diff",
+    "replaced": "diff",
+    "overridden": "diff",
+    "deleted": "diff",
+    "rendered": "render",
+}
+
+
+def timing_enabled():
+    return boolean(os.environ.get(TIMING_ENV, False), strict=False)
+
+
+def _size(value):
+    """ Number of characters sent or received for `value`
+    """
+    if value is None:
+        return 0
+    if isinstance(value, string_types):
+        return len(value)
+    if isinstance(value, Mapping):
+        return _size(value.get("command"))
+    if isinstance(value, (list, tuple)):
+        return sum(_size(item) for item in value)
+    return len(str(value))
+
+
+class _NullPhase(object):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class NullTiming(object):
+    """ Stand-in used while timing is disabled, every call is a no-op
+    """
+
+    enabled = False
+    edited = False
+
+    _phase = _NullPhase()
+
+    def phase(self, name):
+        return self._phase
+
+    def command(self, command, elapsed, size):
+        pass
+
+    def finish(self, result):
+        return result
+
+
+NULL_TIMING = NullTiming()
+_current = NULL_TIMING
+
+
+class Timing(object):
+    """ Exclusive wall time per phase and per CLI command
+
+    Phases nest: while an inner phase runs the outer one is paused, so a
+    phase only accounts for the time not spent in the phases it
+    contains. At most `max_commands` commands are kept, the number of
+    commands left out is reported as `dropped_commands`.
+    """
+
+    enabled = True
+
+    def __init__(self, max_commands=None):
+        self.phases = OrderedDict()
+        self.commands = []
+        self.dropped = 0
+        self.max_commands = max_commands
+        self.edited = False
+        self._stack = []
+        self._mark = _clock()
+
+    def _charge(self):
+        now = _clock()
+        if self._stack:
+            name = self._stack[-1]
+            self.phases[name] = self.phases.get(name, 0.0) + now - self._mark
+        self._mark = now
+
+    def push(self, name):
+        self._charge()
+        self._stack.append(name)
+
+    def pop(self):
+        self._charge()
+        return self._stack.pop()
+
+    @contextmanager
+    def phase(self, name):
+        self.push(name)
+        try:
+            yield self
+        finally:
+            self.pop()
+
+    def command(self, command, elapsed, size):
+        """ Record a command sent to the device, the `elapsed` seconds
+        until its response came back and the `size` of that response
+        """
+        if (
+            self.max_commands is not None
+            and len(self.commands) >= self.max_commands
+        ):
+            self.dropped += 1
+            return
+        self.commands.append(
+            {
+                "command": command,
+                "phase": self._stack[-1] if self._stack else None,
+                "elapsed": round(elapsed, 6),
+                "bytes": size,
+            }
+        )
+
+    def to_dict(self):
+        timing = {
+            "phases": dict(
+                (name, round(elapsed, 6))
+                for name, elapsed in iteritems(self.phases)
+            ),
+            "commands": list(self.commands),
+        }
+        if self.dropped:
+            timing["dropped_commands"] = self.dropped
+        return timing
+
+
+class TimedConnection(object):
+    """ Proxy to the persistent connection recording the round trip
+    time and size of the commands sent from the module
+    """
+
+    def __init__(self, connection, timing):
+        self._connection = connection
+        self._timing = timing
+
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+    def _call(self, phase, command, method, *args, **kwargs):
+        with self._timing.phase(phase):
+            start = _clock()
+            response = getattr(self._connection, method)(*args, **kwargs)
+            self._timing.command(command, _clock() - start, _size(response))
+        return response
+
+    def _fetch_phase(self):
+        return "post_facts" if self._timing.edited else "fetch"
+
+    def get(self, *args, **kwargs):
+        command = kwargs.get("command", args[0] if args else None)
+        return self._call(self._fetch_phase(), command, "get", *args, **kwargs)
+
+    def get_config(self, *args, **kwargs):
+        return self._call(
+            self._fetch_phase(), "get_config", "get_config", *args, **kwargs
+        )
+
+    def run_commands(self, *args, **kwargs):
+        commands = kwargs.get("commands", args[0] if args else None)
+        if isinstance(commands, (list, tuple)):
+            command = "; ".join(
+                item["command"] if isinstance(item, Mapping) else item
+                for item in commands
+            )
+        else:
+            command = commands
+        return self._call(
+            self._fetch_phase(), command, "run_commands", *args, **kwargs
+        )
+
+    def edit_config(self, *args, **kwargs):
+        candidate = kwargs.get("candidate", args[0] if args else None)
+        with self._timing.phase("edit_config"):
+            start = _clock()
+            try:
+                response = self._connection.edit_config(*args, **kwargs)
+            finally:
+                self._timing.edited = True
+            self._timing.command(
+                "edit_config", _clock() - start, _size(candidate)
+            )
+        return response
+
+
+class ModuleTiming(Timing):
+    """ Timings of a resource module run
+
+    The module connection is wrapped in a `TimedConnection` and the
+    cliconf plugin is asked to record its own timings, which are
+    returned under `cliconf`. When the module fails they are still
+    collected and returned with the failure, so the cliconf plugin
+    never keeps recording for the next module of the connection.
+    """
+
+    def __init__(self, module):
+        super(ModuleTiming, self).__init__()
+        self._start = self._mark
+        self._connection = None
+        state = module.params.get("state")
+        self.push(_STATE_PHASES.get(state, "other"))
+        if state in ("rendered", "parsed"):
+            return
+
+        connection = get_resource_connection(module)
+        module._connection = TimedConnection(connection, self)
+        try:
+            connection.start_timing()
+        except ConnectionError:
+            # not supported by this connection plugin
+            return
+        self._connection = connection
+
+        fail_json = module.fail_json
+
+        def fail_with_timing(*args, **kwargs):
+            if args:
+                kwargs["msg"] = args[0]
+            return fail_json(**self.finish(kwargs))
+
+        module.fail_json = fail_with_timing
+
+    def finish(self, result):
+        """ Stop the timers and add the timings to `result`
+        """
+        global _current
+
+        while self._stack:
+            self.pop()
+        timing = self.to_dict()
+        timing["total"] = round(self._mark - self._start, 6)
+        connection, self._connection = self._connection, None
+        if connection is not None:
+            try:
+                timing["cliconf"] = connection.get_timing()
+            except ConnectionError:
+                pass
+        if _current is self:
+            _current = NULL_TIMING
+        result["timing"] = timing
+        return result
+
+
+def start_timing(module):
+    """ Start timing the run of `module` when TIMING_ENV is set
+
+    :returns: the timing of the run, call its `finish` method with the
+              module result to add the timings to it
+    """
+    global _current
+
+    if timing_enabled():
+        _current = ModuleTiming(module)
+    else:
+        _current = NULL_TIMING
+    return _current
+
+
+def get_timing():
+    """ The timing of the module run in progress
+    """
+    return _current
@@ -9,11 +9,33 @@
 from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
+import os
+import re
+
+from collections import OrderedDict
+from functools import wraps
+
 from ansible.module_utils._text import to_text
 from ansible_collections.ansible.netcommon.plugins.module_utils.compat import (
     ipaddress,
 )
 from ansible.module_utils.six import iteritems
+from ansible.module_utils.common.validation import (
+    check_type_bool,
+    check_type_dict,
+    check_type_float,
+    check_type_int,
+    check_type_list,
+    check_type_raw,
+    check_type_str,
+)
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
+    utils as common_utils,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.timing import (
+    get_timing,
+)
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     dict_diff,
     is_masklen,
@@ -21,51 +43,91 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
     search_obj_in_list,
 )
 
+# Set to a true value to run the full argspec validation on facts parsed
+# from the device instead of the type coercion fast path.
+VALIDATE_FACTS_ENV = "ANSIBLE_IOSXR_VALIDATE_FACTS"
+
+_TYPE_CHECKERS = {
+    "str": check_type_str,
+    "int": check_type_int,
+    "bool": check_type_bool,
+    "float": check_type_float,
+    "list": check_type_list,
+    "dict": check_type_dict,
+    "raw": check_type_raw,
+}
+
+
+class CommandBuilder(object):
+    """ Ordered collection of config commands grouped by parent context
+
+    Commands are stored per parent context (for example
+    ``interface GigabitEthernet0/0/0/1``) in the order the contexts are
+    first seen. Membership tests are dict/set lookups and duplicate
+    commands within a context are dropped, so the flat command list is
+    rendered once by :meth:`to_list` instead of being rebuilt and
+    de-duplicated after every insertion.
+    """
 
-def remove_command_from_config_list(interface, cmd, commands):
-    # To delete the passed config
-    if interface not in commands:
-        commands.insert(0, interface)
-    commands.append("no %s" % cmd)
-    return commands
-
-
-def add_command_to_config_list(interface, cmd, commands):
-    # To set the passed config
-    if interface not in commands:
-        commands.insert(0, interface)
-    commands.append(cmd)
+    def __init__(self):
+        self._commands = OrderedDict()
+        self._seen = {}
+
+    def add(self, context, cmd):
+        """ Add `cmd` under `context` unless it is already present
+        """
+        seen = self._seen.get(context)
+        if seen is None:
+            seen = self._seen[context] = set()
+            self._commands[context] = []
+        if cmd not in seen:
+            seen.add(cmd)
+            self._commands[context].append(cmd)
+
+    def remove(self, context, cmd):
+        """ Add the negated form of `cmd` under `context`
+        """
+        self.add(context, "no %s" % cmd)
+
+    def __contains__(self, context):
+        return context in self._commands
+
+    def __len__(self):
+        return len(self._commands)
+
+    def to_list(self):
+        """ Render the commands as a flat list, each group of commands
+        preceded by its parent context
+        """
+        commands = []
+        for context, cmds in iteritems(self._commands):
+            if context:
+                commands.append(context)
+            commands.extend(cmds)
+        return commands
+
+
+def _freeze(value):
+    """ Return a hashable copy of `value` where dicts become key sorted
+    tuples of their non-None items and lists become tuples
+    """
+    if isinstance(value, dict):
+        return tuple(
+            sorted(
+                (k, _freeze(v)) for k, v in iteritems(value) if v is not None
+            )
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
 
 
 def dict_to_set(sample_dict):
-    # Generate a set with passed dictionary for comparison
-    test_dict = {}
+    # Generate a set with passed dictionary for comparison, the passed
+    # dictionary is not modified
     if isinstance(sample_dict, dict):
-        for k, v in iteritems(sample_dict):
-            if v is not None:
-                if isinstance(v, list):
-                    if isinstance(v[0], dict):
-                        li = []
-                        for each in v:
-                            for key, value in iteritems(each):
-                                if isinstance(value, list):
-                                    each[key] = tuple(value)
-                            li.append(tuple(iteritems(each)))
-                        v = tuple(li)
-                    else:
-                        v = tuple(v)
-                elif isinstance(v, dict):
-                    li = []
-                    for key, value in iteritems(v):
-                        if isinstance(value, list):
-                            v[key] = tuple(value)
-                    li.extend(tuple(iteritems(v)))
-                    v = tuple(li)
-                test_dict.update({k: v})
-        return_set = set(tuple(iteritems(test_dict)))
-    else:
-        return_set = set(sample_dict)
-    return return_set
+        return frozenset(_freeze(sample_dict))
+    return frozenset(sample_dict)
 
 
 def filter_dict_having_none_value(want, have):
@@ -136,17 +198,110 @@ def filter_dict_having_none_value(want, have):
     return test_dict
 
 
-def remove_duplicate_interface(commands):
-    # Remove duplicate interface from commands
-    set_cmd = []
-    for each in commands:
-        if "interface" in each:
-            if each not in set_cmd:
-                set_cmd.append(each)
+def _coerce_value(option, value):
+    wanted = option.get("type", "str")
+    checker = _TYPE_CHECKERS.get(wanted)
+    if checker:
+        value = checker(value)
+    if wanted == "list":
+        elements = option.get("elements")
+        if elements:
+            element_option = {
+                "type": elements,
+                "options": option.get("options"),
+            }
+            value = [
+                _coerce_value(element_option, each)
+                if each is not None
+                else each
+                for each in value
+            ]
         else:
-            set_cmd.append(each)
+            value = list(value)
+    elif wanted == "dict" and option.get("options"):
+        value = _coerce_options(option["options"], value)
+    return value
+
 
-    return set_cmd
+def _coerce_options(spec, params):
+    result = {}
+    for key, value in iteritems(params):
+        option = spec.get(key)
+        if option is not None and value is not None:
+            value = _coerce_value(option, value)
+        result[key] = value
+    for key, option in iteritems(spec):
+        if key not in result:
+            result[key] = option.get("default")
+    return result
+
+
+def validate_config(spec, data):
+    """ Validate facts parsed from the device against the argspec
+
+    Data rendered from the device configuration is trusted, so values are
+    only coerced to their option types and defaults are filled in, the
+    same way AnsibleModule would do it, without building an AnsibleModule
+    over the whole tree. The full validation runs when the
+    ANSIBLE_IOSXR_VALIDATE_FACTS environment variable is set to a true
+    value or when a value cannot be coerced.
+
+    :param spec: Ansible argument spec
+    :param data: Data to be validated
+    :returns: the validated data
+    """
+    with get_timing().phase("validate"):
+        if boolean(os.environ.get(VALIDATE_FACTS_ENV, False), strict=False):
+            return common_utils.validate_config(spec, data)
+        try:
+            return _coerce_options(spec, data)
+        except (TypeError, ValueError):
+            return common_utils.validate_config(spec, data)
+
+
+_FACTS_SKELETONS = {}
+
+
+def facts_skeleton(argument_spec, subspec="config", options="options"):
+    """ Return the facts tree generated from `argument_spec`
+
+    The tree is generated once per argspec and then served from a
+    module level cache, so it must be treated as read only. Use
+    :func:`copy_skeleton` to get an entry that can be populated.
+
+    :param argument_spec: The resource module argspec
+    :param subspec: The argspec key holding the facts options
+    :param options: The options key below `subspec`
+    :rtype: dictionary
+    :returns: The cached facts tree
+    """
+    key = (id(argument_spec), subspec, options)
+    skeleton = _FACTS_SKELETONS.get(key)
+    if skeleton is None:
+        spec = argument_spec
+        if subspec:
+            spec = spec[subspec]
+            if options:
+                spec = spec[options]
+        skeleton = _FACTS_SKELETONS[key] = common_utils.generate_dict(spec)
+    return skeleton
+
+
+def copy_skeleton(skeleton):
+    """ Copy a facts tree generated by :func:`facts_skeleton`
+
+    Only the nested dicts (and default lists) are copied, the leaves
+    are None or immutable defaults, which makes this much cheaper than
+    a deepcopy for every rendered entry.
+    """
+    config = {}
+    for key, value in iteritems(skeleton):
+        if isinstance(value, dict):
+            value = copy_skeleton(value)
+        elif isinstance(value, list):
+            value = list(value)
+        config[key] = value
+    return config
 
 
 def flatten_dict(x):
@@ -265,82 +420,158 @@ def validate_n_expand_ipv4(module, want):
     return ip_addr_want
 
 
+# Interface types known to IOS XR with the (lower case) abbreviations of
+# their name. A name is of a type when the letters before its number are
+# one of these abbreviations or a longer part of the full type name, so
+# ServiceInfra1 is not mistaken for a Serial interface ("se") and
+# FourHundredGigE for FortyGigE ("fo").
+INTERFACE_TYPES = (
+    ("GigabitEthernet", ("gi",)),
+    ("FastEthernet", ("fa",)),
+    ("TenGigE", ("te",)),
+    ("TwentyFiveGigE", ("twe", "tf")),
+    ("FortyGigE", ("fo",)),
+    ("FiftyGigE", ("fi",)),
+    ("HundredGigE", ("hu",)),
+    ("TwoHundredGigE", ("twohundredgige", "th")),
+    ("FourHundredGigE", ("fourhundredgige", "fh")),
+    ("Ethernet", ("et",)),
+    ("Vlan", ("vl",)),
+    ("Loopback", ("lo",)),
+    ("Bundle-Ether", ("be", "bundle-ether")),
+    ("Bundle-POS", ("bp", "bundle-pos")),
+    ("BVI", ("bv",)),
+    ("tunnel-te", ("tt", "tunnel-te")),
+    ("tunnel-ip", ("ti", "tunnel-ip")),
+    ("Null", ("nu",)),
+    ("nve", ("nv",)),
+    ("POS", ("pos",)),
+    ("Serial", ("se",)),
+)
+
+
+def _interface_prefixes():
+    prefixes = {}
+    for if_type, abbreviations in INTERFACE_TYPES:
+        full = if_type.lower()
+        for abbreviation in abbreviations + (full,):
+            prefixes.setdefault(abbreviation, if_type)
+            if full.startswith(abbreviation):
+                for end in range(len(abbreviation) + 1, len(full)):
+                    prefixes.setdefault(full[:end], if_type)
+    return prefixes
+
+
+_INTERFACE_PREFIX_MAP = _interface_prefixes()
+# The letters of a name, up to its number
+_INTERFACE_PREFIX_RE = re.compile(r"[a-z][a-z-]*(?=[\d\s]|$)", re.I)
+_INTERFACE_NUMBER_RE = re.compile(r"[\d/.]+")
+_INTERFACE_CACHE_SIZE = 16384
+
+
+def _memoize_interface(func):
+    """ Memoize a single argument interface name helper. The cache is
+    bounded and simply reset once full.
+    """
+    cache = {}
+
+    @wraps(func)
+    def wrapper(name):
+        try:
+            return cache[name]
+        except KeyError:
+            pass
+        if len(cache) >= _INTERFACE_CACHE_SIZE:
+            cache.clear()
+        result = cache[name] = func(name)
+        return result
+
+    return wrapper
+
+
+def _match_interface_type(name):
+    match = _INTERFACE_PREFIX_RE.match(name)
+    if match:
+        return _INTERFACE_PREFIX_MAP.get(match.group(0).lower())
+
+
+@_memoize_interface
 def normalize_interface(name):
     """Return the normalized interface name
     """
     if not name:
         return
 
-    def _get_number(name):
-        digits = ""
-        for char in name:
-            if char.isdigit() or char in "/.":
-                digits += char
-        return digits
-
-    if name.lower().startswith("gi"):
-        if_type = "GigabitEthernet"
-    elif name.lower().startswith("fa"):
-        if_type = "FastEthernet"
-    elif name.lower().startswith("fo"):
-        if_type = "FortyGigE"
-    elif name.lower().startswith("te"):
-        if_type = "TenGigE"
-    elif name.lower().startswith("twe"):
-        if_type = "TwentyFiveGigE"
-    elif name.lower().startswith("hu"):
-        if_type = "HundredGigE"
-    elif name.lower().startswith("vl"):
-        if_type = "Vlan"
-    elif name.lower().startswith("lo"):
-        if_type = "Loopback"
-    elif name.lower().startswith("be"):
-        if_type = "Bundle-Ether"
-    elif name.lower().startswith("bp"):
-        if_type = "Bundle-POS"
-    else:
-        if_type = None
+    if_type = _match_interface_type(name)
+    if not if_type:
+        return name
 
     number_list = name.split(" ")
     if len(number_list) == 2:
         number = number_list[-1].strip()
     else:
-        number = _get_number(name)
-
-    if if_type:
-        proper_interface = if_type + number
-    else:
-        proper_interface = name
+        number = "".join(_INTERFACE_NUMBER_RE.findall(name))
 
-    return proper_interface
+    return if_type + number
 
 
+@_memoize_interface
 def get_interface_type(interface):
     """Gets the type of interface
     """
-
-    if interface.upper().startswith("GI"):
-        return "GigabitEthernet"
-    elif interface.upper().startswith("FA"):
-        return "FastEthernet"
-    elif interface.upper().startswith("FO"):
-        return "FortyGigE"
-    elif interface.upper().startswith("ET"):
-        return "Ethernet"
-    elif interface.upper().startswith("LO"):
-        return "Loopback"
-    elif interface.upper().startswith("BE"):
-        return "Bundle-Ether"
-    elif interface.upper().startswith("NV"):
-        return "nve"
-    elif interface.upper().startswith("TWE"):
-        return "TwentyFiveGigE"
-    elif interface.upper().startswith("HU"):
-        return "HundredGigE"
-    elif interface.upper().startswith("PRE"):
+    if interface[:3].lower() == "pre":
         return "preconfigure"
-    else:
-        return "unknown"
+    return _match_interface_type(interface) or "unknown"
+
+
+def parse_interface_commands(lines):
+    """ Tokenize the lines of an interface block of the running-config
+
+    The lines are walked once and indexed by their leading keyword,
+    so every field lookup done with the helpers below only looks at
+    the few lines starting with that keyword.
+
+    :param lines: The lines of the block, without the header line
+    :rtype: dictionary
+    :returns: The stripped command lines keyed by leading keyword
+    """
+    commands = {}
+    for line in lines:
+        line = line.strip()
+        if line and line != "!":
+            commands.setdefault(line.split(None, 1)[0], []).append(line)
+    return commands
+
+
+def get_command_arg(commands, command):
+    """ Return the argument of the first `command` line of a block
+    tokenized by `parse_interface_commands`, or None
+    """
+    prefix = command + " "
+    start = len(prefix)
+    for line in commands.get(command.split(" ", 1)[0], ()):
+        if line.startswith(prefix):
+            return line[start:].strip()
+
+
+def get_command_args(commands, command):
+    """ Return the arguments of all the `command` lines of a block
+    tokenized by `parse_interface_commands`
+    """
+    prefix = command + " "
+    start = len(prefix)
+    return [
+        line[start:].strip()
+        for line in commands.get(command.split(" ", 1)[0], ())
+        if line.startswith(prefix)
+    ]
+
+
+def has_command(commands, command):
+    """ Check if a block tokenized by `parse_interface_commands`
+    has the exact `command` line
+    """
+    return command in commands.get(command.split(" ", 1)[0], ())
 
 
 def isipaddress(data):
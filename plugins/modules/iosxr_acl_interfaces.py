@@ -619,6 +619,9 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.config.acl_interfaces.acl_interfaces import (
     Acl_interfaces,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.timing import (
+    start_timing,
+)
 
 
 def main():
@@ -643,8 +646,9 @@ def main():
         supports_check_mode=True,
     )
 
+    timing = start_timing(module)
     result = Acl_interfaces(module).execute_module()
-    module.exit_json(**result)
+    module.exit_json(**timing.finish(result))
 
 
 if __name__ == "__main__":
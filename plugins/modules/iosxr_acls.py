@@ -1421,6 +1421,9 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.config.acls.acls import (
     Acls,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.timing import (
+    start_timing,
+)
 
 
 def main():
@@ -1443,8 +1446,9 @@ def main():
         supports_check_mode=True,
     )
 
+    timing = start_timing(module)
     result = Acls(module).execute_module()
-    module.exit_json(**result)
+    module.exit_json(**timing.finish(result))
 
 
 if __name__ == "__main__":
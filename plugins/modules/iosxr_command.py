@@ -64,6 +64,8 @@ options:
     - Specifies the number of retries a command should by tried before it is considered
       failed. The command is run on the target device every retry and evaluated against
       the I(wait_for) conditions.
+    - Only the commands whose output is read by a condition that is not satisfied
+      yet are run again on a retry.
     default: 10
     type: int
   interval:
@@ -73,6 +75,13 @@ options:
       long to wait before trying the command again.
     default: 1
     type: int
+  backoff:
+    description:
+    - Factor the interval is multiplied by after every retry, for an exponential
+      backoff between the retries. The default of 1 keeps the interval constant.
+    default: 1
+    type: float
+    version_added: 1.3.0
 """
 
 EXAMPLES = """
@@ -92,6 +101,16 @@ EXAMPLES = """
     - show interfaces
     - {command: example command that prompts, prompt: expected prompt, answer: yes}
 
+- name: wait for a BGP session to come up, doubling the interval between retries
+  cisco.iosxr.iosxr_command:
+    commands:
+    - show version
+    - show bgp summary
+    wait_for:
+    - result[1] contains Established
+    retries: 6
+    backoff: 2
+
 - name: run multiple commands and evaluate the output
   cisco.iosxr.iosxr_command:
     commands:
@@ -119,6 +138,7 @@ failed_conditions:
   type: list
   sample: ['...', '...']
 """
+import re
 import time
 
 from ansible.module_utils._text import to_text
@@ -135,6 +155,22 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr im
 )
 
 
+_RESULT_INDEX_RE = re.compile(r"result\[(\d+)\]")
+
+
+def conditional_commands(conditionals, count):
+    """ Indexes of the commands whose output is read by `conditionals`,
+    all the `count` commands when one of them reads the whole result
+    """
+    indexes = set()
+    for item in conditionals:
+        match = _RESULT_INDEX_RE.match(item.key)
+        if not match:
+            return list(range(count))
+        indexes.add(int(match.group(1)))
+    return sorted(index for index in indexes if index < count)
+
+
 def parse_commands(module, warnings):
     commands = module.params["commands"]
     for item in list(commands):
@@ -159,6 +195,7 @@ def main():
         match=dict(default="all", choices=["all", "any"]),
         retries=dict(default=10, type="int"),
         interval=dict(default=1, type="int"),
+        backoff=dict(default=1, type="float"),
     )
 
     argument_spec.update(iosxr_argument_spec)
@@ -179,10 +216,15 @@ def main():
 
     retries = module.params["retries"]
     interval = module.params["interval"]
+    backoff = module.params["backoff"]
     match = module.params["match"]
 
+    responses = [None] * len(commands)
+    pending = list(range(len(commands)))
     while retries > 0:
-        responses = run_commands(module, commands)
+        outputs = run_commands(module, [commands[i] for i in pending])
+        for index, output in zip(pending, outputs):
+            responses[index] = output
 
         for item in list(conditionals):
             if item(responses):
@@ -194,7 +236,9 @@ def main():
         if not conditionals:
             break
 
+        pending = conditional_commands(conditionals, len(commands))
         time.sleep(interval)
+        interval *= backoff
         retries -= 1
 
     if conditionals:
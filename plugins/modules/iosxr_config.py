@@ -172,6 +172,14 @@ options:
       configuration changes until the exclusive session ends.
     type: bool
     default: false
+  diff_summary:
+    description:
+    - Returns the number of lines added, removed and modified by the commit, as reported
+      by the on-box commit diff, under C(commit_diff_summary). Outside of diff mode only
+      these counts are fetched from the device instead of the whole diff.
+    type: bool
+    default: false
+    version_added: 1.3.0
 """
 
 EXAMPLES = """
@@ -240,6 +248,11 @@ time:
   returned: when backup is yes
   type: str
   sample: "22:28:34"
+commit_diff_summary:
+  description: The number of lines added, removed and modified by the commit
+  returned: when diff_summary is yes and the configuration changed over network_cli
+  type: dict
+  sample: {"added": 2, "removed": 1, "modified": 1}
 """
 import re
 
@@ -393,7 +406,12 @@ def run(module, result):
             admin=admin,
             exclusive=exclusive,
             label=label,
+            diff_summary=module.params["diff_summary"],
         )
+        if module.params["diff_summary"]:
+            diff, summary = diff
+            if summary is not None:
+                result["commit_diff_summary"] = summary
         if diff:
             result["diff"] = dict(prepared=diff)
 
@@ -424,6 +442,7 @@ def main():
         admin=dict(type="bool", default=False),
         exclusive=dict(type="bool", default=False),
         label=dict(),
+        diff_summary=dict(type="bool", default=False),
     )
 
     argument_spec.update(iosxr_argument_spec)
@@ -309,11 +309,41 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr im
     etree_findall,
     etree_find,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    normalize_interface,
+)
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     conditional,
     remove_default_spec,
 )
 
+_INTERFACE_HEADER_RE = re.compile(r"^(\S+) is ", re.M)
+
+
+def intent_items(want):
+    """ The wanted interfaces with a state, tx_rate or rx_rate to verify
+    """
+    return [
+        item
+        for item in want
+        if item.get("state") in ("up", "down")
+        or item.get("tx_rate")
+        or item.get("rx_rate")
+    ]
+
+
+def split_show_interfaces(out):
+    """ Split the output of `show interfaces` into the block of each
+    interface, keyed by interface name
+    """
+    blocks = {}
+    headers = list(_INTERFACE_HEADER_RE.finditer(out))
+    ends = [header.start() for header in headers[1:]] + [len(out)]
+    for header, end in zip(headers, ends):
+        start = header.start()
+        blocks[header.group(1)] = out[start:end]
+    return blocks
+
 
 def validate_mtu(value):
     if value and not 64 <= int(value) <= 65535:
@@ -502,24 +532,49 @@ class CliConfiguration(ConfigBase):
                 self._result["diff"] = dict(prepared=diff)
             self._result["changed"] = True
 
+    def get_interfaces_state(self, names):
+        """ The `show interfaces` output of each interface in `names`
+
+        All the interfaces are read from a single `show interfaces` when
+        more than one is needed, the ones it does not list are then
+        requested by name in a single batch.
+        """
+        outputs = {}
+        if len(names) > 1:
+            out = run_commands(self._module, "show interfaces")[0]
+            for name, block in split_show_interfaces(out).items():
+                outputs[normalize_interface(name)] = block
+
+        missing = [
+            name for name in names if normalize_interface(name) not in outputs
+        ]
+        if missing:
+            commands = [
+                "show interfaces {0!s}".format(name) for name in missing
+            ]
+            responses = run_commands(self._module, commands)
+            for name, out in zip(missing, responses):
+                outputs[normalize_interface(name)] = out
+        return outputs
+
     def check_declarative_intent_params(self):
         failed_conditions = []
-        for want_item in self._want:
+        items = intent_items(self._want)
+        if not items:
+            return
+
+        if self._result["changed"]:
+            sleep(max(item["delay"] for item in items))
+
+        outputs = self.get_interfaces_state(
+            list(collections.OrderedDict.fromkeys(i["name"] for i in items))
+        )
+        for want_item in items:
             want_state = want_item.get("state")
             want_tx_rate = want_item.get("tx_rate")
             want_rx_rate = want_item.get("rx_rate")
-            if (
-                want_state not in ("up", "down")
-                and not want_tx_rate
-                and not want_rx_rate
-            ):
-                continue
-
-            if self._result["changed"]:
-                sleep(want_item["delay"])
 
-            command = "show interfaces {0!s}".format(want_item["name"])
-            out = run_commands(self._module, command)[0]
+            out = outputs[normalize_interface(want_item["name"])]
 
             if want_state in ("up", "down"):
                 match = re.search(r"%s (\w+)" % "line protocol is", out, re.M)
@@ -800,6 +855,12 @@ class NCConfiguration(ConfigBase):
 
     def check_declarative_intent_params(self):
         failed_conditions = []
+        items = intent_items(self._want)
+        if not items:
+            return
+
+        if self._result["changed"]:
+            sleep(max(item["delay"] for item in items))
 
         self._data_rate_meta.update(
             [
@@ -943,19 +1004,10 @@ class NCConfiguration(ConfigBase):
                 }
             )
 
-        for want_item in self._want:
+        for want_item in items:
             want_state = want_item.get("state")
             want_tx_rate = want_item.get("tx_rate")
             want_rx_rate = want_item.get("rx_rate")
-            if (
-                want_state not in ("up", "down")
-                and not want_tx_rate
-                and not want_rx_rate
-            ):
-                continue
-
-            if self._result["changed"]:
-                sleep(want_item["delay"])
 
             if want_state in ("up", "down"):
                 if want_state not in line_state_map[want_item["name"]]:
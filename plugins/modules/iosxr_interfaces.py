@@ -528,6 +528,9 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.config.interfaces.interfaces import (
     Interfaces,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.timing import (
+    start_timing,
+)
 
 
 def main():
@@ -550,8 +553,9 @@ def main():
         mutually_exclusive=mutually_exclusive,
     )
 
+    timing = start_timing(module)
     result = Interfaces(module).execute_module()
-    module.exit_json(**result)
+    module.exit_json(**timing.finish(result))
 
 
 if __name__ == "__main__":
@@ -657,6 +657,9 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.config.l2_interfaces.l2_interfaces import (
     L2_Interfaces,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.timing import (
+    start_timing,
+)
 
 
 def main():
@@ -679,8 +682,9 @@ def main():
         mutually_exclusive=mutually_exclusive,
     )
 
+    timing = start_timing(module)
     result = L2_Interfaces(module).execute_module()
-    module.exit_json(**result)
+    module.exit_json(**timing.finish(result))
 
 
 if __name__ == "__main__":
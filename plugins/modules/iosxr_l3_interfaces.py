@@ -640,6 +640,9 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.config.l3_interfaces.l3_interfaces import (
     L3_Interfaces,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.timing import (
+    start_timing,
+)
 
 
 def main():
@@ -663,8 +666,9 @@ def main():
         mutually_exclusive=mutually_exclusive,
     )
 
+    timing = start_timing(module)
     result = L3_Interfaces(module).execute_module()
-    module.exit_json(**result)
+    module.exit_json(**timing.finish(result))
 
 
 if __name__ == "__main__":
@@ -243,6 +243,7 @@ import collections
 from copy import deepcopy
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.six import iteritems
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr import (
     get_config,
     load_config,
@@ -274,6 +275,28 @@ severity_level = {
     "disable": "15",
 }
 
+LEVELS = (
+    "emergencies",
+    "alerts",
+    "critical",
+    "errors",
+    "warning",
+    "notifications",
+    "informational",
+    "debugging",
+)
+
+# One match per `logging` line of the running config: a destination with
+# its level, size or name, the facility, the hostname prefix or a host.
+LOGGING_RE = re.compile(
+    r"logging (?:"
+    r"(?P<dest>console|monitor|buffered|file) (?P<value>\S+)"
+    r"|facility (?P<facility>\S+)"
+    r"|hostnameprefix (?P<hostnameprefix>\S+)"
+    r"|(?P<host>\S+) vrf (?P<vrf>\S+)"
+    r")"
+)
+
 severity_transpose = {
     "emergencies": "emergency",
     "alerts": "alert",
@@ -383,11 +406,17 @@ class ConfigBase(object):
 class CliConfiguration(ConfigBase):
     def __init__(self, module):
         super(CliConfiguration, self).__init__(module)
-        self._file_list = set()
-        self._host_list = set()
+        self._have = dict()
 
     def map_obj_to_commands(self):
         commands = list()
+
+        have_size = self.have_value("buffered", "size")
+        have_console_level = self.have_value("console", "level")
+        have_monitor_level = self.have_value("monitor", "level")
+        have_prefix = self.have_value("hostnameprefix", "hostnameprefix")
+        have_facility = self.have_value("facility", "facility")
+
         for want_item in self._want:
             dest = want_item["dest"]
             name = want_item["name"]
@@ -399,32 +428,13 @@ class CliConfiguration(ConfigBase):
             state = want_item["state"]
             del want_item["state"]
 
-            have_size = None
-            have_console_level = None
-            have_monitor_level = None
-            have_prefix = None
-            have_facility = None
-
-            for item in self._have:
-                if item["dest"] == "buffered":
-                    have_size = item["size"]
-                if item["dest"] == "console":
-                    have_console_level = item["level"]
-                if item["dest"] == "monitor":
-                    have_monitor_level = item["level"]
-                if item["dest"] is None and item["hostnameprefix"] is not None:
-                    have_prefix = item["hostnameprefix"]
-                if (
-                    item["dest"] is None
-                    and item["hostnameprefix"] is None
-                    and item["facility"] is not None
-                ):
-                    have_facility = item["facility"]
+            have_host = ("host", name, vrf) in self._have
+            have_file = ("file", name, None) in self._have
 
             if state == "absent":
-                if dest == "host" and name in self._host_list:
+                if dest == "host" and have_host:
                     commands.append("no logging {0} vrf {1}".format(name, vrf))
-                elif dest == "file" and name in self._file_list:
+                elif dest == "file" and have_file:
                     commands.append("no logging file {0}".format(name))
                 elif dest == "console" and have_console_level is not None:
                     commands.append("no logging {0}".format(dest))
@@ -449,7 +459,7 @@ class CliConfiguration(ConfigBase):
                     commands.append("no logging facility {0}".format(facility))
 
             if state == "present":
-                if dest == "host" and name not in self._host_list:
+                if dest == "host" and not have_host:
                     if level == "errors" or level == "informational":
                         level = severity_transpose[level]
                     commands.append(
@@ -457,7 +467,7 @@ class CliConfiguration(ConfigBase):
                             name, vrf, level
                         )
                     )
-                elif dest == "file" and name not in self._file_list:
+                elif dest == "file" and not have_file:
                     if level == "errors" or level == "informational":
                         level = severity_transpose[level]
                     commands.append(
@@ -516,113 +526,55 @@ class CliConfiguration(ConfigBase):
                 self._result["diff"] = dict(prepared=diff)
             self._result["changed"] = True
 
-    def parse_facility(self, line):
-        match = re.search(r"logging facility (\S+)", line, re.M)
-        facility = None
-        if match:
-            facility = match.group(1)
-
-        return facility
-
-    def parse_size(self, line, dest):
-        size = None
-
-        if dest == "buffered":
-            match = re.search(r"logging buffered (\S+)", line, re.M)
-            if match:
-                try:
-                    int_size = int(match.group(1))
-                except ValueError:
-                    int_size = None
-
-                if int_size is not None:
-                    if isinstance(int_size, int):
-                        size = str(match.group(1))
-        return size
-
-    def parse_hostnameprefix(self, line):
-        prefix = None
-        match = re.search(r"logging hostnameprefix (\S+)", line, re.M)
-        if match:
-            prefix = match.group(1)
-        return prefix
-
-    def parse_name(self, line, dest):
-        name = None
-        if dest == "file":
-            match = re.search(r"logging file (\S+)", line, re.M)
-            if match:
-                name = match.group(1)
-        elif dest == "host":
-            match = re.search(r"logging (\S+)", line, re.M)
-            if match:
-                name = match.group(1)
-
-        return name
-
-    def parse_level(self, line, dest):
-        level_group = (
-            "emergencies",
-            "alerts",
-            "critical",
-            "errors",
-            "warning",
-            "notifications",
-            "informational",
-            "debugging",
-        )
-
-        level = None
-        match = re.search(r"logging {0} (\S+)".format(dest), line, re.M)
-        if match:
-            if match.group(1) in level_group:
-                level = match.group(1)
+    def have_value(self, dest, key):
+        item = self._have.get((dest, None, None))
+        return item[key] if item else None
 
-        return level
+    def parse_line(self, line):
+        """ The (dest, name, vrf) key and the attributes set by a
+        `logging` line, None for the lines not managed by this module
+        """
+        match = LOGGING_RE.match(line)
+        if not match:
+            return None
 
-    def parse_dest(self, line, group):
-        dest_group = ("console", "monitor", "buffered", "file")
-        dest = None
-        if group in dest_group:
-            dest = group
-        elif "vrf" in line:
-            dest = "host"
+        item = match.groupdict()
+        dest = item["dest"]
+        value = item.pop("value")
+        item.update({"name": None, "size": None, "level": None})
 
-        return dest
+        if dest == "file":
+            item["name"] = value
+        elif dest is not None:
+            if dest == "buffered" and value.isdigit():
+                item["size"] = value
+            elif value in LEVELS:
+                item["level"] = value
+        elif item["host"] is not None:
+            dest = item["dest"] = "host"
+            item["name"] = item["host"]
+        elif item["facility"] is not None:
+            dest = "facility"
+        else:
+            dest = "hostnameprefix"
+        del item["host"]
 
-    def parse_vrf(self, line, dest):
-        vrf = None
-        if dest == "host":
-            match = re.search(r"logging (\S+) vrf (\S+)", line, re.M)
-            if match:
-                vrf = match.group(2)
-        return vrf
+        return (dest, item["name"], item["vrf"]), item
 
     def map_config_to_obj(self):
         data = get_config(self._module, config_filter="logging")
-        lines = data.split("\n")
-
-        for line in lines:
-            match = re.search(r"logging (\S+)", line, re.M)
-            if match:
-                dest = self.parse_dest(line, match.group(1))
-                name = self.parse_name(line, dest)
-                if dest == "host" and name is not None:
-                    self._host_list.add(name)
-                if dest == "file" and name is not None:
-                    self._file_list.add(name)
-
-                self._have.append(
-                    {
-                        "dest": dest,
-                        "name": name,
-                        "size": self.parse_size(line, dest),
-                        "facility": self.parse_facility(line),
-                        "level": self.parse_level(line, dest),
-                        "vrf": self.parse_vrf(line, dest),
-                        "hostnameprefix": self.parse_hostnameprefix(line),
-                    }
-                )
+
+        for line in data.split("\n"):
+            parsed = self.parse_line(line)
+            if parsed:
+                key, item = parsed
+                have = self._have.setdefault(key, item)
+                if have is not item:
+                    # `logging buffered` sets the size and the level on
+                    # separate lines
+                    for attr, value in iteritems(item):
+                        if value is not None:
+                            have[attr] = value
 
     def run(self):
         self.map_params_to_obj()
@@ -899,21 +851,23 @@ class NCConfiguration(ConfigBase):
         )
 
         file_ele = etree_findall(running, "file")
-        file_list = list()
-        if len(file_ele):
-            for file in file_ele:
-                file_name = etree_find(file, "file-name")
-                file_list.append(
-                    file_name.text if file_name is not None else None
-                )
+        file_list = set()
+        for file in file_ele:
+            file_name = etree_find(file, "file-name")
+            file_list.add(file_name.text if file_name is not None else None)
         vrf_ele = etree_findall(running, "vrf")
-        host_list = list()
+        host_list = set()
         for vrf in vrf_ele:
+            vrf_name = etree_find(vrf, "vrf-name")
+            vrf_name = vrf_name.text if vrf_name is not None else None
             host_ele = etree_findall(vrf, "ipv4")
             for host in host_ele:
                 host_name = etree_find(host, "address")
-                host_list.append(
-                    host_name.text if host_name is not None else None
+                host_list.add(
+                    (
+                        host_name.text if host_name is not None else None,
+                        vrf_name,
+                    )
                 )
 
         console_ele = etree_find(running, "console-logging")
@@ -974,7 +928,10 @@ class NCConfiguration(ConfigBase):
                 if item["dest"] == "file" and item["name"] in file_list:
                     item["level"] = severity_level[item["level"]]
                     file_params.append(item)
-                elif item["dest"] == "host" and item["name"] in host_list:
+                elif (
+                    item["dest"] == "host"
+                    and (item["name"], item["vrf"]) in host_list
+                ):
                     item["level"] = severity_level[item["level"]]
                     host_params.append(item)
                 elif item["dest"] == "console" and have_console:
@@ -2514,6 +2514,9 @@ from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.config.ospfv2.ospfv2 import (
     Ospfv2,
 )
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.timing import (
+    start_timing,
+)
 
 
 def main():
@@ -2536,8 +2539,9 @@ def main():
         supports_check_mode=True,
         mutually_exclusive=mutually_exclusive,
     )
+    timing = start_timing(module)
     result = Ospfv2(module).execute_module()
-    module.exit_json(**result)
+    module.exit_json(**timing.finish(result))
 
 
 if __name__ == "__main__":
@@ -157,21 +157,40 @@ import re
 import collections
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.six import iteritems
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr import (
     get_config,
     load_config,
-    etree_findall,
+    etree_parse,
 )
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr import (
     is_cliconf,
     is_netconf,
-    etree_find,
 )
 from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr import (
     iosxr_argument_spec,
     build_xml,
+    build_xml_filter,
 )
 
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+# Lookups in the reply of the combined host-names and ip-domain
+# get-config, the vrf ones are relative to each ip-domain vrf.
+SYSTEM_XPATHS = {
+    "hostname": ".//host-names/host-name/text()",
+    "vrfs": ".//ip-domain/vrfs/vrf",
+    "vrf_name": "(.//vrf-name)[1]/text()",
+    "domain_name": "(.//name)[1]/text()",
+    "domain_search": ".//list-name/text()",
+    "name_servers": ".//server-address/text()",
+    "lookup_source": "(.//source-interface)[1]/text()",
+    "lookup_disabled": "boolean(.//lookup)",
+}
+
 
 def diff_list(want, have):
     adds = set(want).difference(have)
@@ -342,6 +361,14 @@ class NCConfiguration(ConfigBase):
         self._hostname_meta = collections.OrderedDict()
         self._lookup_source_meta = collections.OrderedDict()
         self._lookup_meta = collections.OrderedDict()
+        self._xpath = dict(
+            (key, etree.XPath(path, smart_strings=False))
+            for key, path in iteritems(SYSTEM_XPATHS)
+        )
+
+    def xpath_text(self, key, node):
+        values = self._xpath[key](node)
+        return values[0] if values else None
 
     def map_obj_to_xml_rpc(self):
         self._system_meta.update(
@@ -585,56 +612,22 @@ class NCConfiguration(ConfigBase):
         )
 
         state = self._module.params["state"]
-        _get_filter = build_xml("ip-domain", opcode="filter")
+        _get_filter = build_xml_filter(("ip-domain", "host-names"))
         running = get_config(
             self._module, source="running", config_filter=_get_filter
         )
-        _get_filter = build_xml("host-names", opcode="filter")
-        hostname_runn = get_config(
-            self._module, source="running", config_filter=_get_filter
-        )
+        running_tree = etree_parse(running)
 
-        hostname_ele = etree_find(hostname_runn, "host-name")
-        hostname = hostname_ele.text if hostname_ele is not None else None
+        hostname = self.xpath_text("hostname", running_tree)
 
-        vrf_ele = etree_findall(running, "vrf")
         vrf_map = {}
-        for vrf in vrf_ele:
-            name_server_list = list()
-            domain_list = list()
-            vrf_name_ele = etree_find(vrf, "vrf-name")
-            vrf_name = vrf_name_ele.text if vrf_name_ele is not None else None
-
-            domain_name_ele = etree_find(vrf, "name")
-            domain_name = (
-                domain_name_ele.text if domain_name_ele is not None else None
-            )
-
-            domain_ele = etree_findall(vrf, "list-name")
-            for domain in domain_ele:
-                domain_list.append(domain.text)
-
-            server_ele = etree_findall(vrf, "server-address")
-            for server in server_ele:
-                name_server_list.append(server.text)
-
-            lookup_source_ele = etree_find(vrf, "source-interface")
-            lookup_source = (
-                lookup_source_ele.text
-                if lookup_source_ele is not None
-                else None
-            )
-
-            lookup_enabled = (
-                False if etree_find(vrf, "lookup") is not None else True
-            )
-
-            vrf_map[vrf_name] = {
-                "domain_name": domain_name,
-                "domain_search": domain_list,
-                "name_servers": name_server_list,
-                "lookup_source": lookup_source,
-                "lookup_enabled": lookup_enabled,
+        for vrf in self._xpath["vrfs"](running_tree):
+            vrf_map[self.xpath_text("vrf_name", vrf)] = {
+                "domain_name": self.xpath_text("domain_name", vrf),
+                "domain_search": self._xpath["domain_search"](vrf),
+                "name_servers": self._xpath["name_servers"](vrf),
+                "lookup_source": self.xpath_text("lookup_source", vrf),
+                "lookup_enabled": not self._xpath["lookup_disabled"](vrf),
             }
 
         opcode = None
@@ -284,9 +284,12 @@ xml:
 import os
 from functools import partial
 from copy import deepcopy
+from io import BytesIO
 import collections
 
+from ansible.module_utils._text import to_text
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.six import iteritems
 from ansible.module_utils.compat.paramiko import paramiko
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     remove_default_spec,
@@ -312,92 +315,95 @@ except ImportError:
 
 
 class PublicKeyManager(object):
+    """ Upload and import the public key of the users over a single SSH
+    session to the node, opened on first use and closed by `run`
+    """
+
     def __init__(self, module, result):
         self._module = module
         self._result = result
+        self._ssh = None
 
-    def convert_key_to_base64(self):
-        """ IOS-XR only accepts base64 decoded files, this converts the public key to a temp file.
-        """
+    def key_name(self):
         if self._module.params["aggregate"]:
-            name = "aggregate"
-        else:
-            name = self._module.params["name"]
+            return "aggregate"
+        return self._module.params["name"]
+
+    def users(self):
+        if self._module.params["aggregate"]:
+            return [
+                user["name"] if isinstance(user, dict) else user
+                for user in self._module.params["aggregate"]
+            ]
+        return [self._module.params["name"]]
 
+    def convert_key_to_base64(self):
+        """ IOS-XR only accepts base64 decoded files, this decodes the public key.
+        """
         if self._module.params["public_key_contents"]:
             key = self._module.params["public_key_contents"]
         elif self._module.params["public_key"]:
-            readfile = open(self._module.params["public_key"], "r")
-            key = readfile.read()
+            with open(self._module.params["public_key"], "r") as readfile:
+                key = readfile.read()
         splitfile = key.split()[1]
 
-        base64key = b64decode(splitfile)
-        base64file = open("/tmp/publickey_%s.b64" % (name), "wb")
-        base64file.write(base64key)
-        base64file.close()
-
-        return "/tmp/publickey_%s.b64" % (name)
+        return b64decode(splitfile)
 
-    def copy_key_to_node(self, base64keyfile):
-        """ Copy key to IOS-XR node. We use SFTP because older IOS-XR versions don't handle SCP very well.
+    def connect(self):
+        """ The SSH session to the node, None when the provider is not set up
         """
-        provider = self._module.params.get("provider") or {}
-        node = provider.get("host")
-        if node is None:
-            return False
+        if self._ssh is None:
+            provider = self._module.params.get("provider") or {}
+            node = provider.get("host")
+            user = provider.get("username")
+            if node is None or user is None:
+                return None
+
+            password = provider.get("password")
+            ssh_keyfile = provider.get("ssh_keyfile")
+
+            ssh = paramiko.SSHClient()
+            ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            if not ssh_keyfile:
+                ssh.connect(node, username=user, password=password)
+            else:
+                ssh.connect(node, username=user, allow_agent=True)
+            self._ssh = ssh
 
-        user = provider.get("username")
-        if user is None:
-            return False
+        return self._ssh
 
-        password = provider.get("password")
-        ssh_keyfile = provider.get("ssh_keyfile")
+    def close(self):
+        if self._ssh is not None:
+            self._ssh.close()
+            self._ssh = None
 
-        if self._module.params["aggregate"]:
-            name = "aggregate"
-        else:
-            name = self._module.params["name"]
+    def copy_key_to_node(self, base64key):
+        """ Copy key to IOS-XR node. We use SFTP because older IOS-XR versions don't handle SCP very well.
+        """
+        ssh = self.connect()
+        if ssh is None:
+            return False
 
-        src = base64keyfile
-        dst = "/harddisk:/publickey_%s.b64" % (name)
+        dst = "/harddisk:/publickey_%s.b64" % (self.key_name())
 
-        ssh = paramiko.SSHClient()
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        if not ssh_keyfile:
-            ssh.connect(node, username=user, password=password)
-        else:
-            ssh.connect(node, username=user, allow_agent=True)
         sftp = ssh.open_sftp()
-        sftp.put(src, dst)
-        sftp.close()
-        ssh.close()
+        try:
+            sftp.putfo(BytesIO(base64key), dst)
+        finally:
+            sftp.close()
 
     def addremovekey(self, command):
         """ Add or remove key based on command
         """
-        provider = self._module.params.get("provider") or {}
-        node = provider.get("host")
-        if node is None:
+        ssh = self.connect()
+        if ssh is None:
             return False
 
-        user = provider.get("username")
-        if user is None:
-            return False
-
-        password = provider.get("password")
-        ssh_keyfile = provider.get("ssh_keyfile")
-
-        ssh = paramiko.SSHClient()
-        ssh.set_missing_host_key_policy(paramiko.AutoAddPolicy())
-        if not ssh_keyfile:
-            ssh.connect(node, username=user, password=password)
-        else:
-            ssh.connect(node, username=user, allow_agent=True)
         ssh_stdin, ssh_stdout, ssh_stderr = ssh.exec_command(
             "%s \r" % (command)
         )
-        readmsg = ssh_stdout.read(
-            100
+        readmsg = to_text(
+            ssh_stdout.read(100), errors="surrogate_or_strict"
         )  # We need to read a bit to actually apply for some reason
         if (
             ("already" in readmsg)
@@ -408,85 +414,64 @@ class PublicKeyManager(object):
         ssh_stdout.read(
             1
         )  # We need to read a bit to actually apply for some reason
-        ssh.close()
 
         return readmsg
 
+    def addremovekeys(self, commands):
+        """ Run each of `commands` on the node, False when the provider
+        is not set up
+        """
+        for command in commands:
+            if self.addremovekey(command) is False:
+                return False
+
     def run(self):
-        if self._module.params["state"] == "present":
-            if not self._module.check_mode:
-                key = self.convert_key_to_base64()
-                copykeys = self.copy_key_to_node(key)
-                if copykeys is False:
-                    self._result["warnings"].append(
-                        "Please set up your provider before running this playbook"
-                    )
+        if self._module.check_mode:
+            return self._result
 
-                if self._module.params["aggregate"]:
-                    for user in self._module.params["aggregate"]:
-                        cmdtodo = (
-                            "admin crypto key import authentication rsa username %s harddisk:/publickey_aggregate.b64"
-                            % (user)
-                        )
-                        addremove = self.addremovekey(cmdtodo)
-                        if addremove is False:
-                            self._result["warnings"].append(
-                                "Please set up your provider before running this playbook"
-                            )
-                else:
-                    cmdtodo = (
+        commands = list()
+        if self._module.params["state"] == "present":
+            key = self.convert_key_to_base64()
+            if self.copy_key_to_node(key) is not False:
+                for user in self.users():
+                    commands.append(
                         "admin crypto key import authentication rsa username %s harddisk:/publickey_%s.b64"
-                        % (
-                            self._module.params["name"],
-                            self._module.params["name"],
-                        )
+                        % (user, self.key_name())
                     )
-                    addremove = self.addremovekey(cmdtodo)
-                    if addremove is False:
-                        self._result["warnings"].append(
-                            "Please set up your provider before running this playbook"
-                        )
         elif self._module.params["state"] == "absent":
-            if not self._module.check_mode:
-                if self._module.params["aggregate"]:
-                    for user in self._module.params["aggregate"]:
-                        cmdtodo = (
-                            "admin crypto key zeroize authentication rsa username %s"
-                            % (user)
-                        )
-                        addremove = self.addremovekey(cmdtodo)
-                        if addremove is False:
-                            self._result["warnings"].append(
-                                "Please set up your provider before running this playbook"
-                            )
-                else:
-                    cmdtodo = (
-                        "admin crypto key zeroize authentication rsa username %s"
-                        % (self._module.params["name"])
-                    )
-                    addremove = self.addremovekey(cmdtodo)
-                    if addremove is False:
-                        self._result["warnings"].append(
-                            "Please set up your provider before running this playbook"
-                        )
+            for user in self.users():
+                commands.append(
+                    "admin crypto key zeroize authentication rsa username %s"
+                    % (user)
+                )
         elif self._module.params["purge"] is True:
-            if not self._module.check_mode:
-                cmdtodo = "admin crypto key zeroize authentication rsa all"
-                addremove = self.addremovekey(cmdtodo)
-                if addremove is False:
-                    self._result["warnings"].append(
-                        "Please set up your provider before running this playbook"
-                    )
+            commands.append("admin crypto key zeroize authentication rsa all")
 
-        return self._result
+        try:
+            if self.connect() is None or self.addremovekeys(commands) is False:
+                self._result["warnings"].append(
+                    "Please set up your provider before running this playbook"
+                )
+        finally:
+            self.close()
 
+        return self._result
 
-def search_obj_in_list(name, lst):
-    for o in lst:
-        if o["name"] == name:
-            return o
 
-    return None
+def parse_users(data):
+    """ Split the `username` section of the running config into the
+    name and the attribute lines of each user, in config order
+    """
+    users = collections.OrderedDict()
+    lines = None
+    for line in data.splitlines():
+        if line.startswith("username "):
+            lines = users.setdefault(line.split()[1], [])
+        elif lines is not None and line[:1].isspace():
+            lines.append(line.strip())
+        else:
+            lines = None
+    return users
 
 
 class ConfigBase(object):
@@ -494,7 +479,7 @@ class ConfigBase(object):
         self._module = module
         self._result = result
         self._want = list()
-        self._have = list()
+        self._have = collections.OrderedDict()
 
     def get_param_value(self, key, item):
         # if key doesn't exist in the item, get it from module.params
@@ -555,26 +540,21 @@ class CliConfiguration(ConfigBase):
 
     def map_config_to_obj(self):
         data = get_config(self._module, config_filter="username")
-        users = data.strip().rstrip("!").split("!")
-
-        for user in users:
-            user_config = user.strip().splitlines()
 
-            name = user_config[0].strip().split()[1]
+        for name, user_config in iteritems(parse_users(data)):
             group = None
 
-            if len(user_config) > 1:
-                group_or_secret = user_config[1].strip().split()
+            if user_config:
+                group_or_secret = user_config[0].split()
                 if group_or_secret[0] == "group":
                     group = group_or_secret[1]
 
-            obj = {
+            self._have[name] = {
                 "name": name,
                 "state": "present",
                 "configured_password": None,
                 "group": group,
             }
-            self._have.append(obj)
 
     def map_obj_to_commands(self):
         commands = list()
@@ -583,7 +563,7 @@ class CliConfiguration(ConfigBase):
             name = w["name"]
             state = w["state"]
 
-            obj_in_have = search_obj_in_list(name, self._have)
+            obj_in_have = self._have.get(name)
 
             if state == "absent" and obj_in_have:
                 commands.append("no username " + name)
@@ -618,10 +598,9 @@ class CliConfiguration(ConfigBase):
                         commands.append(user_cmd + " group " + group)
 
         if self._module.params["purge"]:
-            want_users = [x["name"] for x in self._want]
-            have_users = [x["name"] for x in self._have]
-            for item in set(have_users).difference(set(want_users)):
-                if item != "admin":
+            want_users = set(x["name"] for x in self._want)
+            for item in self._have:
+                if item not in want_users and item != "admin":
                     commands.append("no username %s" % item)
 
         if "no username admin" in commands:
@@ -737,37 +716,28 @@ class NCConfiguration(ConfigBase):
         )
 
         elements = etree_findall(running, "username")
-        users = list()
         for element in elements:
             name_list = etree_findall(element, "name")
-            users.append(name_list[0].text)
+            name = name_list[0].text
             list_size = len(name_list)
             if list_size == 1:
-                self._have.append(
-                    {"name": name_list[0].text, "group": None, "groups": None}
-                )
+                self._have[name] = {
+                    "name": name,
+                    "group": None,
+                    "groups": None,
+                }
             elif list_size == 2:
-                self._have.append(
-                    {
-                        "name": name_list[0].text,
-                        "group": name_list[1].text,
-                        "groups": None,
-                    }
-                )
+                self._have[name] = {
+                    "name": name,
+                    "group": name_list[1].text,
+                    "groups": None,
+                }
             elif list_size > 2:
-                name_iter = iter(name_list)
-                next(name_iter)
-                tmp_list = list()
-                for name in name_iter:
-                    tmp_list.append(name.text)
-
-                self._have.append(
-                    {
-                        "name": name_list[0].text,
-                        "group": None,
-                        "groups": tmp_list,
-                    }
-                )
+                self._have[name] = {
+                    "name": name,
+                    "group": None,
+                    "groups": [item.text for item in name_list[1:]],
+                }
 
         locald_params = list()
         locald_group_params = list()
@@ -776,13 +746,13 @@ class NCConfiguration(ConfigBase):
         if state == "absent":
             opcode = "delete"
             for want_item in self._want:
-                if want_item["name"] in users:
+                if want_item["name"] in self._have:
                     want_item["configured_password"] = None
                     locald_params.append(want_item)
         elif state == "present":
             opcode = "merge"
             for want_item in self._want:
-                if want_item["name"] not in users:
+                if want_item["name"] not in self._have:
                     want_item["configured_password"] = self.generate_md5_hash(
                         want_item["configured_password"]
                     )
@@ -808,9 +778,7 @@ class NCConfiguration(ConfigBase):
                     else:
                         want_item["configured_password"] = None
 
-                    obj_in_have = search_obj_in_list(
-                        want_item["name"], self._have
-                    )
+                    obj_in_have = self._have[want_item["name"]]
                     if (
                         want_item["group"] is not None
                         and want_item["group"] != obj_in_have["group"]
@@ -823,10 +791,9 @@ class NCConfiguration(ConfigBase):
 
         purge_params = list()
         if self._module.params["purge"]:
-            want_users = [x["name"] for x in self._want]
-            have_users = [x["name"] for x in self._have]
-            for item in set(have_users).difference(set(want_users)):
-                if item != "admin":
+            want_users = set(x["name"] for x in self._want)
+            for item in self._have:
+                if item not in want_users and item != "admin":
                     purge_params.append({"name": item})
 
         self._result["xml"] = []
@@ -69,6 +69,10 @@ except (
 
 
 class Netconf(NetconfBase):
+    def __init__(self, *args, **kwargs):
+        super(Netconf, self).__init__(*args, **kwargs)
+        self._capabilities = None
+
     def get_device_info(self):
         device_info = {}
         device_info["network_os"] = "iosxr"
@@ -143,6 +147,15 @@ class Netconf(NetconfBase):
         return device_info
 
     def get_capabilities(self):
+        """ The capabilities are computed on the first call of a NETCONF
+        session and kept in the persistent connection until the next
+        commit
+        """
+        session_id = self.m.session_id
+        if self._capabilities is not None:
+            if self._capabilities[0] == session_id:
+                return self._capabilities[1]
+
         result = dict()
         result["rpc"] = self.get_base_rpc()
         result["network_api"] = "netconf"
@@ -153,7 +166,9 @@ class Netconf(NetconfBase):
         result["device_operations"] = self.get_device_operations(
             result["server_capabilities"]
         )
-        return json.dumps(result)
+        capabilities = json.dumps(result)
+        self._capabilities = (session_id, capabilities)
+        return capabilities
 
     @staticmethod
     @ensure_ncclient
@@ -256,6 +271,8 @@ class Netconf(NetconfBase):
         self, confirmed=False, timeout=None, persist=None, remove_ns=False
     ):
         timeout = to_text(timeout, errors="surrogate_or_strict")
+        # the device info, such as the hostname, may change
+        self._capabilities = None
         try:
             resp = self.m.commit(
                 confirmed=confirmed, timeout=timeout, persist=persist
@@ -26,6 +26,69 @@ from ansible.plugins.terminal import TerminalBase
 from ansible.errors import AnsibleConnectionFailure
 
 
+# The device error messages, the case sensitive and the case insensitive
+# ones are kept in two patterns as python 2 has no scoped inline flags.
+STDERR_RE = re.compile(
+    br"% ?(?:Error|Bad secret|This command is not authorized)"
+    br"|'[^']' +returned error code: ?\d+"
+)
+STDERR_NOCASE_RE = re.compile(
+    br"invalid input"
+    br"|(?:incomplete|ambiguous) command"
+    br"|(?<!\()connection timed out(?!\))"
+    # finds the same lines as `[^\r\n]+ not found` without scanning
+    # back over the whole line on every space
+    br"|[^\r\n] not found" br"|failed to commit",
+    re.I,
+)
+
+# Every match of STDERR_RE contains one of these literals and every
+# match of STDERR_NOCASE_RE one of the lowercase ones.
+STDERR_LITERALS = (b"%", b"returned error code")
+STDERR_NOCASE_LITERALS = (
+    b"invalid input",
+    b" command",
+    b"connection timed out",
+    b" not found",
+    b"failed to commit",
+)
+
+
+class StderrMatcher(object):
+    """ Stands in for the list of error regexes of the terminal
+
+    The connection plugin calls `search` with the response received so
+    far after every read. The patterns never match across a line break,
+    so when the response starts with the one of the previous call and
+    that had no error, only the data from the start of its last line on
+    is searched. The regexes only run when that window holds one of
+    their literals.
+    """
+
+    pattern = STDERR_RE.pattern + b"|" + STDERR_NOCASE_RE.pattern
+
+    def __init__(self):
+        self._clean = None
+
+    def search(self, response):
+        start = 0
+        clean = self._clean
+        if clean and response.startswith(clean):
+            start = response.rfind(b"\n", 0, len(clean)) + 1
+
+        window = response[start:]
+        match = None
+        if any(literal in window for literal in STDERR_LITERALS):
+            match = STDERR_RE.search(response, start)
+        if match is None:
+            window = window.lower()
+            if any(literal in window for literal in STDERR_NOCASE_LITERALS):
+                match = STDERR_NOCASE_RE.search(response, start)
+
+        self._clean = None if match else response
+        return match
+
+
 class TerminalModule(TerminalBase):
 
     terminal_stdout_re = [
@@ -33,17 +96,10 @@ class TerminalModule(TerminalBase):
         re.compile(br"]]>]]>[\r\n]?"),
     ]
 
-    terminal_stderr_re = [
-        re.compile(br"% ?Error"),
-        re.compile(br"% ?Bad secret"),
-        re.compile(br"% ?This command is not authorized"),
-        re.compile(br"invalid input", re.I),
-        re.compile(br"(?:incomplete|ambiguous) command", re.I),
-        re.compile(br"(?<!\()connection timed out(?!\))", re.I),
-        re.compile(br"[^\r\n]+ not found", re.I),
-        re.compile(br"'[^']' +returned error code: ?\d+"),
-        re.compile(br"Failed to commit", re.I),
-    ]
+    def __init__(self, connection):
+        super(TerminalModule, self).__init__(connection)
+        # a matcher per connection, it remembers the last response
+        self.terminal_stderr_re = [StderrMatcher()]
 
     def on_open_shell(self):
         try:
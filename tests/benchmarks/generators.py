@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Synthetic running-config generators for the benchmarks
+
+Every generator returns the device output the matching facts class
+parses, sized by the number of entries it should contain.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+
+PORTS_PER_BUNDLE = 8
+
+
+def _port(index):
+    return "GigabitEthernet0/0/%d/%d" % (index // 48, index % 48)
+
+
+def _ipv4(index, host=1):
+    return "10.%d.%d.%d" % (index // 250 % 250, index % 250, host)
+
+
+def interfaces_config(count, subinterfaces=0):
+    """ `count` physical interfaces with `subinterfaces` l2transport
+    subinterfaces each and one bundle for every eight ports.
+    """
+    blocks = []
+    for bundle in range((count + PORTS_PER_BUNDLE - 1) // PORTS_PER_BUNDLE):
+        blocks.append(
+            "interface Bundle-Ether%d\n"
+            " description bundle %d\n"
+            " lacp mode active\n"
+            " lacp churn logging actor\n"
+            " bundle minimum-active links 1\n"
+            " bundle maximum-active links 8\n"
+            " ipv4 address %s 255.255.255.0\n"
+            "!" % (bundle + 1, bundle + 1, _ipv4(bundle, 254))
+        )
+    for index in range(count):
+        name = _port(index)
+        block = [
+            "interface %s" % name,
+            " description port %d" % index,
+            " mtu 9216",
+            " speed 10000",
+            " duplex full",
+            " lacp period 200",
+            " lldp",
+            "  receive disable",
+            " !",
+        ]
+        if index % 2:
+            block.append(
+                " bundle id %d mode active" % (index // PORTS_PER_BUNDLE + 1)
+            )
+        else:
+            block.extend(
+                [
+                    " ipv4 address %s 255.255.255.0" % _ipv4(index),
+                    " ipv4 address %s 255.255.255.0 secondary"
+                    % _ipv4(index, 2),
+                    " ipv6 address 2001:db8::%x/64" % index,
+                    " ipv4 access-group acl_%d ingress" % (index % 16),
+                ]
+            )
+        block.append("!")
+        blocks.append("\n".join(block))
+        for sub in range(1, subinterfaces + 1):
+            blocks.append(
+                "interface %s.%d l2transport\n"
+                " encapsulation dot1q %d second-dot1q %d\n"
+                " l2protocol cdp tunnel\n"
+                " propagate remote-status\n"
+                "!" % (name, sub, sub, sub + 100)
+            )
+    return "\n".join(blocks) + "\n"
+
+
+def acls_config(count, per_acl=50):
+    """ `count` ACEs spread over ipv4 and ipv6 ACLs of `per_acl` ACEs,
+    as returned by `show access-lists afi-all`.
+    """
+    lines = []
+    for index in range(count):
+        acl, seq = divmod(index, per_acl)
+        if seq == 0:
+            afi = "ipv6" if acl % 2 else "ipv4"
+            lines.append("%s access-list acl_%d" % (afi, acl))
+        seq = (seq + 1) * 10
+        if afi == "ipv4":
+            lines.append(
+                " %d permit tcp host %s eq www any range 1024 2048 log"
+                % (seq, _ipv4(index))
+            )
+        else:
+            lines.append(
+                " %d deny udp 2001:db8:%x::/64 any eq 53 dscp af11"
+                % (seq, index)
+            )
+    return "\n".join(lines) + "\n"
+
+
+def static_routes_config(count, vrfs=10):
+    """ `count` static routes spread over the global table and `vrfs`
+    VRFs, two next hops each, as returned by
+    `show running-config router static`.
+    """
+    tables = [[] for _vrf in range(vrfs + 1)]
+    for index in range(count):
+        tables[index % len(tables)].append(index)
+
+    lines = ["router static"]
+    for vrf, routes in enumerate(tables):
+        indent = " "
+        if vrf:
+            lines.append(" vrf VRF%d" % vrf)
+            indent = "  "
+        lines.append("%saddress-family ipv4 unicast" % indent)
+        for index in routes:
+            dest = "172.%d.%d.0/24" % (16 + index // 250 % 16, index % 250)
+            lines.append(
+                "%s %s %s %s tag 10 description R%d"
+                % (indent, dest, _port(index), _ipv4(index), index)
+            )
+            lines.append("%s %s %s 200" % (indent, dest, _ipv4(index, 2)))
+        lines.append("%s!" % indent)
+        if vrf:
+            lines.append(" !")
+    lines.append("!")
+    return "\n".join(lines) + "\n"
+
+
+def ospf_config(count, interfaces_per_area=4, version="ospf"):
+    """ `count` OSPF areas with `interfaces_per_area` interfaces each in
+    a single process, as returned by `show running-config router ospf`
+    (or `router ospfv3` with `version="ospfv3"`).
+    """
+    lines = [
+        "router %s 100" % version,
+        " router-id 192.0.2.1",
+        " log adjacency changes detail",
+        " default-metric 10",
+    ]
+    for area in range(count):
+        lines.append(" area %d" % area)
+        lines.append("  default-cost 5")
+        for index in range(interfaces_per_area):
+            lines.extend(
+                [
+                    "  interface %s"
+                    % _port(area * interfaces_per_area + index),
+                    "   cost 20",
+                    "   hello-interval 10",
+                    "   dead-interval 40",
+                    "   network point-to-point",
+                    "   authentication message-digest keychain cisco",
+                    "  !",
+                ]
+            )
+        lines.append(" !")
+    lines.append("!")
+    return "\n".join(lines) + "\n"
+
+
+def bgp_config(count, bgp_as=64496):
+    """ `count` BGP neighbors, as returned by
+    `show running-config router bgp`.
+    """
+    lines = ["router bgp %d" % bgp_as, " bgp router-id 192.0.2.1"]
+    for index in range(count):
+        lines.extend(
+            [
+                " neighbor %s" % _ipv4(index, 1),
+                "  remote-as %d" % (bgp_as + 1 + index % 100),
+                "  description peer %d" % index,
+                "  update-source Loopback0",
+                "  timers 10 30",
+                " !",
+            ]
+        )
+    lines.append("!")
+    return "\n".join(lines) + "\n"
+
+
+def bgp_params(count, bgp_as=64496, changed=0.1):
+    """ The iosxr_bgp module params for `count` neighbors, matching
+    `bgp_config` except for a `changed` share of the descriptions.
+    """
+    every = int(1 / changed) if changed else 0
+    neighbors = []
+    for index in range(count):
+        description = "peer %d" % index
+        if every and index % every == 0:
+            description = "new peer %d" % index
+        neighbors.append(
+            {
+                "neighbor": _ipv4(index, 1),
+                "remote_as": bgp_as + 1 + index % 100,
+                "update_source": "Loopback0",
+                "password": None,
+                "enabled": None,
+                "description": description,
+                "advertisement_interval": None,
+                "ebgp_multihop": None,
+                "tcp_mss": None,
+                "timers": {
+                    "keepalive": 10,
+                    "holdtime": 30,
+                    "min_neighbor_holdtime": None,
+                },
+            }
+        )
+    return {
+        "operation": "merge",
+        "config": {
+            "bgp_as": bgp_as,
+            "router_id": "192.0.2.1",
+            "log_neighbor_changes": None,
+            "neighbors": neighbors,
+            "address_family": None,
+        },
+    }
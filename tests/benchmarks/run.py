@@ -0,0 +1,477 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""
+Scaling benchmarks for the iosxr facts parsers and command generators
+
+The benchmarks feed synthetic configurations from `generators` to the
+facts classes (through the `data` argument of `populate_facts`), to the
+resource modules in the `parsed` and `rendered` states and to the
+iosxr_bgp provider, so no device is needed. The terminal case feeds a
+large `show running-config` output to the error regexes of the
+terminal plugin the way the connection plugin reads it. Run them with the
+collection on the python path:
+
+    python -m ansible_collections.cisco.iosxr.tests.benchmarks.run
+
+For every case the best wall time of `--repeat` runs, the time per
+generated entry (interface, ACE, route, OSPF area or BGP neighbor) and
+the peak traced memory of one extra run are reported.
+
+As an offline regression gate, save the results of a reference run
+with `--output` and pass that file to `--baseline`: the run exits with
+status 1 when the per-entry time of a case exceeds `--tolerance` times
+the baseline. `--scaling` also runs every case at four times the scale
+and fails when the per-entry time grows by more than `--max-growth`,
+which catches quadratic behaviour without any reference run.
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import argparse
+import fnmatch
+import gc
+import json
+import sys
+
+from copy import deepcopy
+from timeit import default_timer
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr import (
+    interface_config,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    validate_config,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.facts.facts import (
+    FACT_RESOURCE_SUBSETS,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.acl_interfaces.acl_interfaces import (
+    Acl_interfacesArgs,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.acls.acls import (
+    AclsArgs,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.interfaces.interfaces import (
+    InterfacesArgs,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.l2_interfaces.l2_interfaces import (
+    L2_InterfacesArgs,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.l3_interfaces.l3_interfaces import (
+    L3_InterfacesArgs,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.lacp_interfaces.lacp_interfaces import (
+    Lacp_interfacesArgs,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.lag_interfaces.lag_interfaces import (
+    Lag_interfacesArgs,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.lldp_interfaces.lldp_interfaces import (
+    Lldp_interfacesArgs,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.ospf_interfaces.ospf_interfaces import (
+    Ospf_interfacesArgs,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.ospfv2.ospfv2 import (
+    Ospfv2Args,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.ospfv3.ospfv3 import (
+    Ospfv3Args,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.static_routes.static_routes import (
+    Static_routesArgs,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.config.acl_interfaces.acl_interfaces import (
+    Acl_interfaces,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.config.acls.acls import (
+    Acls,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.config.interfaces.interfaces import (
+    Interfaces,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.config.l2_interfaces.l2_interfaces import (
+    L2_Interfaces,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.config.l3_interfaces.l3_interfaces import (
+    L3_Interfaces,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.config.lacp_interfaces.lacp_interfaces import (
+    Lacp_interfaces,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.config.lag_interfaces.lag_interfaces import (
+    Lag_interfaces,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.config.lldp_interfaces.lldp_interfaces import (
+    Lldp_interfaces,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.config.ospf_interfaces.ospf_interfaces import (
+    Ospf_interfaces,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.config.ospfv2.ospfv2 import (
+    Ospfv2,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.config.ospfv3.ospfv3 import (
+    Ospfv3,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.config.static_routes.static_routes import (
+    Static_routes,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.providers.cli.config.bgp.process import (
+    Provider as BgpProvider,
+)
+from ansible_collections.cisco.iosxr.plugins.terminal.iosxr import (
+    TerminalModule,
+)
+from ansible_collections.cisco.iosxr.tests.benchmarks import generators
+
+
+def _interfaces(scale):
+    return generators.interfaces_config(scale, subinterfaces=1)
+
+
+def _ospf(scale):
+    return generators.ospf_config(scale) + generators.ospf_config(
+        scale, version="ospfv3"
+    )
+
+
+# resource -> (config generator, config class, argspec class)
+RESOURCES = {
+    "interfaces": (_interfaces, Interfaces, InterfacesArgs),
+    "l2_interfaces": (_interfaces, L2_Interfaces, L2_InterfacesArgs),
+    "l3_interfaces": (_interfaces, L3_Interfaces, L3_InterfacesArgs),
+    "lacp_interfaces": (_interfaces, Lacp_interfaces, Lacp_interfacesArgs),
+    "lldp_interfaces": (_interfaces, Lldp_interfaces, Lldp_interfacesArgs),
+    "lag_interfaces": (_interfaces, Lag_interfaces, Lag_interfacesArgs),
+    "acl_interfaces": (_interfaces, Acl_interfaces, Acl_interfacesArgs),
+    "acls": (generators.acls_config, Acls, AclsArgs),
+    "static_routes": (
+        generators.static_routes_config,
+        Static_routes,
+        Static_routesArgs,
+    ),
+    "ospfv2": (generators.ospf_config, Ospfv2, Ospfv2Args),
+    "ospfv3": (
+        lambda scale: generators.ospf_config(scale, version="ospfv3"),
+        Ospfv3,
+        Ospfv3Args,
+    ),
+    "ospf_interfaces": (_ospf, Ospf_interfaces, Ospf_interfacesArgs),
+}
+
+# The entries of these resources are much more expensive to parse (an
+# OSPF area holds several interfaces and every line goes through the
+# jinja based templates), so they run at a fraction of `--scale`.
+SCALE_DIVISORS = {"ospfv2": 20, "ospfv3": 20, "ospf_interfaces": 50}
+
+# Bytes the connection plugin gets from the device per read
+READ_SIZE = 4096
+
+
+class BenchmarkModule(object):
+    """ The bits of AnsibleModule used by the facts and config classes
+    """
+
+    check_mode = False
+    _diff = False
+
+    def __init__(self, params):
+        self.params = params
+
+    def fail_json(self, msg=None, **kwargs):
+        raise AssertionError(msg)
+
+
+def _reset_caches():
+    # Every case parses its configuration from scratch, sharing the
+    # parsed interface section between resources is measured by the
+    # `facts/all_interfaces` case.
+    interface_config._documents.clear()
+
+
+def facts_case(resource):
+    generate = RESOURCES[resource][0]
+    facts_class = FACT_RESOURCE_SUBSETS[resource]
+
+    def setup(scale):
+        data = generate(scale)
+        facts = facts_class(BenchmarkModule({}))
+
+        def run():
+            _reset_caches()
+            facts.populate_facts(
+                None, {"ansible_network_resources": {}}, data=data
+            )
+
+        return run
+
+    return setup
+
+
+def all_interfaces_facts_case():
+    resources = [
+        resource
+        for resource, entry in RESOURCES.items()
+        if entry[0] is _interfaces
+    ]
+
+    def setup(scale):
+        data = _interfaces(scale)
+        facts = [
+            FACT_RESOURCE_SUBSETS[resource](BenchmarkModule({}))
+            for resource in resources
+        ]
+
+        def run():
+            _reset_caches()
+            for item in facts:
+                item.populate_facts(
+                    None, {"ansible_network_resources": {}}, data=data
+                )
+
+        return run
+
+    return setup
+
+
+def parsed_case(resource):
+    generate, config_class, _args = RESOURCES[resource]
+
+    def setup(scale):
+        params = {
+            "config": None,
+            "running_config": generate(scale),
+            "state": "parsed",
+        }
+
+        def run():
+            _reset_caches()
+            config_class(BenchmarkModule(params)).execute_module()
+
+        return run
+
+    return setup
+
+
+def rendered_case(resource):
+    generate, config_class, args_class = RESOURCES[resource]
+
+    def setup(scale):
+        params = {
+            "config": None,
+            "running_config": generate(scale),
+            "state": "parsed",
+        }
+        parsed = config_class(BenchmarkModule(params)).execute_module()
+        params = validate_config(
+            args_class.argument_spec, {"config": parsed["parsed"]}
+        )
+        params["state"] = "rendered"
+
+        def run():
+            config_class(BenchmarkModule(deepcopy(params))).execute_module()
+
+        return run
+
+    return setup
+
+
+def bgp_case():
+    def setup(scale):
+        config = generators.bgp_config(scale)
+        params = generators.bgp_params(scale)
+
+        def run():
+            BgpProvider(params).render(config)
+
+        return run
+
+    return setup
+
+
+def terminal_case():
+    def setup(scale):
+        output = _interfaces(scale) + generators.bgp_config(scale)
+        output = (output + "RP/0/RP0/CPU0:router#").encode("ascii")
+        chunks = []
+        while output:
+            chunks.append(output[:READ_SIZE])
+            output = output[READ_SIZE:]
+
+        def run():
+            # The libssh transport searches the whole response received
+            # so far after every read.
+            response = b""
+            terminal = TerminalModule(None)
+            for chunk in chunks:
+                response += chunk
+                for regex in terminal.terminal_stderr_re:
+                    if regex.search(response):
+                        raise AssertionError(regex.pattern)
+
+        return run
+
+    return setup
+
+
+def get_cases():
+    """ Return the (name, setup, scale divisor) of every case
+    """
+    cases = []
+    for resource in sorted(RESOURCES):
+        cases.append(
+            (
+                "facts/%s" % resource,
+                facts_case(resource),
+                SCALE_DIVISORS.get(resource, 1),
+            )
+        )
+    cases.append(("facts/all_interfaces", all_interfaces_facts_case(), 1))
+    for resource in sorted(RESOURCES):
+        divisor = SCALE_DIVISORS.get(resource, 1)
+        cases.append(("parsed/%s" % resource, parsed_case(resource), divisor))
+        cases.append(
+            ("rendered/%s" % resource, rendered_case(resource), divisor)
+        )
+    cases.append(("render/bgp_neighbors", bgp_case(), 1))
+    cases.append(("terminal/stderr_re", terminal_case(), 1))
+    return cases
+
+
+def measure(setup, scale, repeat):
+    """ Return the best time of `repeat` runs and the peak traced
+    memory of one more run of the case built by `setup` at `scale`
+    """
+    elapsed = None
+    for _count in range(repeat):
+        run = setup(scale)
+        gc.collect()
+        start = default_timer()
+        run()
+        duration = default_timer() - start
+        if elapsed is None or duration < elapsed:
+            elapsed = duration
+
+    peak = None
+    if tracemalloc:
+        run = setup(scale)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            run()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "scale": scale,
+        "seconds": elapsed,
+        "per_entry": elapsed / scale,
+        "peak": peak,
+    }
+
+
+def _format(name, result):
+    peak = "-"
+    if result["peak"] is not None:
+        peak = "%.1f" % (result["peak"] / 1024.0)
+    return "%-32s %8d %10.1f %12.2f %12s" % (
+        name,
+        result["scale"],
+        result["seconds"] * 1000,
+        result["per_entry"] * 1000000,
+        peak,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--scale", type=int, default=500, help="entries per case"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs per case, best is kept"
+    )
+    parser.add_argument(
+        "--filter", default="*", help="only run the matching cases"
+    )
+    parser.add_argument("--output", help="save the results as JSON")
+    parser.add_argument("--baseline", help="results of a reference run")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=1.5,
+        help="allowed per-entry slowdown against the baseline",
+    )
+    parser.add_argument(
+        "--scaling",
+        action="store_true",
+        help="also run every case at four times the scale",
+    )
+    parser.add_argument(
+        "--max-growth",
+        type=float,
+        default=2.0,
+        help="allowed per-entry slowdown at four times the scale",
+    )
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    results = {}
+    failures = []
+    print(
+        "%-32s %8s %10s %12s %12s"
+        % ("case", "entries", "total ms", "us/entry", "peak KiB")
+    )
+    for name, setup, divisor in get_cases():
+        if not fnmatch.fnmatch(name, args.filter):
+            continue
+
+        scale = max(1, args.scale // divisor)
+        result = results[name] = measure(setup, scale, args.repeat)
+        print(_format(name, result))
+
+        reference = baseline.get(name)
+        if reference and reference["scale"] == scale:
+            ratio = result["per_entry"] / reference["per_entry"]
+            if ratio > args.tolerance:
+                failures.append(
+                    "%s is %.2fx slower than the baseline" % (name, ratio)
+                )
+
+        if args.scaling:
+            large = measure(setup, scale * 4, args.repeat)
+            print(_format(name, large))
+            growth = large["per_entry"] / result["per_entry"]
+            result["growth"] = growth
+            if growth > args.max_growth:
+                failures.append(
+                    "%s per entry time grows %.2fx at four times the scale"
+                    % (name, growth)
+                )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+
+    for failure in failures:
+        print("FAIL: %s" % failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
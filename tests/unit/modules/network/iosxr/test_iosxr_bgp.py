@@ -0,0 +1,98 @@
+# Copyright 2020 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+
+from ansible_collections.cisco.iosxr.tests.unit.compat.mock import patch
+from ansible_collections.cisco.iosxr.plugins.modules import iosxr_bgp
+from ansible_collections.cisco.iosxr.tests.unit.modules.utils import (
+    set_module_args,
+)
+from .iosxr_module import TestIosxrModule, load_fixture
+
+
+class TestIosxrBgpModule(TestIosxrModule):
+    module = iosxr_bgp
+
+    def setUp(self):
+        super(TestIosxrBgpModule, self).setUp()
+
+        self.mock_connection = patch(
+            "ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.providers.module.Connection"
+        )
+        self.connection = self.mock_connection.start()
+
+    def tearDown(self):
+        super(TestIosxrBgpModule, self).tearDown()
+        self.mock_connection.stop()
+
+    def load_fixtures(self, commands=None):
+        connection = self.connection.return_value
+        connection.get_capabilities.return_value = json.dumps(
+            {"device_info": {"network_os": "iosxr"}, "network_api": "cliconf"}
+        )
+        connection.get_config.return_value = load_fixture(
+            "iosxr_bgp_config.cfg"
+        )
+
+    def set_args(self, operation, **config):
+        config.setdefault("bgp_as", 64496)
+        set_module_args(
+            dict(
+                config=config,
+                operation=operation,
+                _ansible_module_name="iosxr_bgp",
+            )
+        )
+
+    def test_iosxr_bgp_idempotent(self):
+        self.set_args(
+            "merge",
+            router_id="192.0.2.1",
+            log_neighbor_changes=True,
+            neighbors=[
+                dict(
+                    neighbor="192.0.2.10",
+                    remote_as=650011,
+                    description="peer ten",
+                ),
+                dict(neighbor="192.0.2.11", remote_as=65001),
+            ],
+        )
+        self.execute_module(changed=False, commands=[])
+
+    def test_iosxr_bgp_remote_as_prefix(self):
+        self.set_args(
+            "merge",
+            neighbors=[
+                dict(neighbor="192.0.2.10", remote_as=65001),
+                dict(neighbor="192.0.2.11", remote_as=65001),
+            ],
+        )
+        commands = [
+            "router bgp 64496",
+            "neighbor 192.0.2.10",
+            "remote-as 65001",
+            "exit",
+            "exit",
+        ]
+        self.execute_module(changed=True, commands=commands, sort=False)
+
+    def test_iosxr_bgp_replace_neighbors(self):
+        self.set_args(
+            "replace",
+            neighbors=[
+                dict(
+                    neighbor="192.0.2.10",
+                    remote_as=650011,
+                    description="peer ten",
+                )
+            ],
+        )
+        commands = ["router bgp 64496", "no neighbor 192.0.2.11", "exit"]
+        self.execute_module(changed=True, commands=commands, sort=False)
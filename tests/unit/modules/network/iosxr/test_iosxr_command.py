@@ -20,8 +20,14 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-from ansible_collections.cisco.iosxr.tests.unit.compat.mock import patch
+from ansible_collections.cisco.iosxr.tests.unit.compat.mock import (
+    patch,
+    MagicMock,
+)
 from ansible_collections.cisco.iosxr.plugins.modules import iosxr_command
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr import (
+    iosxr,
+)
 from ansible_collections.cisco.iosxr.tests.unit.modules.utils import (
     set_module_args,
 )
@@ -126,3 +132,59 @@ class TestIosxrCommandModule(TestIosxrModule):
             dict(commands=commands, wait_for=wait_for, match="all")
         )
         self.execute_module(failed=True)
+
+    def test_iosxr_command_retries_unsatisfied_only(self):
+        wait_for = [
+            'result[0] contains "Cisco IOS"',
+            'result[1] contains "test string"',
+        ]
+        commands = ["show version", "show version brief"]
+        set_module_args(dict(commands=commands, wait_for=wait_for, retries=3))
+        self.execute_module(failed=True)
+        self.assertEqual(
+            [call[0][1] for call in self.run_commands.call_args_list],
+            [commands, commands[1:], commands[1:]],
+        )
+
+    def test_iosxr_command_backoff(self):
+        wait_for = 'result[0] contains "test string"'
+        set_module_args(
+            dict(
+                commands=["show version"],
+                wait_for=wait_for,
+                retries=4,
+                interval=1,
+                backoff=2,
+            )
+        )
+        with patch(
+            "ansible_collections.cisco.iosxr.plugins.modules.iosxr_command.time.sleep"
+        ) as sleep:
+            self.execute_module(failed=True)
+        self.assertEqual(
+            [call[0][0] for call in sleep.call_args_list], [1, 2, 4, 8]
+        )
+
+    def test_iosxr_command_structured_xml_output(self):
+        output = (
+            '<?xml version="1.0"?>\n<Response MajorVersion="1">\n'
+            + "".join(
+                " <Interface><Name>Gi0/0/0/%d</Name></Interface>\n" % index
+                for index in range(5000)
+            )
+            + "</Response>"
+        )
+        commands = ["show version", {"command": "show interfaces | xml"}]
+        module = MagicMock()
+        with patch.object(iosxr, "get_connection") as get_connection:
+            get_connection.return_value.run_commands.return_value = [
+                "Cisco IOS XR Software",
+                output,
+            ]
+            responses = iosxr.run_commands(module, commands, structured=True)
+            self.assertEqual(iosxr.run_commands(module, commands)[1], output)
+
+        self.assertEqual(responses[0], "Cisco IOS XR Software")
+        self.assertEqual(responses[1].tag, "Response")
+        self.assertEqual(len(responses[1]), 5000)
+        self.assertEqual(responses[1][-1].findtext("Name"), "Gi0/0/0/4999")
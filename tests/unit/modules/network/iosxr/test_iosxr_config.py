@@ -21,12 +21,21 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import json
+import os
+import shutil
+import tempfile
+
 from ansible_collections.cisco.iosxr.tests.unit.compat.mock import (
     patch,
     MagicMock,
 )
 from ansible_collections.cisco.iosxr.plugins.modules import iosxr_config
+from ansible.errors import AnsibleConnectionFailure
 from ansible_collections.cisco.iosxr.plugins.cliconf.iosxr import Cliconf
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr import (
+    iosxr,
+)
 from ansible_collections.cisco.iosxr.tests.unit.modules.utils import (
     set_module_args,
 )
@@ -306,3 +315,185 @@ class TestIosxrConfigModule(TestIosxrModule):
         args = dict(replace="config")
         set_module_args(args)
         self.execute_module(failed=True)
+
+    def test_iosxr_config_cliconf_commit_diff(self):
+        commit_diff = (
+            "Building configuration...\n"
+            "!! IOS XR Configuration 7.0.2\n"
+            "+  hostname R1\n"
+            "-  hostname R2\n"
+            "#  interface GigabitEthernet0/0/0/0\n"
+            "+   description test\n"
+            "end"
+        )
+
+        def send(command, **kwargs):
+            if command == b"show commit changes diff":
+                return commit_diff
+            return ""
+
+        connection = MagicMock()
+        connection.get_prompt.return_value = b"RP/0/RP0/CPU0:ios#"
+        connection.send.side_effect = send
+        cliconf = Cliconf(connection)
+
+        resp = cliconf.edit_config(["hostname R1"])
+        self.assertNotIn("show_commit_config_diff", resp)
+        self.assertNotIn(
+            b"show commit changes diff",
+            [call[1]["command"] for call in connection.send.call_args_list],
+        )
+
+        resp = cliconf.edit_config(["hostname R1"], diff=True)
+        self.assertEqual(resp["show_commit_config_diff"], commit_diff)
+
+        resp = cliconf.edit_config(["hostname R1"], diff="summary")
+        self.assertNotIn("show_commit_config_diff", resp)
+        self.assertEqual(
+            resp["commit_diff_summary"], dict(added=2, removed=1, modified=1)
+        )
+
+    def test_iosxr_config_diff_summary(self):
+        src = load_fixture("iosxr_config_src.cfg")
+        set_module_args(dict(src=src, diff_summary=True))
+        self.conn.get_diff = MagicMock(
+            return_value=self.cliconf_obj.get_diff(src, self.running_config)
+        )
+        summary = dict(added=1, removed=0, modified=2)
+        self.mock_exec_command.side_effect = lambda *args, **kwargs: (
+            None,
+            summary,
+        )
+        result = self.execute_module(changed=True)
+        self.assertEqual(result["commit_diff_summary"], summary)
+        self.assertNotIn("diff", result)
+        self.assertTrue(self.mock_exec_command.call_args[1]["diff_summary"])
+
+    def test_iosxr_config_load_config_diff_summary(self):
+        commit_diff = "+  hostname R1\n-  hostname R2\n#  router static"
+        summary = dict(added=1, removed=1, modified=1)
+        module = MagicMock()
+        module._diff = False
+        with patch.object(iosxr, "get_connection") as get_connection, patch(
+            "ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr.is_netconf",
+            return_value=False,
+        ), patch(
+            "ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr.is_cliconf",
+            return_value=True,
+        ), patch.object(
+            iosxr,
+            "get_capabilities",
+            return_value={"device_operations": {"supports_commit_diff": True}},
+        ):
+            edit_config = get_connection.return_value.edit_config
+            edit_config.return_value = {"commit_diff_summary": summary}
+            self.assertEqual(
+                iosxr.load_config(module, ["hostname R1"], diff_summary=True),
+                (None, summary),
+            )
+            self.assertEqual(edit_config.call_args[1]["diff"], "summary")
+
+            # in diff mode the whole diff is fetched and counted here
+            module._diff = True
+            edit_config.return_value = {"show_commit_config_diff": commit_diff}
+            self.assertEqual(
+                iosxr.load_config(module, ["hostname R1"], diff_summary=True),
+                (commit_diff, summary),
+            )
+            self.assertIs(edit_config.call_args[1]["diff"], True)
+            self.assertEqual(
+                iosxr.load_config(module, ["hostname R1"]), commit_diff
+            )
+
+    def _progress_cliconf(self, send):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        connection = MagicMock()
+        connection.get_prompt.return_value = b"RP/0/RP0/CPU0:ios#"
+        connection.socket_path = os.path.join(directory, "socket")
+        connection.send.side_effect = send
+        cliconf = Cliconf(connection)
+        return cliconf, cliconf.progress_path()
+
+    def _progress_records(self, path):
+        with open(path) as f:
+            return [json.loads(line) for line in f]
+
+    def test_iosxr_config_cliconf_edit_progress(self):
+        cliconf, path = self._progress_cliconf(lambda command, **kwargs: "ok")
+        lines = ["hostname R%d" % index for index in range(5)]
+        with patch(
+            "ansible_collections.cisco.iosxr.plugins.cliconf.iosxr.PROGRESS_CHUNK_LINES",
+            2,
+        ):
+            resp = cliconf.edit_config(lines, progress=True)
+
+        self.assertEqual(
+            path,
+            os.path.join(
+                os.path.dirname(cliconf._connection.socket_path),
+                "iosxr_edit_config_socket.jsonl",
+            ),
+        )
+        self.assertEqual(list(resp), ["progress"])
+        self.assertEqual(resp["progress"]["path"], path)
+        self.assertEqual(resp["progress"]["total"], 5)
+        self.assertEqual(resp["progress"]["sent"], 5)
+        self.assertEqual(resp["progress"]["bytes"], 10)
+
+        records = self._progress_records(path)
+        self.assertEqual(
+            [record["event"] for record in records],
+            ["start", "chunk", "chunk", "done"],
+        )
+        self.assertEqual(
+            [record.get("sent") for record in records[1:]], [2, 4, 5]
+        )
+
+    def test_iosxr_config_cliconf_edit_progress_error(self):
+        def send(command, **kwargs):
+            if command == b"hostname R2":
+                raise AnsibleConnectionFailure("% Invalid input")
+            if command == b"hostname R3":
+                raise ValueError("unexpected")
+            return "ok"
+
+        cliconf, path = self._progress_cliconf(send)
+        with self.assertRaises(AnsibleConnectionFailure):
+            cliconf.edit_config(
+                ["hostname R0", "hostname R1", "hostname R2"], progress=True
+            )
+        records = self._progress_records(path)
+        self.assertEqual(
+            [record["event"] for record in records],
+            ["start", "error", "failed"],
+        )
+        self.assertEqual(records[1]["line"], 3)
+        self.assertEqual(records[1]["command"], "hostname R2")
+        self.assertEqual(records[2]["failed"]["line"], 3)
+
+        # any other error still ends the file with a failed record
+        with self.assertRaises(ValueError):
+            cliconf.edit_config(["hostname R0", "hostname R3"], progress=True)
+        records = self._progress_records(path)
+        self.assertEqual(
+            [record["event"] for record in records], ["start", "failed"]
+        )
+        self.assertEqual(records[1]["sent"], 1)
+
+    def test_iosxr_config_cliconf_run_commands_json(self):
+        connection = MagicMock()
+        cliconf = Cliconf(connection)
+        outputs = [
+            ("show version", "1"),
+            ("show interfaces brief | json", ' \n"text"'),
+            ("show platform | json", '{"nodes": []}'),
+            ("show platform | xml", "<Response/>"),
+            ("show ipv4 interface brief", "[1, 2]"),
+        ]
+        cliconf.send_command = lambda command, **kwargs: dict(outputs)[command]
+
+        self.assertEqual(
+            cliconf.run_commands([command for command, _out in outputs]),
+            ["1", "text", {"nodes": []}, "<Response/>", [1, 2]],
+        )
@@ -0,0 +1,155 @@
+# Copyright 2020 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.cisco.iosxr.tests.unit.compat.mock import patch
+from ansible_collections.cisco.iosxr.plugins.modules import iosxr_interface
+from ansible_collections.cisco.iosxr.tests.unit.modules.utils import (
+    set_module_args,
+)
+from .iosxr_module import TestIosxrModule, load_fixture
+
+# `show interfaces` only lists the interfaces that exist, a new one is
+# requested by name
+SHOW_NEW_INTERFACE = (
+    "GigabitEthernet0/0/0/5 is administratively down, "
+    "line protocol is administratively down\n"
+    "  5 minute input rate 2000 bits/sec, 2 packets/sec\n"
+    "  5 minute output rate 3000 bits/sec, 3 packets/sec\n"
+)
+
+
+class TestIosxrInterfaceModule(TestIosxrModule):
+
+    module = iosxr_interface
+
+    def setUp(self):
+        super(TestIosxrInterfaceModule, self).setUp()
+
+        self.mock_get_config = patch(
+            "ansible_collections.cisco.iosxr.plugins.modules.iosxr_interface.get_config"
+        )
+        self.get_config = self.mock_get_config.start()
+
+        self.mock_load_config = patch(
+            "ansible_collections.cisco.iosxr.plugins.modules.iosxr_interface.load_config"
+        )
+        self.load_config = self.mock_load_config.start()
+
+        self.mock_run_commands = patch(
+            "ansible_collections.cisco.iosxr.plugins.modules.iosxr_interface.run_commands"
+        )
+        self.run_commands = self.mock_run_commands.start()
+
+        self.mock_is_cliconf = patch(
+            "ansible_collections.cisco.iosxr.plugins.modules.iosxr_interface.is_cliconf"
+        )
+        self.is_cliconf = self.mock_is_cliconf.start()
+
+        self.mock_sleep = patch(
+            "ansible_collections.cisco.iosxr.plugins.modules.iosxr_interface.sleep"
+        )
+        self.sleep = self.mock_sleep.start()
+
+    def tearDown(self):
+        super(TestIosxrInterfaceModule, self).tearDown()
+
+        self.mock_get_config.stop()
+        self.mock_load_config.stop()
+        self.mock_run_commands.stop()
+        self.mock_is_cliconf.stop()
+        self.mock_sleep.stop()
+
+    def load_fixtures(self, commands=None):
+        def run_commands(module, commands):
+            if commands == "show interfaces":
+                return [load_fixture("show_interfaces")]
+            return [SHOW_NEW_INTERFACE for command in commands]
+
+        self.get_config.return_value = load_fixture(
+            "iosxr_interfaces_config.cfg"
+        )
+        self.load_config.return_value = None
+        self.run_commands.side_effect = run_commands
+        self.is_cliconf.return_value = True
+
+    def test_iosxr_interface_split_show_interfaces(self):
+        blocks = iosxr_interface.split_show_interfaces(
+            load_fixture("show_interfaces")
+        )
+        self.assertEqual(
+            sorted(blocks), ["GigabitEthernet0/0/0/0", "Loopback0"]
+        )
+        self.assertTrue(blocks["Loopback0"].startswith("Loopback0 is up"))
+        self.assertIn("Description: Loopback", blocks["Loopback0"])
+        self.assertNotIn("nxos01", blocks["Loopback0"])
+        self.assertTrue(
+            blocks["GigabitEthernet0/0/0/0"].startswith(
+                "GigabitEthernet0/0/0/0 is up"
+            )
+        )
+        self.assertIn(
+            "1 carrier transitions", blocks["GigabitEthernet0/0/0/0"]
+        )
+
+    def test_iosxr_interface_intent_missing_interface(self):
+        set_module_args(
+            dict(
+                aggregate=[
+                    dict(name="Loopback0", state="up"),
+                    dict(name="GigabitEthernet0/0/0/5", state="down"),
+                ]
+            )
+        )
+        self.execute_module(changed=True)
+        self.assertEqual(
+            [call[0][1] for call in self.run_commands.call_args_list],
+            ["show interfaces", ["show interfaces GigabitEthernet0/0/0/5"]],
+        )
+
+    def test_iosxr_interface_intent_failures(self):
+        set_module_args(
+            dict(
+                aggregate=[
+                    dict(name="Loopback0", state="down"),
+                    dict(
+                        name="GigabitEthernet0/0/0/0",
+                        state="up",
+                        tx_rate="gt(0)",
+                        rx_rate="ge(0)",
+                    ),
+                    dict(
+                        name="GigabitEthernet0/0/0/5",
+                        state="up",
+                        rx_rate="lt(1000)",
+                    ),
+                ]
+            )
+        )
+        result = self.execute_module(failed=True)
+        self.assertEqual(
+            result["failed_conditions"],
+            [
+                "state eq(down)",
+                "tx_rate gt(0)",
+                "state eq(up)",
+                "rx_rate lt(1000)",
+            ],
+        )
+
+    def test_iosxr_interface_intent_single_sleep(self):
+        set_module_args(
+            dict(
+                aggregate=[
+                    dict(name="Loopback0", state="up", delay=5),
+                    dict(name="GigabitEthernet0/0/0/0", state="up", delay=20),
+                    dict(name="GigabitEthernet0/0/0/5", state="down"),
+                ]
+            )
+        )
+        self.execute_module(changed=True)
+        self.sleep.assert_called_once_with(20)
@@ -0,0 +1,370 @@
+#
+# (c) 2019, Ansible by Red Hat, inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+
+from ansible_collections.cisco.iosxr.tests.unit.compat.mock import (
+    patch,
+    MagicMock,
+)
+from ansible_collections.cisco.iosxr.plugins.modules import iosxr_interfaces
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    get_interface_type,
+    normalize_interface,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.timing import (
+    NULL_TIMING,
+    get_timing,
+    start_timing,
+)
+from ansible_collections.cisco.iosxr.tests.unit.modules.utils import (
+    set_module_args,
+)
+from .iosxr_module import TestIosxrModule, load_fixture
+
+
+class TestIosxrInterfacesModule(TestIosxrModule):
+    module = iosxr_interfaces
+
+    def setUp(self):
+        super(TestIosxrInterfacesModule, self).setUp()
+
+        self.mock_get_resource_connection_config = patch(
+            "ansible_collections.ansible.netcommon.plugins.module_utils.network.common.cfg.base.get_resource_connection"
+        )
+        self.get_resource_connection_config = (
+            self.mock_get_resource_connection_config.start()
+        )
+
+        self.mock_get_resource_connection_facts = patch(
+            "ansible_collections.ansible.netcommon.plugins.module_utils.network.common.facts.facts.get_resource_connection"
+        )
+        self.get_resource_connection_facts = (
+            self.mock_get_resource_connection_facts.start()
+        )
+
+    def tearDown(self):
+        super(TestIosxrInterfacesModule, self).tearDown()
+        self.mock_get_resource_connection_config.stop()
+        self.mock_get_resource_connection_facts.stop()
+
+    def load_fixtures(self, commands=None):
+        def load_from_file(*args, **kwargs):
+            return load_fixture("iosxr_interfaces_config.cfg")
+
+        connection = self.get_resource_connection_facts.return_value
+        connection.get.side_effect = load_from_file
+
+    def test_iosxr_interfaces_merged(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="GigabitEthernet0/0/0/1",
+                        description="Merged by Ansible",
+                        mtu=1500,
+                        enabled=True,
+                    )
+                ],
+                state="merged",
+            )
+        )
+        commands = [
+            "interface GigabitEthernet0/0/0/1",
+            "description Merged by Ansible",
+            "mtu 1500",
+            "no shutdown",
+        ]
+        self.execute_module(changed=True, commands=commands, sort=False)
+
+    def test_iosxr_interfaces_merged_idempotent(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="GigabitEthernet0/0/0/2",
+                        description="Test description",
+                        mtu=2000,
+                        speed=100,
+                    )
+                ],
+                state="merged",
+            )
+        )
+        self.execute_module(changed=False, commands=[])
+
+    def test_iosxr_interfaces_replaced(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="GigabitEthernet0/0/0/2",
+                        description="Replaced by Ansible",
+                        enabled=True,
+                    )
+                ],
+                state="replaced",
+            )
+        )
+        commands = [
+            "interface GigabitEthernet0/0/0/2",
+            "no speed",
+            "no mtu",
+            "description Replaced by Ansible",
+        ]
+        self.execute_module(changed=True, commands=commands, sort=False)
+
+    def test_iosxr_interfaces_overridden(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="GigabitEthernet0/0/0/1",
+                        description="Overridden by Ansible",
+                        enabled=True,
+                    )
+                ],
+                state="overridden",
+            )
+        )
+        commands = [
+            "interface Loopback888",
+            "no description",
+            "no shutdown",
+            "interface GigabitEthernet0/0/0/0",
+            "no description",
+            "no duplex",
+            "no mtu",
+            "interface GigabitEthernet0/0/0/1",
+            "description Overridden by Ansible",
+            "no shutdown",
+            "interface GigabitEthernet0/0/0/2",
+            "no description",
+            "no speed",
+            "no mtu",
+        ]
+        self.execute_module(changed=True, commands=commands, sort=False)
+
+    def test_iosxr_interfaces_deleted(self):
+        set_module_args(
+            dict(config=[dict(name="GigabitEthernet0/0/0/0")], state="deleted")
+        )
+        commands = [
+            "interface GigabitEthernet0/0/0/0",
+            "no description",
+            "no duplex",
+            "no mtu",
+        ]
+        self.execute_module(changed=True, commands=commands, sort=False)
+
+    def test_iosxr_interfaces_rendered(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="GigabitEthernet0/0/0/0",
+                        description="Rendered by Ansible",
+                        mtu=110,
+                    ),
+                    dict(name="GigabitEthernet0/0/0/1", enabled=False),
+                ],
+                state="rendered",
+            )
+        )
+        commands = [
+            "interface GigabitEthernet0/0/0/0",
+            "description Rendered by Ansible",
+            "mtu 110",
+            "no shutdown",
+            "interface GigabitEthernet0/0/0/1",
+            "shutdown",
+        ]
+        result = self.execute_module(changed=False)
+        self.assertEqual(result["rendered"], commands)
+
+    def test_iosxr_interfaces_parsed(self):
+        set_module_args(
+            dict(
+                running_config=(
+                    "interface Bundle-Ether10\n description lag\n!\n"
+                    "interface TenGigE0/0/0/0\n mtu 9216\n!\n"
+                    "interface FourHundredGigE0/0/0/1\n shutdown\n!\n"
+                    "interface MgmtEth0/RP0/CPU0/0\n description mgmt\n!\n"
+                ),
+                state="parsed",
+            )
+        )
+        parsed = [
+            dict(name="Bundle-Ether10", description="lag", enabled=True),
+            dict(name="TenGigE0/0/0/0", mtu=9216, enabled=True),
+            dict(name="FourHundredGigE0/0/0/1", enabled=False),
+        ]
+        result = self.execute_module(changed=False)
+        self.assertEqual(result["parsed"], parsed)
+
+    def test_iosxr_interfaces_parsed_leading_keyword(self):
+        set_module_args(
+            dict(
+                running_config=(
+                    "interface GigabitEthernet0/0/0/2\n"
+                    " description uplink speed test\n"
+                    " ipv4 mtu 1400\n"
+                    " speed 1000\n"
+                    "!\n"
+                ),
+                state="parsed",
+            )
+        )
+        parsed = [
+            dict(
+                name="GigabitEthernet0/0/0/2",
+                description="uplink speed test",
+                speed=1000,
+                enabled=True,
+            )
+        ]
+        result = self.execute_module(changed=False)
+        self.assertEqual(result["parsed"], parsed)
+
+    def test_iosxr_interfaces_parsed_full_validation(self):
+        running_config = load_fixture("iosxr_interfaces_config.cfg")
+        set_module_args(dict(running_config=running_config, state="parsed"))
+        fast = self.execute_module(changed=False)["parsed"]
+
+        set_module_args(dict(running_config=running_config, state="parsed"))
+        with patch.dict(os.environ, {"ANSIBLE_IOSXR_VALIDATE_FACTS": "1"}):
+            full = self.execute_module(changed=False)["parsed"]
+        self.assertEqual(fast, full)
+        self.assertEqual(
+            fast[0],
+            dict(
+                name="Loopback888",
+                description="test for ansible",
+                enabled=False,
+            ),
+        )
+
+    def test_iosxr_interfaces_merged_timing(self):
+        connection = self.get_resource_connection_facts.return_value
+        connection.get_timing.return_value = {
+            "phases": {"load": 0.1, "commit": 0.2},
+            "commands": [],
+        }
+        self.get_resource_connection_config.side_effect = (
+            lambda module: module._connection
+        )
+        self.get_resource_connection_facts.side_effect = (
+            lambda module: module._connection
+        )
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="GigabitEthernet0/0/0/1",
+                        description="Merged by Ansible",
+                    )
+                ],
+                state="merged",
+            )
+        )
+        with patch(
+            "ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.timing.get_resource_connection",
+            return_value=connection,
+        ):
+            with patch.dict(os.environ, {"ANSIBLE_IOSXR_TIMING": "1"}):
+                result = self.execute_module(changed=True)
+
+        timing = result["timing"]
+        for phase in (
+            "fetch",
+            "parse",
+            "validate",
+            "diff",
+            "edit_config",
+            "post_facts",
+        ):
+            self.assertIn(phase, timing["phases"])
+        # every value is rounded to the microsecond on its own
+        self.assertLessEqual(
+            sum(timing["phases"].values()),
+            timing["total"] + 1e-6 * (len(timing["phases"]) + 1),
+        )
+        self.assertEqual(
+            [(cmd["command"], cmd["phase"]) for cmd in timing["commands"]],
+            [
+                ("show running-config interface", "fetch"),
+                ("edit_config", "edit_config"),
+                ("show running-config interface", "post_facts"),
+            ],
+        )
+        self.assertEqual(
+            timing["commands"][0]["bytes"],
+            len(load_fixture("iosxr_interfaces_config.cfg")),
+        )
+        self.assertEqual(
+            timing["commands"][1]["bytes"],
+            sum(len(cmd) for cmd in result["commands"]),
+        )
+        self.assertEqual(timing["cliconf"], connection.get_timing.return_value)
+        connection.start_timing.assert_called_once_with()
+
+    def test_iosxr_interfaces_failed_timing(self):
+        connection = MagicMock()
+        connection.get_timing.return_value = {"phases": {}, "commands": []}
+        module = MagicMock(params={"state": "merged"})
+        fail_json = module.fail_json
+        with patch(
+            "ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.timing.get_resource_connection",
+            return_value=connection,
+        ):
+            with patch.dict(os.environ, {"ANSIBLE_IOSXR_TIMING": "1"}):
+                timing = start_timing(module)
+        self.assertIs(get_timing(), timing)
+
+        # the cliconf timing is stopped when the module fails
+        module.fail_json("failed")
+        connection.get_timing.assert_called_once_with()
+        self.assertEqual(fail_json.call_args[1]["msg"], "failed")
+        self.assertEqual(
+            fail_json.call_args[1]["timing"]["cliconf"],
+            connection.get_timing.return_value,
+        )
+        self.assertIs(get_timing(), NULL_TIMING)
+
+        timing.finish({})
+        connection.get_timing.assert_called_once_with()
+
+    def test_iosxr_interfaces_rendered_no_timing(self):
+        set_module_args(
+            dict(
+                config=[dict(name="GigabitEthernet0/0/0/1", enabled=False)],
+                state="rendered",
+            )
+        )
+        result = self.execute_module(changed=False)
+        self.assertNotIn("timing", result)
+
+    def test_iosxr_interfaces_normalize_interface(self):
+        names = [
+            ("Gi0/0/0/0", "GigabitEthernet0/0/0/0", "GigabitEthernet"),
+            ("gig0/1", "GigabitEthernet0/1", "GigabitEthernet"),
+            ("Te0/0/0/1", "TenGigE0/0/0/1", "TenGigE"),
+            ("Fo0/0/0/1", "FortyGigE0/0/0/1", "FortyGigE"),
+            ("FourHundredGigE0/0", "FourHundredGigE0/0", "FourHundredGigE"),
+            ("BE1.100", "Bundle-Ether1.100", "Bundle-Ether"),
+            ("Se0/1", "Serial0/1", "Serial"),
+            ("nv1", "nve1", "nve"),
+            # other types starting with one of the abbreviations
+            ("ServiceInfra1", "ServiceInfra1", "unknown"),
+            ("ServiceApp1", "ServiceApp1", "unknown"),
+            ("nV-Loopback0", "nV-Loopback0", "unknown"),
+        ]
+        for name, normalized, if_type in names:
+            self.assertEqual(normalize_interface(name), normalized)
+            self.assertEqual(get_interface_type(name), if_type)
@@ -0,0 +1,136 @@
+#
+# (c) 2019, Ansible by Red Hat, inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.cisco.iosxr.tests.unit.compat.mock import patch
+from ansible_collections.cisco.iosxr.plugins.modules import iosxr_l3_interfaces
+from ansible_collections.cisco.iosxr.tests.unit.modules.utils import (
+    set_module_args,
+)
+from .iosxr_module import TestIosxrModule, load_fixture
+
+
+class TestIosxrL3InterfacesModule(TestIosxrModule):
+    module = iosxr_l3_interfaces
+
+    def setUp(self):
+        super(TestIosxrL3InterfacesModule, self).setUp()
+
+        self.mock_get_resource_connection_config = patch(
+            "ansible_collections.ansible.netcommon.plugins.module_utils.network.common.cfg.base.get_resource_connection"
+        )
+        self.get_resource_connection_config = (
+            self.mock_get_resource_connection_config.start()
+        )
+
+        self.mock_get_resource_connection_facts = patch(
+            "ansible_collections.ansible.netcommon.plugins.module_utils.network.common.facts.facts.get_resource_connection"
+        )
+        self.get_resource_connection_facts = (
+            self.mock_get_resource_connection_facts.start()
+        )
+
+    def tearDown(self):
+        super(TestIosxrL3InterfacesModule, self).tearDown()
+        self.mock_get_resource_connection_config.stop()
+        self.mock_get_resource_connection_facts.stop()
+
+    def load_fixtures(self, commands=None):
+        def load_from_file(*args, **kwargs):
+            return load_fixture("iosxr_l3_interfaces_config.cfg")
+
+        connection = self.get_resource_connection_facts.return_value
+        connection.get.side_effect = load_from_file
+
+    def test_iosxr_l3_interfaces_merged(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="GigabitEthernet0/0/0/2",
+                        ipv4=[dict(address="203.0.113.1/24")],
+                        ipv6=[dict(address="2001:db8:1::1/64")],
+                    )
+                ],
+                state="merged",
+            )
+        )
+        commands = [
+            "interface GigabitEthernet0/0/0/2",
+            "ipv4 address 203.0.113.1 255.255.255.0",
+            "ipv6 address 2001:db8:1::1/64",
+        ]
+        self.execute_module(changed=True, commands=commands, sort=False)
+
+    def test_iosxr_l3_interfaces_merged_idempotent(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="GigabitEthernet0/0/0/1",
+                        ipv4=[
+                            dict(address="192.0.2.1/24"),
+                            dict(address="192.0.2.2/24", secondary=True),
+                        ],
+                    )
+                ],
+                state="merged",
+            )
+        )
+        self.execute_module(changed=False, commands=[])
+
+    def test_iosxr_l3_interfaces_replaced(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="GigabitEthernet0/0/0/0",
+                        ipv4=[dict(address="198.51.100.1/24")],
+                    )
+                ],
+                state="replaced",
+            )
+        )
+        commands = ["interface GigabitEthernet0/0/0/0", "no ipv6 address"]
+        self.execute_module(changed=True, commands=commands, sort=False)
+
+    def test_iosxr_l3_interfaces_deleted(self):
+        set_module_args(dict(state="deleted"))
+        commands = [
+            "interface GigabitEthernet0/0/0/0",
+            "no ipv4 address",
+            "no ipv6 address",
+            "interface GigabitEthernet0/0/0/1",
+            "no ipv4 address",
+        ]
+        self.execute_module(changed=True, commands=commands, sort=False)
+
+    def test_iosxr_l3_interfaces_parsed(self):
+        set_module_args(
+            dict(
+                running_config=load_fixture("iosxr_l3_interfaces_config.cfg"),
+                state="parsed",
+            )
+        )
+        parsed = [
+            dict(name="Loopback888"),
+            dict(
+                name="GigabitEthernet0/0/0/0",
+                ipv4=[dict(address="198.51.100.1 255.255.255.0")],
+                ipv6=[dict(address="2001:db8::1/32")],
+            ),
+            dict(
+                name="GigabitEthernet0/0/0/1",
+                ipv4=[
+                    dict(address="192.0.2.1 255.255.255.0"),
+                    dict(address="192.0.2.2 255.255.255.0", secondary=True),
+                ],
+            ),
+        ]
+        result = self.execute_module(changed=False)
+        self.assertEqual(result["parsed"], parsed)
@@ -0,0 +1,124 @@
+#
+# (c) 2019, Ansible by Red Hat, inc
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.cisco.iosxr.tests.unit.compat.mock import patch
+from ansible_collections.cisco.iosxr.plugins.modules import (
+    iosxr_lag_interfaces,
+)
+from ansible_collections.cisco.iosxr.tests.unit.modules.utils import (
+    set_module_args,
+)
+from .iosxr_module import TestIosxrModule, load_fixture
+
+
+class TestIosxrLagInterfacesModule(TestIosxrModule):
+    module = iosxr_lag_interfaces
+
+    def setUp(self):
+        super(TestIosxrLagInterfacesModule, self).setUp()
+
+        self.mock_get_resource_connection_config = patch(
+            "ansible_collections.ansible.netcommon.plugins.module_utils.network.common.cfg.base.get_resource_connection"
+        )
+        self.get_resource_connection_config = (
+            self.mock_get_resource_connection_config.start()
+        )
+
+        self.mock_get_resource_connection_facts = patch(
+            "ansible_collections.ansible.netcommon.plugins.module_utils.network.common.facts.facts.get_resource_connection"
+        )
+        self.get_resource_connection_facts = (
+            self.mock_get_resource_connection_facts.start()
+        )
+
+    def tearDown(self):
+        super(TestIosxrLagInterfacesModule, self).tearDown()
+        self.mock_get_resource_connection_config.stop()
+        self.mock_get_resource_connection_facts.stop()
+
+    def load_fixtures(self, commands=None):
+        def load_from_file(*args, **kwargs):
+            return load_fixture("iosxr_lag_interfaces_config.cfg")
+
+        connection = self.get_resource_connection_facts.return_value
+        connection.get_config.side_effect = load_from_file
+
+    def test_iosxr_lag_interfaces_merged_idempotent(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="Bundle-Ether10",
+                        mode="active",
+                        members=[
+                            dict(
+                                member="GigabitEthernet0/0/0/1", mode="active"
+                            ),
+                            dict(
+                                member="GigabitEthernet0/0/0/3", mode="inherit"
+                            ),
+                        ],
+                    )
+                ],
+                state="merged",
+            )
+        )
+        self.execute_module(changed=False, commands=[])
+
+    def test_iosxr_lag_interfaces_merged(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        name="Bundle-Ether12",
+                        members=[
+                            dict(
+                                member="GigabitEthernet0/0/0/4", mode="active"
+                            )
+                        ],
+                    )
+                ],
+                state="merged",
+            )
+        )
+        commands = [
+            "interface GigabitEthernet0/0/0/4",
+            "bundle id 12 mode active",
+        ]
+        self.execute_module(changed=True, commands=commands, sort=False)
+
+    def test_iosxr_lag_interfaces_parsed(self):
+        set_module_args(
+            dict(
+                running_config=load_fixture("iosxr_lag_interfaces_config.cfg"),
+                state="parsed",
+            )
+        )
+        parsed = [
+            dict(
+                name="Bundle-Ether10",
+                mode="active",
+                links=dict(max_active=8, min_active=2),
+                members=[
+                    dict(member="GigabitEthernet0/0/0/1", mode="active"),
+                    dict(member="GigabitEthernet0/0/0/3", mode="inherit"),
+                ],
+            ),
+            dict(
+                name="Bundle-Ether11",
+                load_balancing_hash="dst-ip",
+                members=[
+                    dict(member="GigabitEthernet0/0/0/2", mode="passive"),
+                    dict(member="GigabitEthernet0/0/0/9", mode="on"),
+                ],
+            ),
+            dict(name="Bundle-Ether12"),
+        ]
+        result = self.execute_module(changed=False)
+        self.assertEqual(result["parsed"], parsed)
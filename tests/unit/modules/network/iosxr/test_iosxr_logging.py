@@ -0,0 +1,118 @@
+# Copyright 2020 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.cisco.iosxr.tests.unit.compat.mock import patch
+from ansible_collections.cisco.iosxr.plugins.modules import iosxr_logging
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr import (
+    merge_xml_configs,
+)
+from ansible_collections.cisco.iosxr.tests.unit.modules.utils import (
+    set_module_args,
+)
+from .iosxr_module import TestIosxrModule, load_fixture
+
+
+class TestIosxrLoggingModule(TestIosxrModule):
+
+    module = iosxr_logging
+
+    def setUp(self):
+        super(TestIosxrLoggingModule, self).setUp()
+
+        self.mock_get_config = patch(
+            "ansible_collections.cisco.iosxr.plugins.modules.iosxr_logging.get_config"
+        )
+        self.get_config = self.mock_get_config.start()
+
+        self.mock_load_config = patch(
+            "ansible_collections.cisco.iosxr.plugins.modules.iosxr_logging.load_config"
+        )
+        self.load_config = self.mock_load_config.start()
+
+        self.mock_is_cliconf = patch(
+            "ansible_collections.cisco.iosxr.plugins.modules.iosxr_logging.is_cliconf"
+        )
+        self.is_cliconf = self.mock_is_cliconf.start()
+
+        self.mock_is_netconf = patch(
+            "ansible_collections.cisco.iosxr.plugins.modules.iosxr_logging.is_netconf"
+        )
+        self.is_netconf = self.mock_is_netconf.start()
+
+    def tearDown(self):
+        super(TestIosxrLoggingModule, self).tearDown()
+
+        self.mock_get_config.stop()
+        self.mock_load_config.stop()
+        self.mock_is_cliconf.stop()
+        self.mock_is_netconf.stop()
+
+    def load_fixtures(self, commands=None):
+        self.get_config.return_value = load_fixture("iosxr_logging_config.cfg")
+        self.load_config.return_value = None
+        self.is_cliconf.return_value = True
+
+    def test_iosxr_logging_idempotent(self):
+        set_module_args(
+            dict(
+                aggregate=[
+                    dict(dest="host", name="192.0.2.10"),
+                    dict(dest="host", name="192.0.2.11", vrf="mgmt"),
+                    dict(dest="file", name="syslog"),
+                    dict(dest="console", level="critical"),
+                    dict(dest="buffered", size=307200),
+                    dict(hostnameprefix="vrfhost"),
+                ]
+            )
+        )
+        self.execute_module(changed=False, commands=[])
+
+    def test_iosxr_logging_host_vrf(self):
+        set_module_args(dict(dest="host", name="192.0.2.11"))
+        commands = ["logging 192.0.2.11 vrf default severity debugging"]
+        self.execute_module(changed=True, commands=commands)
+
+    def test_iosxr_logging_absent(self):
+        set_module_args(
+            dict(
+                aggregate=[
+                    dict(dest="host", name="192.0.2.10"),
+                    dict(dest="host", name="192.0.2.11"),
+                    dict(dest="file", name="syslog"),
+                    dict(dest="buffered", size=307200),
+                ],
+                state="absent",
+            )
+        )
+        commands = [
+            "no logging 192.0.2.10 vrf default",
+            "no logging file syslog",
+            "no logging buffered",
+        ]
+        self.execute_module(changed=True, commands=commands)
+
+    def test_iosxr_logging_netconf_merge_hosts(self):
+        self.is_cliconf.side_effect = lambda module: False
+        self.is_netconf.side_effect = lambda module: True
+        self.get_config.side_effect = lambda *args, **kwargs: "<data/>"
+        set_module_args(
+            dict(
+                aggregate=[
+                    dict(dest="host", name="192.0.2.10"),
+                    dict(dest="host", name="192.0.2.11"),
+                    dict(dest="buffered", size=307200),
+                ]
+            )
+        )
+        self.load_config.side_effect = lambda *args, **kwargs: "diff"
+        result = self.execute_module(changed=True)
+        merged = merge_xml_configs(result["xml"])
+        self.assertEqual(merged.count("<ipv4 "), 2)
+        self.assertIn("<address>192.0.2.10</address>", merged)
+        self.assertIn("<address>192.0.2.11</address>", merged)
+        self.assertIn("<buffer-size>307200</buffer-size>", merged)
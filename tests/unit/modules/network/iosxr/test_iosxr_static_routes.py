@@ -7,8 +7,20 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import os
+
 from ansible_collections.cisco.iosxr.tests.unit.compat.mock import patch
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
+    utils as common_utils,
+)
 from ansible_collections.cisco.iosxr.plugins.modules import iosxr_static_routes
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.argspec.static_routes.static_routes import (
+    Static_routesArgs,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.utils.utils import (
+    VALIDATE_FACTS_ENV,
+    validate_config,
+)
 from ansible_collections.cisco.iosxr.tests.unit.modules.utils import (
     set_module_args,
 )
@@ -312,6 +324,96 @@ class TestIosxrStaticRoutesModule(TestIosxrModule):
         ]
         self.execute_module(changed=True, commands=commands)
 
+    def test_iosxr_static_routes_overridden_vrf_routes(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        vrf="DEV_SITE",
+                        address_families=[
+                            dict(
+                                afi="ipv4",
+                                safi="unicast",
+                                routes=[
+                                    dict(
+                                        dest="192.0.2.48/28",
+                                        next_hops=[
+                                            dict(
+                                                forward_router_address="192.0.2.12",
+                                                description="DEV",
+                                                dest_vrf="test_1",
+                                            )
+                                        ],
+                                    )
+                                ],
+                            )
+                        ],
+                    )
+                ],
+                state="overridden",
+            )
+        )
+        commands = [
+            "router static",
+            "no address-family ipv4 unicast",
+            "no address-family ipv6 unicast",
+            "vrf DEV_SITE",
+            "address-family ipv4 unicast",
+            "no 192.0.2.80/28",
+        ]
+        self.execute_module(changed=True, commands=commands, sort=False)
+
+    def test_iosxr_static_routes_merged_vrf_multiple_afs(self):
+        set_module_args(
+            dict(
+                config=[
+                    dict(
+                        vrf="DEV_SITE",
+                        address_families=[
+                            dict(
+                                afi="ipv4",
+                                safi="multicast",
+                                routes=[
+                                    dict(
+                                        dest="192.0.2.96/28",
+                                        next_hops=[
+                                            dict(
+                                                forward_router_address="192.0.2.15"
+                                            )
+                                        ],
+                                    )
+                                ],
+                            ),
+                            dict(
+                                afi="ipv4",
+                                safi="unicast",
+                                routes=[
+                                    dict(
+                                        dest="192.0.2.48/28",
+                                        next_hops=[
+                                            dict(
+                                                forward_router_address="192.0.2.12",
+                                                description="DEV",
+                                                dest_vrf="test_1",
+                                            )
+                                        ],
+                                    )
+                                ],
+                            ),
+                        ],
+                    )
+                ],
+                state="merged",
+            )
+        )
+        commands = [
+            "router static",
+            "vrf DEV_SITE",
+            "address-family ipv4 multicast",
+            "192.0.2.96/28 192.0.2.15",
+        ]
+        self.execute_module(changed=True, commands=commands, sort=False)
+
     def test_iosxr_static_routes_deleted_afi(self):
         set_module_args(
             dict(
@@ -336,3 +438,54 @@ class TestIosxrStaticRoutesModule(TestIosxrModule):
 
         commands = ["no router static"]
         self.execute_module(changed=True, commands=commands)
+
+    def test_iosxr_static_routes_validate_config(self):
+        spec = Static_routesArgs.argument_spec
+        data = {
+            "config": [
+                {
+                    "vrf": None,
+                    "address_families": [
+                        {
+                            "afi": "ipv4",
+                            "safi": "unicast",
+                            "routes": [
+                                {
+                                    "dest": "192.0.2.0/24",
+                                    "next_hops": [
+                                        {
+                                            "forward_router_address": "192.0.2.1",
+                                            "admin_distance": "10",
+                                            "tag": 20,
+                                            "description": None,
+                                        },
+                                        {"interface": "Loopback0"},
+                                    ],
+                                }
+                            ],
+                        }
+                    ],
+                }
+            ]
+        }
+        full = common_utils.validate_config(spec, data)
+        with patch.object(
+            common_utils, "validate_config", wraps=common_utils.validate_config
+        ) as validate:
+            with patch.dict(os.environ, {VALIDATE_FACTS_ENV: "no"}):
+                fast = validate_config(spec, data)
+            validate.assert_not_called()
+            with patch.dict(os.environ, {VALIDATE_FACTS_ENV: "yes"}):
+                forced = validate_config(spec, data)
+            validate.assert_called_once_with(spec, data)
+
+        self.assertEqual(fast, full)
+        self.assertEqual(forced, full)
+        next_hops = fast["config"][0]["address_families"][0]["routes"][0][
+            "next_hops"
+        ]
+        self.assertEqual(next_hops[0]["admin_distance"], 10)
+        self.assertIsNone(next_hops[0]["description"])
+        self.assertIsNone(next_hops[1]["admin_distance"])
+        self.assertEqual(fast["state"], "merged")
+        self.assertIsNone(fast["running_config"])
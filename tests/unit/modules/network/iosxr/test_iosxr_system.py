@@ -121,3 +121,38 @@ class TestIosxrSystemModule(TestIosxrModule):
             )
         )
         self.execute_module()
+
+    def test_iosxr_system_netconf_single_get(self):
+        self.is_cliconf.return_value = False
+        self.get_config.return_value = (
+            "<data><host-names><host-name>iosxr01</host-name></host-names>"
+            "<ip-domain><vrfs><vrf><vrf-name>default</vrf-name>"
+            "<name>eng.ansible.com</name>"
+            "<lists><list><order>0</order><list-name>redhat.com</list-name>"
+            "</list></lists><servers><server><order>0</order>"
+            "<server-address>8.8.8.8</server-address></server></servers>"
+            "<lookup><disable/></lookup></vrf></vrfs>"
+            "<ipv4-hosts><ipv4-host><host-name>peer</host-name>"
+            "</ipv4-host></ipv4-hosts></ip-domain></data>"
+        )
+        set_module_args(
+            dict(
+                hostname="iosxr01",
+                domain_name="eng.ansible.com",
+                domain_search=["redhat.com"],
+                name_servers=["8.8.8.8"],
+                lookup_enabled=False,
+            )
+        )
+        with patch(
+            "ansible_collections.cisco.iosxr.plugins.modules.iosxr_system.is_netconf",
+            return_value=True,
+        ):
+            result = self.changed(changed=False)
+
+        self.assertEqual(result["xml"], [])
+        self.assertEqual(self.get_config.call_count, 1)
+        config_filter = self.get_config.call_args[1]["config_filter"]
+        self.assertIn("<ip-domain", config_filter)
+        self.assertIn("<host-names", config_filter)
+        self.load_config.assert_not_called()
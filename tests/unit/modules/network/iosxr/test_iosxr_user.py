@@ -20,8 +20,17 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
-from ansible_collections.cisco.iosxr.tests.unit.compat.mock import patch
+from ansible_collections.cisco.iosxr.tests.unit.compat.mock import (
+    MagicMock,
+    patch,
+)
 from ansible_collections.cisco.iosxr.plugins.modules import iosxr_user
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr import (
+    iosxr,
+)
+from ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr import (
+    merge_xml_configs,
+)
 from ansible_collections.cisco.iosxr.tests.unit.modules.utils import (
     set_module_args,
 )
@@ -127,3 +136,147 @@ class TestIosxrUserModule(TestIosxrModule):
             result["commands"],
             ["username ansible-2", "username ansible-2 secret test-2"],
         )
+
+    def test_iosxr_user_public_key_aggregate(self):
+        set_module_args(
+            dict(
+                aggregate=[dict(name="ansible"), dict(name="ansible-2")],
+                public_key_contents="ssh-rsa YW5zaWJsZQ== netop@host",
+                provider=dict(host="198.51.100.1", username="netop"),
+            )
+        )
+        with patch(
+            "ansible_collections.cisco.iosxr.plugins.modules.iosxr_user.paramiko"
+        ) as paramiko:
+            ssh = paramiko.SSHClient.return_value
+            ssh.exec_command.return_value = (
+                MagicMock(),
+                MagicMock(**{"read.return_value": b"Done"}),
+                MagicMock(),
+            )
+            self.execute_module(changed=True)
+
+        paramiko.SSHClient.assert_called_once_with()
+        ssh.connect.assert_called_once_with(
+            "198.51.100.1", username="netop", password=None
+        )
+        sftp = ssh.open_sftp.return_value
+        self.assertEqual(sftp.putfo.call_count, 1)
+        keyfile, dst = sftp.putfo.call_args[0]
+        self.assertEqual(keyfile.getvalue(), b"ansible")
+        self.assertEqual(dst, "/harddisk:/publickey_aggregate.b64")
+        self.assertEqual(
+            [call[0][0] for call in ssh.exec_command.call_args_list],
+            [
+                "admin crypto key import authentication rsa username %s"
+                " harddisk:/publickey_aggregate.b64 \r" % user
+                for user in ("ansible", "ansible-2")
+            ],
+        )
+        ssh.close.assert_called_once_with()
+
+    def test_iosxr_user_purge_secret_with_separator(self):
+        self.get_config.side_effect = lambda *args, **kwargs: (
+            "username admin\n"
+            " group sysadmin\n"
+            " secret 5 $1$mdQI!xjg$3t3lzBpfKf!TKvFm1uEIY.\n"
+            "!\n"
+            "username ansible\n"
+            " group sysadmin\n"
+            " secret 5 $1$3yWS!iIi$VdzV59ChiurrNdGxlDeAW/\n"
+            "!\n"
+            "username netop\n"
+            " group root-lr\n"
+            "!\n"
+        )
+        set_module_args(
+            dict(
+                aggregate=[dict(name="ansible", group="sysadmin")], purge=True
+            )
+        )
+        result = self.execute_module(changed=True)
+        self.assertEqual(result["commands"], ["no username netop"])
+
+    def test_iosxr_user_netconf_merge_edits(self):
+        user = (
+            '<config xmlns:xc="urn:ietf:params:xml:ns:netconf:base:1.0">'
+            '<aaa xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-aaa-lib-cfg">'
+            '<usernames xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-aaa-locald-cfg">'
+            '<username xc:operation="%s"><name>%s</name>%s</username>'
+            "</usernames></aaa></config>"
+        )
+        group = (
+            "<usergroup-under-usernames><usergroup-under-username>"
+            "<name>%s</name>"
+            "</usergroup-under-username></usergroup-under-usernames>"
+        )
+        merged = merge_xml_configs(
+            [
+                user % ("merge", "ansible", "<secret>test</secret>"),
+                user % ("merge", "ansible", group % "sysadmin"),
+                user % ("merge", "ansible", group % "root-lr"),
+                user % ("delete", "netop", ""),
+            ]
+        )
+        ansible = user % (
+            "merge",
+            "ansible",
+            "<secret>test</secret>" + group % "sysadmin" + group % "root-lr",
+        )
+        netop = '<username xc:operation="delete"><name>netop</name></username>'
+        self.assertEqual(
+            merged,
+            ansible.replace(
+                "</usergroup-under-usernames><usergroup-under-usernames>", ""
+            ).replace("</username>", "</username>" + netop),
+        )
+
+        with self.assertRaises(ValueError):
+            merge_xml_configs(
+                [
+                    user % ("merge", "ansible", ""),
+                    user % ("delete", "ansible", ""),
+                ]
+            )
+
+        # the same keyed entry with another value of one of its leaves
+        with self.assertRaises(ValueError):
+            merge_xml_configs(
+                [
+                    user % ("merge", "bob", "<secret>A</secret>"),
+                    user % ("merge", "bob", "<secret>B</secret>"),
+                ]
+            )
+
+    def test_iosxr_user_netconf_load_config_conflicting_edits(self):
+        user = (
+            '<config xmlns:xc="urn:ietf:params:xml:ns:netconf:base:1.0">'
+            '<aaa xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-aaa-lib-cfg">'
+            '<usernames xmlns="http://cisco.com/ns/yang/Cisco-IOS-XR-aaa-locald-cfg">'
+            '<username xc:operation="merge"><name>%s</name>'
+            "<secret>%s</secret></username>"
+            "</usernames></aaa></config>"
+        )
+        module = MagicMock()
+        with patch.object(iosxr, "get_connection") as get_connection, patch(
+            "ansible_collections.cisco.iosxr.plugins.module_utils.network.iosxr.iosxr.is_netconf",
+            return_value=True,
+        ), patch.object(iosxr, "get_config"), patch.object(
+            iosxr, "get_config_diff", return_value=None
+        ), patch.object(
+            iosxr, "discard_config"
+        ):
+            conflicting = [user % ("bob", "A"), user % ("bob", "B")]
+            iosxr.load_config(module, conflicting)
+            edits = get_connection.return_value.edit_config.call_args_list
+            self.assertEqual(
+                [edit[1]["config"] for edit in edits], conflicting
+            )
+
+            get_connection.return_value.edit_config.reset_mock()
+            iosxr.load_config(
+                module, [user % ("bob", "A"), user % ("al", "B")]
+            )
+            edits = get_connection.return_value.edit_config.call_args_list
+            self.assertEqual(len(edits), 1)
+            self.assertEqual(edits[0][1]["config"].count("<username "), 2)
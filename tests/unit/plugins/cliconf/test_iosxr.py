@@ -0,0 +1,40 @@
+# Copyright 2020 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+
+from ansible_collections.cisco.iosxr.tests.unit.compat import unittest
+from ansible_collections.cisco.iosxr.tests.unit.compat.mock import MagicMock
+from ansible_collections.cisco.iosxr.plugins.cliconf.iosxr import Cliconf
+
+
+class TestIosxrCliconf(unittest.TestCase):
+    def test_get_capabilities_cache(self):
+        connection = MagicMock()
+        connection.get_prompt.return_value = b"RP/0/RP0/CPU0:ios#"
+        connection.send.return_value = (
+            "Cisco IOS XR Software, Version 7.0.2\nios uptime is 1 day"
+        )
+        cliconf = Cliconf(connection)
+
+        capabilities = cliconf.get_capabilities()
+        self.assertEqual(
+            json.loads(capabilities)["device_info"]["network_os_hostname"],
+            "ios",
+        )
+        self.assertEqual(cliconf.get_capabilities(), capabilities)
+        self.assertEqual(connection.send.call_count, 1)
+
+        # a new session
+        connection._ssh_shell = MagicMock()
+        cliconf.get_capabilities()
+        self.assertEqual(connection.send.call_count, 2)
+
+        cliconf.commit()
+        cliconf.get_capabilities()
+        self.assertEqual(connection.send.call_count, 4)
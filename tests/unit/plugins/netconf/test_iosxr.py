@@ -0,0 +1,55 @@
+# Copyright 2020 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+
+from ansible_collections.cisco.iosxr.tests.unit.compat import unittest
+from ansible_collections.cisco.iosxr.tests.unit.compat.mock import (
+    patch,
+    MagicMock,
+)
+from ansible_collections.cisco.iosxr.plugins.netconf.iosxr import Netconf
+
+
+class TestIosxrNetconf(unittest.TestCase):
+    def setUp(self):
+        self.connection = MagicMock()
+        self.connection.manager.session_id = "1"
+        self.connection.manager.server_capabilities = [
+            "urn:ietf:params:netconf:base:1.1",
+            "urn:ietf:params:netconf:capability:candidate:1.0",
+        ]
+        self.connection.manager.client_capabilities = [
+            "urn:ietf:params:netconf:base:1.1"
+        ]
+        self.netconf = Netconf(self.connection)
+
+        self.mock_get_device_info = patch.object(
+            Netconf, "get_device_info", return_value={"network_os": "iosxr"}
+        )
+        self.get_device_info = self.mock_get_device_info.start()
+
+    def tearDown(self):
+        self.mock_get_device_info.stop()
+
+    def test_get_capabilities_cache(self):
+        capabilities = self.netconf.get_capabilities()
+        self.assertEqual(json.loads(capabilities)["session_id"], "1")
+        self.assertEqual(self.netconf.get_capabilities(), capabilities)
+        self.assertEqual(self.get_device_info.call_count, 1)
+
+        # a new session
+        self.connection.manager.session_id = "2"
+        capabilities = self.netconf.get_capabilities()
+        self.assertEqual(json.loads(capabilities)["session_id"], "2")
+        self.assertEqual(self.get_device_info.call_count, 2)
+
+        self.netconf.commit()
+        self.connection.manager.commit.assert_called_once()
+        self.assertEqual(self.netconf.get_capabilities(), capabilities)
+        self.assertEqual(self.get_device_info.call_count, 3)
@@ -0,0 +1,51 @@
+# Copyright 2020 Red Hat
+# GNU General Public License v3.0+
+# (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.cisco.iosxr.tests.unit.compat import unittest
+from ansible_collections.cisco.iosxr.tests.unit.compat.mock import MagicMock
+from ansible_collections.cisco.iosxr.plugins.terminal.iosxr import (
+    TerminalModule,
+)
+
+
+class TestIosxrTerminal(unittest.TestCase):
+    def test_terminal_stderr_re(self):
+        matcher = TerminalModule(MagicMock()).terminal_stderr_re[0]
+        errors = [
+            b"% Invalid input detected at '^' marker.",
+            b"%Error: configuration failed",
+            b"% Incomplete command.",
+            b"Connection timed out; remote host not responding",
+            b"show foo\r\nFile 'disk0:foo' not found",
+            b"'x' returned error code: 2",
+            b"% Failed to commit one or more configuration items",
+        ]
+        for error in errors:
+            self.assertTrue(matcher.search(b"router#" + error), error)
+
+        clean = [
+            b"interface GigabitEthernet0/0/0/0\r\n description uplink",
+            b"(connection timed out)",
+            b" not found",
+        ]
+        for output in clean:
+            self.assertFalse(matcher.search(output), output)
+
+        # the response grows with every read, an error arriving in a
+        # later read is found even when the line started in an earlier one
+        response = b"show running-config\r\nfoo"
+        self.assertFalse(matcher.search(response))
+        response += b" not found\r\nRP/0/RP0/CPU0:router#"
+        self.assertTrue(matcher.search(response))
+        self.assertTrue(matcher.search(response))
+
+    def test_terminal_stderr_re_per_connection(self):
+        first = TerminalModule(MagicMock()).terminal_stderr_re
+        second = TerminalModule(MagicMock()).terminal_stderr_re
+        self.assertEqual(len(first), 1)
+        self.assertIsNot(first[0], second[0])